@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+데이터베이스 연결 방식 벤치마크 스크립트
+요청마다 connect/close 하는 방식과 스레드별 연결 재사용 방식을 비교합니다.
+(get_current_user → get_user_by_id 조회를 동시 요청으로 흉내냄)
+"""
+import os
+import sys
+import time
+import shutil
+import sqlite3
+import argparse
+import tempfile
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from database import Database
+
+
+def per_call_get_user_by_id(db_path: str, user_id: int):
+    """기존 방식: 호출마다 연결 생성 후 종료"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT id, username, email, newsletter_subscribed
+        FROM users WHERE id = ?
+    ''', (user_id,))
+    row = cursor.fetchone()
+    conn.close()
+    return row
+
+
+def run_load(lookup: Callable[[int], object], user_count: int,
+             requests_per_worker: int, workers: int) -> Dict:
+    """동시 요청 부하를 주고 지연 시간 통계 반환"""
+    def worker(worker_id: int) -> List[float]:
+        latencies = []
+        for i in range(requests_per_worker):
+            user_id = (worker_id * requests_per_worker + i) % user_count + 1
+            start = time.perf_counter()
+            lookup(user_id)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(worker, range(workers)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(l for worker_latencies in results for l in worker_latencies)
+    total = len(latencies)
+    return {
+        'total': total,
+        'elapsed': elapsed,
+        'throughput': total / elapsed if elapsed else 0.0,
+        'mean_ms': statistics.mean(latencies) * 1000,
+        'p50_ms': latencies[total // 2] * 1000,
+        'p99_ms': latencies[min(total - 1, int(total * 0.99))] * 1000,
+    }
+
+
+def print_result(label: str, result: Dict):
+    print(f"[{label}] {result['total']}건 / {result['elapsed']:.2f}초 "
+          f"→ {result['throughput']:.0f} req/s, "
+          f"평균 {result['mean_ms']:.3f}ms, p50 {result['p50_ms']:.3f}ms, p99 {result['p99_ms']:.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DB 연결 방식 벤치마크')
+    parser.add_argument('--users', type=int, default=1000, help='생성할 사용자 수')
+    parser.add_argument('--requests', type=int, default=2000, help='작업자당 요청 수')
+    parser.add_argument('--workers', type=int, default=8, help='동시 작업자 수')
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix='slang_bench_')
+    db_path = os.path.join(temp_dir, 'bench.db')
+    try:
+        db = Database(db_path)
+        conn = db._get_connection()
+        with conn:
+            conn.executemany(
+                'INSERT INTO users (username, password, email) VALUES (?, ?, ?)',
+                [(f'user{i}', 'x', f'user{i}@example.com') for i in range(args.users)]
+            )
+
+        print(f"[벤치마크] 사용자 {args.users}명, 작업자 {args.workers}개 x 요청 {args.requests}건")
+        per_call = run_load(lambda uid: per_call_get_user_by_id(db_path, uid),
+                            args.users, args.requests, args.workers)
+        print_result('요청마다 연결', per_call)
+
+        pooled = run_load(db.get_user_by_id, args.users, args.requests, args.workers)
+        print_result('스레드별 연결 재사용', pooled)
+
+        if pooled['mean_ms'] > 0:
+            print(f"[벤치마크] 평균 지연 {per_call['mean_ms'] / pooled['mean_ms']:.1f}배 개선")
+        db.close()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(line_buffering=True) if hasattr(sys.stdout, 'reconfigure') else None
+    main()
@@ -0,0 +1,290 @@
+"""
+SQLite(WAL) 기반 통합 캐시 저장소
+의미 캐시, 네이버 사전 캐시, 욕설 판별 캐시 등을 네임스페이스별로 저장합니다.
+"""
+import os
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+class CacheStore:
+    """네임스페이스 단위 키-값 캐시 (프로세스/스레드 간 안전)
+
+    - 네임스페이스별 포인트 조회 / 배치 업서트 / 삭제
+    - 항목별 만료 시간(TTL)과 출처(source) 기록
+    - 기존 JSON 캐시 파일을 한 번만 가져오는 임포터
+    """
+
+    def __init__(self, db_path: str = None):
+        if db_path is None:
+            data_dir = os.path.join(current_dir, 'data')
+            os.makedirs(data_dir, exist_ok=True)
+            self.db_path = os.path.join(data_dir, 'cache.db')
+        else:
+            self.db_path = db_path
+        self._local = threading.local()
+        self.init_store()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """스레드별 연결 재사용 (WAL 모드)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    def init_store(self):
+        """캐시 테이블 초기화"""
+        conn = self._get_connection()
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT,
+                    source TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    expires_at REAL,
+                    PRIMARY KEY (namespace, key)
+                ) WITHOUT ROWID
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cache_entries_expires
+                ON cache_entries(expires_at) WHERE expires_at IS NOT NULL
+            ''')
+            # 일회성 가져오기 기록
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS cache_imports (
+                    name TEXT PRIMARY KEY,
+                    imported_at REAL NOT NULL,
+                    entry_count INTEGER
+                )
+            ''')
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """단일 키 조회 (만료 항목은 없는 것으로 처리)"""
+        row = self._get_connection().execute('''
+            SELECT value FROM cache_entries
+            WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)
+        ''', (namespace, key, time.time())).fetchone()
+        if row is None:
+            return default
+        return json.loads(row[0])
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키를 한 번에 조회"""
+        keys = list(keys)
+        results = {}
+        conn = self._get_connection()
+        now = time.time()
+        # SQLite 변수 개수 제한을 피하기 위해 나눠서 조회
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = conn.execute(f'''
+                SELECT key, value FROM cache_entries
+                WHERE namespace = ? AND key IN ({placeholders})
+                  AND (expires_at IS NULL OR expires_at > ?)
+            ''', (namespace, *chunk, now)).fetchall()
+            for key, value in rows:
+                results[key] = json.loads(value)
+        return results
+
+    def items(self, namespace: str) -> Dict[str, Any]:
+        """네임스페이스 전체 조회"""
+        rows = self._get_connection().execute('''
+            SELECT key, value FROM cache_entries
+            WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?)
+        ''', (namespace, time.time())).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None,
+            source: Optional[str] = None):
+        """단일 키 저장"""
+        self.set_many(namespace, {key: value}, ttl=ttl, source=source)
+
+    def set_many(self, namespace: str, entries: Dict[str, Any], ttl: Optional[float] = None,
+                 source: Optional[str] = None) -> int:
+        """여러 키를 한 트랜잭션으로 업서트 (변경된 키만 기록)"""
+        if not entries:
+            return 0
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        rows = [
+            (namespace, str(key), json.dumps(value, ensure_ascii=False), source, now, now, expires_at)
+            for key, value in entries.items()
+        ]
+        conn = self._get_connection()
+        with conn:
+            conn.executemany('''
+                INSERT INTO cache_entries (namespace, key, value, source, created_at, updated_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(namespace, key) DO UPDATE SET
+                    value = excluded.value,
+                    source = excluded.source,
+                    updated_at = excluded.updated_at,
+                    expires_at = excluded.expires_at
+            ''', rows)
+        return len(rows)
+
+    def increment(self, namespace: str, key: str, amount: int = 1, limit: Optional[int] = None,
+                  ttl: Optional[float] = None) -> Optional[int]:
+        """정수 값을 원자적으로 증가 (여러 프로세스가 동시에 더해도 합이 유지됨)
+
+        limit이 주어지면 증가 후 값이 limit 이하일 때만 반영하고, 넘으면 None을 반환합니다.
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        conn = self._get_connection()
+        with conn:
+            # 쓰기 잠금을 먼저 잡아 읽기-증가-쓰기 사이에 다른 프로세스가 끼어들지 못하게 함
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('''
+                SELECT value FROM cache_entries
+                WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)
+            ''', (namespace, key, now)).fetchone()
+            value = int(json.loads(row[0])) + amount if row else amount
+            if limit is not None and value > limit:
+                return None
+            conn.execute('''
+                INSERT INTO cache_entries (namespace, key, value, source, created_at, updated_at, expires_at)
+                VALUES (?, ?, ?, 'counter', ?, ?, ?)
+                ON CONFLICT(namespace, key) DO UPDATE SET
+                    value = excluded.value,
+                    updated_at = excluded.updated_at,
+                    expires_at = excluded.expires_at
+            ''', (namespace, key, json.dumps(value), now, now, expires_at))
+        return value
+
+    def delete_many(self, namespace: str, keys: Iterable[str]) -> int:
+        """여러 키 삭제"""
+        rows = [(namespace, str(key)) for key in keys]
+        if not rows:
+            return 0
+        conn = self._get_connection()
+        with conn:
+            conn.executemany('DELETE FROM cache_entries WHERE namespace = ? AND key = ?', rows)
+        return len(rows)
+
+    def apply_changes(self, namespace: str, changes: Dict[str, Any], ttl: Optional[float] = None,
+                      source: Optional[str] = None) -> Tuple[int, int]:
+        """변경분 반영: 값이 None이면 삭제, 아니면 업서트 (한 트랜잭션)"""
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        upserts = []
+        deletes = []
+        for key, value in changes.items():
+            if value is None:
+                deletes.append((namespace, str(key)))
+            else:
+                upserts.append((namespace, str(key), json.dumps(value, ensure_ascii=False),
+                                source, now, now, expires_at))
+        if not upserts and not deletes:
+            return 0, 0
+        conn = self._get_connection()
+        with conn:
+            if upserts:
+                conn.executemany('''
+                    INSERT INTO cache_entries (namespace, key, value, source, created_at, updated_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(namespace, key) DO UPDATE SET
+                        value = excluded.value,
+                        source = excluded.source,
+                        updated_at = excluded.updated_at,
+                        expires_at = excluded.expires_at
+                ''', upserts)
+            if deletes:
+                conn.executemany('DELETE FROM cache_entries WHERE namespace = ? AND key = ?', deletes)
+        return len(upserts), len(deletes)
+
+    def purge_expired(self) -> int:
+        """만료된 항목 정리"""
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.execute('''
+                DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?
+            ''', (time.time(),))
+        return cursor.rowcount
+
+    def count(self, namespace: str) -> int:
+        """네임스페이스 항목 수"""
+        row = self._get_connection().execute(
+            'SELECT COUNT(*) FROM cache_entries WHERE namespace = ?', (namespace,)
+        ).fetchone()
+        return row[0]
+
+    def import_json_file(self, namespace: str, path: str, transform=None,
+                         source: str = 'json_import') -> int:
+        """기존 JSON 캐시 파일을 한 번만 가져오기
+
+        transform(key, value)가 None을 반환하면 해당 항목은 건너뜁니다.
+        이미 가져온 파일은 다시 읽지 않습니다.
+        """
+        import_name = f"{namespace}:{os.path.basename(path)}"
+        conn = self._get_connection()
+        if conn.execute('SELECT 1 FROM cache_imports WHERE name = ?', (import_name,)).fetchone():
+            return 0
+        entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8-sig') as f:
+                    content = f.read().strip()
+                data = json.loads(content) if content else {}
+                if isinstance(data, dict):
+                    for key, value in data.items():
+                        if transform is not None:
+                            value = transform(key, value)
+                        if value is not None:
+                            entries[str(key)] = value
+            except Exception as e:
+                print(f"[캐시저장소] {path} 가져오기 실패: {e}")
+                return 0
+        now = time.time()
+        rows = [
+            (namespace, key, json.dumps(value, ensure_ascii=False), source, now, now, None)
+            for key, value in entries.items()
+        ]
+        with conn:
+            # 이미 저장된 값(더 최신)은 덮어쓰지 않음
+            conn.executemany('''
+                INSERT OR IGNORE INTO cache_entries
+                (namespace, key, value, source, created_at, updated_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            conn.execute('''
+                INSERT OR IGNORE INTO cache_imports (name, imported_at, entry_count)
+                VALUES (?, ?, ?)
+            ''', (import_name, now, len(rows)))
+        if rows:
+            print(f"[캐시저장소] {os.path.basename(path)} → '{namespace}' {len(rows)}개 항목 가져옴")
+        return len(rows)
+
+    def close(self):
+        """현재 스레드의 연결 종료"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_cache_store() -> CacheStore:
+    """프로세스 공용 캐시 저장소"""
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = CacheStore()
+    return _default_store
@@ -0,0 +1,174 @@
+"""
+자막 색인 / 여러 단어 동시 매칭
+- CaptionIndex: 영상 하나의 자막을 시작/끝 시간 배열 + 이어 붙인 본문 + 줄 시작 위치 배열로 저장
+- SlangMatcher: 아호-코라식 오토마톤으로 추적 중인 모든 신조어를 본문 한 번 훑어서 찾음
+자막 파일 하나를 받으면 검색한 단어뿐 아니라 그 자막에 나오는 모든 추적 단어의 등장 시간을 얻을 수 있습니다.
+"""
+import re
+import base64
+from array import array
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+SRT_TIME_LINE = re.compile(
+    r'\s*(\d{1,2}):(\d{2}):(\d{2})[,.](\d{1,3})\s*-->\s*(\d{1,2}):(\d{2}):(\d{2})[,.](\d{1,3})'
+)
+# 본문에서 자막 줄 구분자 (신조어에는 없는 문자라 줄을 넘는 매칭이 생기지 않음)
+LINE_SEPARATOR = '\n'
+
+
+def _seconds(h: str, m: str, s: str, ms: str) -> float:
+    return int(h) * 3600 + int(m) * 60 + int(s) + int(ms.ljust(3, '0')) / 1000.0
+
+
+class SlangMatcher:
+    """아호-코라식 다중 패턴 매칭 (대소문자 구분 없음)"""
+
+    def __init__(self, words: Iterable[str]):
+        # 소문자 패턴 → 처음 받은 원래 표기
+        self.words: Dict[str, str] = {}
+        for word in words:
+            if word and word.lower() not in self.words:
+                self.words[word.lower()] = word
+        self.patterns: List[str] = list(self.words)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+        outputs: List[List[int]] = [[]]
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                child = self._goto[node].get(ch)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][ch] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = child
+            outputs[node].append(index)
+
+        # 실패 링크 (BFS 순서로 계산해 출력 목록에 접미사 패턴을 합침)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+        self._out = [tuple(out) for out in outputs]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(패턴 끝 위치, 소문자 패턴) - text는 이미 소문자여야 함"""
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for index in out[node]:
+                yield pos, patterns[index]
+
+
+class CaptionIndex:
+    """영상 하나의 자막 (줄 단위 시작/끝 시간 + 본문 오프셋)"""
+
+    def __init__(self, starts: array, ends: array, offsets: array, text: str):
+        self.starts = starts
+        self.ends = ends
+        self.offsets = offsets
+        self.text = text
+        self._lower = None
+
+    @classmethod
+    def from_srt(cls, srt_text: str) -> 'CaptionIndex':
+        """SRT 파싱 (줄 단위 한 번 훑기, 블록 안의 여러 줄은 공백으로 합침)"""
+        starts, ends, offsets = array('d'), array('d'), array('I')
+        lines: List[str] = []
+        length = 0
+        current = None
+
+        def flush():
+            nonlocal length
+            if current is None:
+                return
+            text = ' '.join(part for part in current[2] if part)
+            starts.append(current[0])
+            ends.append(current[1])
+            offsets.append(length)
+            lines.append(text)
+            length += len(text) + len(LINE_SEPARATOR)
+
+        raw_lines = srt_text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        for i, line in enumerate(raw_lines):
+            match = SRT_TIME_LINE.match(line)
+            if match:
+                flush()
+                current = (_seconds(*match.group(1, 2, 3, 4)), _seconds(*match.group(5, 6, 7, 8)), [])
+                continue
+            if current is None:
+                continue
+            stripped = line.strip()
+            # 다음 블록 번호 줄은 본문에서 제외
+            if stripped.isdigit() and i + 1 < len(raw_lines) and SRT_TIME_LINE.match(raw_lines[i + 1]):
+                continue
+            current[2].append(stripped)
+        flush()
+        return cls(starts, ends, offsets, LINE_SEPARATOR.join(lines))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def line(self, index: int) -> str:
+        end = self.offsets[index + 1] - len(LINE_SEPARATOR) if index + 1 < len(self.offsets) else len(self.text)
+        return self.text[self.offsets[index]:end]
+
+    def to_list(self) -> List[Dict]:
+        """YouTubeService.parse_srt와 같은 형식 ({'start', 'end', 'text'} 목록)"""
+        return [
+            {'start': self.starts[i], 'end': self.ends[i], 'text': self.line(i)}
+            for i in range(len(self.starts))
+        ]
+
+    def find(self, matcher: SlangMatcher) -> Dict[str, List[float]]:
+        """추적 단어별 등장한 자막 줄의 시작 시간 (줄마다 한 번, 시간 순)"""
+        if not len(matcher) or not self.text:
+            return {}
+        if self._lower is None:
+            self._lower = self.text.lower()
+        offsets = self.offsets
+        seen = set()
+        matches: Dict[str, List[float]] = {}
+        for pos, pattern in matcher.finditer(self._lower):
+            line = bisect_right(offsets, pos) - 1
+            if (pattern, line) in seen:
+                continue
+            seen.add((pattern, line))
+            matches.setdefault(matcher.words[pattern], []).append(self.starts[line])
+        return matches
+
+    def to_dict(self) -> Dict:
+        return {
+            'starts': base64.b64encode(self.starts.tobytes()).decode('ascii'),
+            'ends': base64.b64encode(self.ends.tobytes()).decode('ascii'),
+            'offsets': base64.b64encode(self.offsets.tobytes()).decode('ascii'),
+            'text': self.text,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CaptionIndex':
+        arrays = []
+        for name, typecode in (('starts', 'd'), ('ends', 'd'), ('offsets', 'I')):
+            values = array(typecode)
+            values.frombytes(base64.b64decode(data[name]))
+            arrays.append(values)
+        return cls(*arrays, data['text'])
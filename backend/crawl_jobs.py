@@ -0,0 +1,228 @@
+"""
+크롤링 작업 관리자
+API(/crawl)와 스케줄러가 같은 관리자를 통해 크롤링을 실행합니다.
+- 작업은 crawl_jobs 테이블에 기록 (단계별 진행 상황, 결과, 오류)
+- 실행 중인 작업이 있으면 새 작업을 만들지 않고 기존 작업을 돌려줌 (single-flight)
+- 크롤러(NLP 모델 포함)는 한 번만 만들어 재사용
+- 단계별 결과를 체크포인트로 저장해 실패한 작업을 마지막 완료 단계부터 이어서 실행
+"""
+import os
+import uuid
+import threading
+import traceback
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from trends import TrendEngine
+except ImportError as e:
+    TrendEngine = None
+    # 배포 환경에서 numpy가 빠지면 /trending이 조용히 꺼지므로 눈에 띄게 기록
+    print(f"[ERROR] [크롤링 작업] 추세 엔진 로드 실패 - 급상승 단어 기록이 꺼집니다 "
+          f"(backend/requirements.txt의 numpy 설치 확인): {e}")
+    traceback.print_exc()
+
+# 작업 단계 (crawl_and_analyze 단계 + 저장)
+CRAWL_STAGES = ('fetch', 'tokenize', 'prefilter', 'dictionary', 'classify', 'moderate', 'meanings', 'persist')
+CRAWL_STAGE_LABELS = {
+    'fetch': '게시물 수집',
+    'tokenize': '키워드 추출',
+    'prefilter': '기본 필터링',
+    'dictionary': '네이버 사전 확인',
+    'classify': 'NLP 분류',
+    'moderate': '욕설 필터링',
+    'meanings': '의미 생성',
+    'persist': '저장',
+}
+TERMINAL_STATUSES = ('succeeded', 'failed')
+
+# heartbeat가 이 시간 이상 끊긴 작업은 중단된 것으로 간주
+CRAWL_JOB_STALE_MINUTES = int(os.getenv('CRAWL_JOB_STALE_MINUTES', '180') or 180)
+# 이어서 실행하지 않은 실패 작업의 체크포인트 보관 기간
+CRAWL_CHECKPOINT_RETENTION_DAYS = int(os.getenv('CRAWL_CHECKPOINT_RETENTION_DAYS', '7') or 7)
+
+
+class JobCheckpoints:
+    """작업 하나의 단계별 결과 저장소 (crawl_and_analyze의 checkpoints 인자)"""
+
+    def __init__(self, db, job_id: str):
+        self.db = db
+        self.job_id = job_id
+
+    def load(self, stage: str):
+        return self.db.load_crawl_checkpoint(self.job_id, stage)
+
+    def save(self, stage: str, data):
+        self.db.save_crawl_checkpoint(self.job_id, stage, data)
+
+    def stages(self) -> List[str]:
+        return self.db.get_crawl_checkpoint_stages(self.job_id)
+
+
+class CrawlJobManager:
+    """크롤링 작업 등록/실행/조회"""
+
+    def __init__(self, db, crawler_factory: Optional[Callable] = None):
+        self.db = db
+        self._crawler_factory = crawler_factory
+        self._crawler = None
+        self._crawler_lock = threading.Lock()
+        self._completion_hooks: List[Callable[[Dict], None]] = []
+        self._persist_hooks: List[Callable[[List[str]], None]] = []
+        self.trends = TrendEngine(db) if TrendEngine else None
+
+    def add_completion_hook(self, hook: Callable[[Dict], None]):
+        """작업이 성공적으로 끝난 뒤 호출할 함수 등록 (예: 랭킹 스냅샷 갱신)"""
+        self._completion_hooks.append(hook)
+
+    def add_persist_hook(self, hook: Callable[[List[str]], None]):
+        """크롤링 결과 저장 직후 호출할 함수 등록 (저장된 단어 목록을 받음)"""
+        self._persist_hooks.append(hook)
+
+    def _claim(self, trigger: str) -> Tuple[Dict, bool]:
+        job, created = self.db.claim_crawl_job(uuid.uuid4().hex, trigger,
+                                               timedelta(minutes=CRAWL_JOB_STALE_MINUTES))
+        if created:
+            # 오래된 실패 작업의 체크포인트 정리
+            self.db.delete_crawl_checkpoints(
+                older_than=datetime.now() - timedelta(days=CRAWL_CHECKPOINT_RETENTION_DAYS)
+            )
+        return job, created
+
+    def _start_thread(self, job_id: str):
+        thread = threading.Thread(target=self._execute, args=(job_id,),
+                                  name=f"crawl-{job_id[:8]}", daemon=True)
+        thread.start()
+
+    def submit(self, trigger: str = 'api') -> Tuple[Dict, bool]:
+        """백그라운드 스레드에서 작업 시작 (실행 중인 작업이 있으면 그대로 반환)"""
+        job, created = self._claim(trigger)
+        if created:
+            self._start_thread(job['id'])
+            print(f"[크롤링 작업] {job['id']} 시작 ({trigger})")
+        elif job:
+            print(f"[크롤링 작업] 이미 실행 중인 작업 {job['id']} ({job['trigger']}) - 새 작업을 만들지 않음")
+        return job, created
+
+    def run(self, trigger: str = 'scheduler') -> Optional[Dict]:
+        """현재 스레드에서 작업 실행 (실행 중인 작업이 있으면 건너뜀)"""
+        job, created = self._claim(trigger)
+        if not created:
+            if job:
+                print(f"[크롤링 작업] 이미 실행 중인 작업 {job['id']} ({job['trigger']}) - 건너뜀")
+            return None
+        print(f"[크롤링 작업] {job['id']} 시작 ({trigger})")
+        self._execute(job['id'])
+        return self.get(job['id'])
+
+    def resume(self, job_id: str) -> Tuple[Optional[Dict], bool]:
+        """실패한 작업을 마지막 완료 단계부터 이어서 실행 (백그라운드 스레드)
+        
+        Returns:
+            (작업 정보, 재개 여부) - 다른 작업이 실행 중이면 그 작업과 False
+        """
+        job, resumed = self.db.reclaim_crawl_job(job_id, timedelta(minutes=CRAWL_JOB_STALE_MINUTES))
+        if resumed:
+            completed = self.db.get_crawl_checkpoint_stages(job_id)
+            print(f"[크롤링 작업] {job_id} 이어서 실행 (완료된 단계: {', '.join(completed) or '없음'})")
+            self._start_thread(job_id)
+        return job, resumed
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """작업 조회 (완료된 체크포인트 단계 포함)"""
+        job = self.db.get_crawl_job(job_id)
+        if job is not None:
+            job['completed_stages'] = self.db.get_crawl_checkpoint_stages(job_id)
+        return job
+
+    def active(self) -> Optional[Dict]:
+        return self.db.get_active_crawl_job()
+
+    def _get_crawler(self):
+        """크롤러 재사용 (모델/캐시를 작업마다 다시 로드하지 않음)"""
+        with self._crawler_lock:
+            if self._crawler is None:
+                if self._crawler_factory is None:
+                    from crawler import Crawler
+                    self._crawler_factory = Crawler
+                self._crawler = self._crawler_factory()
+            return self._crawler
+
+    def _report(self, job_id: str, stage: str):
+        stage_index = CRAWL_STAGES.index(stage) + 1 if stage in CRAWL_STAGES else 0
+        self.db.update_crawl_job(job_id, stage=stage, stage_index=stage_index,
+                                 stage_total=len(CRAWL_STAGES),
+                                 message=CRAWL_STAGE_LABELS.get(stage, stage))
+
+    def _update_trends(self, result: List[Dict]):
+        """이번 크롤링의 단어별 등장 횟수로 추세 상태 갱신 (실패해도 작업은 계속)"""
+        if self.trends is None:
+            return
+        try:
+            self.trends.update({item['word']: item.get('count', 1) for item in result if item.get('word')})
+        except Exception as e:
+            print(f"[크롤링 작업] 추세 갱신 실패: {e}")
+
+    def _notify_persisted(self, result: List[Dict]):
+        words = [item['word'] for item in result if item.get('word')]
+        for hook in self._persist_hooks:
+            try:
+                hook(words)
+            except Exception as e:
+                print(f"[크롤링 작업] 저장 후 처리 실패: {e}")
+
+    def _execute(self, job_id: str):
+        self.db.update_crawl_job(job_id, status='running', started_at=datetime.now(),
+                                 stage_total=len(CRAWL_STAGES))
+        checkpoints = JobCheckpoints(self.db, job_id)
+        try:
+            persisted = checkpoints.load('persist')
+            if persisted is None:
+                crawler = self._get_crawler()
+                result = crawler.crawl_and_analyze(progress=lambda stage: self._report(job_id, stage),
+                                                   checkpoints=checkpoints)
+                print(f"[크롤링 작업] {job_id} 분석 완료: {len(result)}개 신조어 발견")
+
+                # 데이터베이스에 저장 (한 트랜잭션으로 일괄 저장 + 등장 이력 기록, crawl_id = 작업 ID)
+                self._report(job_id, 'persist')
+                added_count = self.db.add_slangs_many(result, crawl_id=job_id, raise_errors=True)
+                self._update_trends(result)
+                self._notify_persisted(result)
+                # 재개 시 사용 횟수가 두 번 더해지지 않도록 저장 완료 기록
+                checkpoints.save('persist', {'added_count': added_count})
+            else:
+                added_count = persisted['added_count']
+            self.db.update_crawl_job(job_id, status='succeeded', result_count=added_count,
+                                     message=f"{added_count}개 신조어 저장")
+            self.db.delete_crawl_checkpoints(job_id)
+            print(f"[크롤링 작업] {job_id} 완료: {added_count}개 신조어 저장됨")
+        except Exception as e:
+            print(f"[크롤링 작업] {job_id} 실패: {e}")
+            traceback.print_exc()
+            self.db.update_crawl_job(job_id, status='failed', error=str(e),
+                                     message="실패 (마지막 완료 단계부터 이어서 실행 가능)")
+            return
+
+        job = self.get(job_id)
+        for hook in self._completion_hooks:
+            try:
+                hook(job)
+            except Exception as e:
+                print(f"[크롤링 작업] 완료 후 처리 실패: {e}")
+
+
+_default_manager = None
+_default_manager_lock = threading.Lock()
+
+
+def get_crawl_job_manager(db=None) -> CrawlJobManager:
+    """프로세스 공용 크롤링 작업 관리자 (API와 스케줄러가 공유)"""
+    global _default_manager
+    if _default_manager is None:
+        with _default_manager_lock:
+            if _default_manager is None:
+                if db is None:
+                    from database import Database
+                    db = Database()
+                _default_manager = CrawlJobManager(db)
+    return _default_manager
@@ -2,7 +2,7 @@ import requests
 from bs4 import BeautifulSoup
 import re
 from collections import Counter
-from typing import List, Dict, Set, Optional
+from typing import Callable, List, Dict, Set, Optional
 import time
 import os
 import sys
@@ -10,6 +10,10 @@ import math
 import json
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from cache_store import get_cache_store
+from rules_service import get_word_rules_service, get_manual_meanings_service
+import parallel_tokenizer
+from sketches import KeywordSketch
 
 # 백그라운드 작업에서도 로그가 즉시 출력되도록 print를 래핑
 _original_print = print
@@ -31,6 +35,12 @@ except ImportError:
     OPENAI_AVAILABLE = False
     print("[WARNING] OpenAI library not installed. GPT filtering will be disabled.")
 
+# 통합 캐시 저장소 네임스페이스
+MEANING_CACHE_NAMESPACE = 'meaning'
+NAVER_DICT_CACHE_NAMESPACE = 'naver_dict'
+PROFANE_CACHE_NAMESPACE = 'profane'
+KEYWORD_SKETCH_NAMESPACE = 'keyword_sketch'
+
 class Crawler:
     @staticmethod
     def _get_env_int(name: str, default: int) -> int:
@@ -145,86 +155,45 @@ class Crawler:
             elif not OPENAI_AVAILABLE:
                 print("[GPT] API 비활성화됨 (OpenAI 라이브러리가 설치되지 않았습니다)")
         
-        # 수동 의미 사전 로드
-        self.manual_meanings = {}
-        try:
-            data_dir = os.path.join(current_dir, 'data')
-            os.makedirs(data_dir, exist_ok=True)
-            manual_path = os.path.join(data_dir, 'manual_meanings.json')
-            if os.path.exists(manual_path):
-                # UTF-8 BOM 문제 해결: utf-8-sig 사용
-                with open(manual_path, 'r', encoding='utf-8-sig') as f:
-                    import json
-                    content = f.read().strip()
-                    if content:
-                        data = json.loads(content)
-                        if isinstance(data, dict):
-                            # 새 형식: {"단어": {"meaning": "...", "examples": [...]}}
-                            # 구 형식 호환: {"단어": "의미"}
-                            self.manual_meanings = {}
-                            for k, v in data.items():
-                                if isinstance(v, dict):
-                                    # 새 형식
-                                    self.manual_meanings[str(k)] = v
-                                elif isinstance(v, str):
-                                    # 구 형식 호환: 문자열을 객체로 변환
-                                    self.manual_meanings[str(k)] = {"meaning": v, "examples": []}
-                            print(f"[의미사전] 수동 의미 {len(self.manual_meanings)}개 로드 (예문 포함)")
-            else:
-                # 파일이 없으면 빈 파일 생성 (BOM 없이)
-                with open(manual_path, 'w', encoding='utf-8') as f:
-                    f.write("{}")
-        except Exception as e:
-            print(f"[의미사전] 수동 의미 로드 실패: {e}")
-            # 실패해도 빈 딕셔너리로 계속 진행
-            self.manual_meanings = {}
-
-        # 단어 노출 규칙(허용/차단) 로드
-        self.word_rules = {"allow": [], "block": []}
-        try:
-            rules_path = os.path.join(current_dir, 'data', 'word_rules.json')
-            if os.path.exists(rules_path):
-                import json
-                with open(rules_path, 'r', encoding='utf-8-sig') as f:
-                    content = f.read().strip()
-                    if content:
-                        data = json.loads(content)
-                        if isinstance(data, dict):
-                            allow = data.get('allow') or []
-                            block = data.get('block') or []
-                            self.word_rules = {
-                                'allow': [str(w) for w in allow if w],
-                                'block': [str(w) for w in block if w],
-                            }
-            else:
-                # 기본 파일 생성
-                os.makedirs(os.path.dirname(rules_path), exist_ok=True)
-                with open(rules_path, 'w', encoding='utf-8') as f:
-                    f.write('{"allow": [], "block": []}')
-            print(f"[단어규칙] allow={len(self.word_rules['allow'])}, block={len(self.word_rules['block'])}")
-        except Exception as e:
-            print(f"[단어규칙] 로드 실패: {e}")
-            self.word_rules = {"allow": [], "block": []}
+        # 단어 노출 규칙(허용/차단) - 파일이 바뀐 경우에만 다시 읽는 공용 서비스
+        # (수동 의미 사전은 크롤러가 재사용되므로 generate_meanings에서 매번 조회)
+        self.word_rules_service = get_word_rules_service()
+        self.word_rules = self.word_rules_service.get()
+        print(f"[단어규칙] allow={len(self.word_rules['allow'])}, block={len(self.word_rules['block'])}")
 
         # 필터 강도 관련 파라미터 (환경변수로 조정 가능)
         self.filter_min_count = self._get_env_int('SLANG_FILTER_MIN_COUNT', 3)
         self.filter_nlp_threshold = self._get_env_float('SLANG_FILTER_NLP_THRESHOLD', 0.46)
         self.filter_target_count = self._get_env_int('SLANG_FILTER_TARGET_COUNT', 30)
+        
+        # 병렬 토큰화 (텍스트가 많을 때만 프로세스 풀 사용, 0이면 CPU 개수, 1이면 사용 안 함)
+        self.tokenize_workers = self._get_env_int('TOKENIZE_WORKERS', 0) or parallel_tokenizer.default_workers()
+        self.tokenize_parallel_min_texts = self._get_env_int('TOKENIZE_PARALLEL_MIN_TEXTS', 2000)
+        
+        # 키워드 집계 방식: exact(전체 Counter) 또는 sketch(Count-Min + Space-Saving, 고정 메모리)
+        self.keyword_count_mode = (os.getenv('KEYWORD_COUNT_MODE', 'exact') or 'exact').strip().lower()
+        self.sketch_epsilon = self._get_env_float('SKETCH_EPSILON', 0.0001)
+        self.sketch_delta = self._get_env_float('SKETCH_DELTA', 0.01)
+        self.sketch_top_k = self._get_env_int('SKETCH_TOP_K', 5000)
+        self.sketch_merge_history = os.getenv('SKETCH_MERGE_HISTORY', 'true').lower() == 'true'
 
+        # 통합 캐시 저장소 (SQLite WAL) - 기존 JSON 캐시 파일은 최초 1회만 가져옴
+        self.cache_store = get_cache_store()
+        
         # 의미 캐시 파일 경로 및 초기화
         self.meaning_cache_file = os.path.join(current_dir, 'meaning_cache.json')
         self.meaning_cache = self._load_meaning_cache()
         
-        # 네이버 사전 확인 결과 캐시 (메모리 캐시)
+        # 네이버 사전 확인 결과 캐시 (메모리 캐시 + 변경분만 저장)
         self.naver_dict_cache = {}
         self.naver_dict_cache_file = os.path.join(current_dir, 'standard_word_cache.json')
-        self._naver_cache_dirty = False
+        self._naver_cache_changes = {}
         self._load_naver_dict_cache()
         
         # 욕설 판별 캐시
         self.profane_cache_file = os.path.join(current_dir, 'profane_word_cache.json')
         self.profane_cache = self._load_profane_cache()
-        self._profane_cache_dirty = False
+        self._profane_cache_changes = {}
         
         # NLP 분류기 초기화 (옵션)
         self.nlp_classifier = None
@@ -247,21 +216,20 @@ class Crawler:
         """허용/차단 규칙 적용"""
         if not word:
             return False
-        if word in self.word_rules.get('block', []):
+        if self.word_rules_service.is_blocked(word):
             return False
         return True
     
     def _load_meaning_cache(self) -> Dict[str, tuple[str, bool]]:
         """저장된 의미 캐시 로드"""
-        if not os.path.exists(self.meaning_cache_file):
-            return {}
-        
         try:
-            with open(self.meaning_cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            self.cache_store.import_json_file(
+                MEANING_CACHE_NAMESPACE, self.meaning_cache_file,
+                transform=lambda word, value: list(value) if isinstance(value, (list, tuple)) and len(value) == 2 else None
+            )
             # JSON 형태를 tuple로 변환
             result = {}
-            for word, (meaning, success) in cache_data.items():
+            for word, (meaning, success) in self.cache_store.items(MEANING_CACHE_NAMESPACE).items():
                 result[word] = (meaning, success)
             return result
         except Exception as e:
@@ -269,38 +237,45 @@ class Crawler:
             return {}
     
     def _save_meaning_cache(self, new_meanings: Dict[str, tuple[str, bool]]):
-        """새로운 의미를 캐시에 저장"""
+        """새로운 의미를 캐시에 저장 (변경된 단어만 기록)"""
         # 기존 캐시와 병합
         self.meaning_cache.update(new_meanings)
         
         try:
             # tuple을 JSON 직렬화 가능한 형태로 변환
-            cache_data = {word: [meaning, success] for word, (meaning, success) in self.meaning_cache.items()}
-            with open(self.meaning_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            changed = {word: [meaning, success] for word, (meaning, success) in new_meanings.items()}
+            self.cache_store.set_many(MEANING_CACHE_NAMESPACE, changed, source='gpt')
             print(f"[캐시] {len(new_meanings)}개 의미 저장됨 (총 {len(self.meaning_cache)}개)")
         except Exception as e:
             print(f"[캐시] 저장 실패: {e}")
     
     def _load_profane_cache(self) -> Dict[str, bool]:
         """욕설 판별 결과 캐시 로드"""
-        if not os.path.exists(self.profane_cache_file):
-            return {}
         try:
-            with open(self.profane_cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return {str(k): bool(v) for k, v in data.items()}
+            self.cache_store.import_json_file(
+                PROFANE_CACHE_NAMESPACE, self.profane_cache_file,
+                transform=lambda word, value: bool(value)
+            )
+            data = self.cache_store.items(PROFANE_CACHE_NAMESPACE)
+            return {str(k): bool(v) for k, v in data.items()}
         except Exception as e:
             print(f"[욕설필터] 캐시 로드 실패: {e}")
         return {}
     
+    def _set_profane_cache(self, word: str, is_profane: bool):
+        """욕설 판별 결과를 메모리 캐시에 기록하고 변경분으로 표시"""
+        self.profane_cache[word] = is_profane
+        self._profane_cache_changes[word] = is_profane
+    
     def _save_profane_cache(self):
-        """욕설 판별 캐시 저장"""
+        """욕설 판별 캐시 저장 (변경된 단어만 기록)"""
+        if not self._profane_cache_changes:
+            return
         try:
-            with open(self.profane_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.profane_cache, f, ensure_ascii=False, indent=2)
-            print(f"[욕설필터] 캐시 저장: {len(self.profane_cache)}개 단어")
+            changes = self._profane_cache_changes
+            self._profane_cache_changes = {}
+            self.cache_store.set_many(PROFANE_CACHE_NAMESPACE, changes, source='gpt')
+            print(f"[욕설필터] 캐시 저장: {len(changes)}개 변경 (총 {len(self.profane_cache)}개 단어)")
         except Exception as e:
             print(f"[욕설필터] 캐시 저장 실패: {e}")
     
@@ -509,6 +484,7 @@ class Crawler:
                     post_data = {
                         'title': title_text,
                         'source': f"DCInside {gallery}",
+                        'gallery': gallery,
                         'link': full_link,
                         'content': ''  # 기본값
                     }
@@ -541,8 +517,27 @@ class Crawler:
         
         return all_posts
     
+    def _parallel_tokenize_workers(self, texts: List[str]) -> int:
+        """병렬 토큰화에 쓸 작업자 수 (병렬 처리하지 않으면 0)"""
+        if self.tokenize_workers > 1 and len(texts) >= self.tokenize_parallel_min_texts:
+            return self.tokenize_workers
+        return 0
+    
     def extract_all_keywords(self, texts: List[str]) -> Counter:
         """모든 한글 키워드 추출 (조사 제거 포함)"""
+        if self.keyword_count_mode == 'sketch':
+            return self.extract_keywords_sketch(texts)
+        
+        workers = self._parallel_tokenize_workers(texts)
+        if workers:
+            try:
+                start = time.time()
+                keyword_counts = parallel_tokenizer.count_keywords(texts, self.korean_particles, workers)
+                print(f"[토큰화] {len(texts)}개 텍스트 병렬 처리 ({workers}개 프로세스, {time.time() - start:.2f}초)")
+                return keyword_counts
+            except Exception as e:
+                print(f"[토큰화] 병렬 처리 실패, 단일 프로세스로 처리: {e}")
+        
         keyword_counts = Counter()
         
         for text in texts:
@@ -556,6 +551,56 @@ class Crawler:
         
         return keyword_counts
     
+    def extract_keywords_sketch(self, texts: List[str]) -> Counter:
+        """스케치 집계 모드: 단어 수와 무관한 고정 메모리로 빈출 후보와 추정 빈도만 반환"""
+        sketch = KeywordSketch(self.sketch_epsilon, self.sketch_delta, self.sketch_top_k)
+        for text in texts:
+            for word in re.findall(r'[가-힣]{2,15}', text):
+                cleaned = self.remove_particles(word)
+                if len(cleaned) >= 2:
+                    sketch.add(cleaned)
+        
+        stats = sketch.stats()
+        print(f"[스케치] 토큰 {stats['total_tokens']}개, 후보 {stats['tracked_words']}개 "
+              f"(빈도 오차 ≤ {stats['error_bound']:.1f}, 확률 {1 - stats['delta']:.0%}), "
+              f"메모리 {stats['memory_bytes'] / 1024 / 1024:.2f}MB")
+        
+        if self.sketch_merge_history:
+            self._merge_keyword_sketch_history(sketch)
+        return sketch.top_counts()
+    
+    def _merge_keyword_sketch_history(self, sketch: KeywordSketch):
+        """이번 크롤링 스케치를 누적 스케치에 병합해 저장"""
+        try:
+            stored = self.cache_store.get(KEYWORD_SKETCH_NAMESPACE, 'cumulative')
+            cumulative = KeywordSketch.load_or_create(stored, self.sketch_epsilon, self.sketch_delta,
+                                                      self.sketch_top_k)
+            cumulative.merge(sketch)
+            self.cache_store.set(KEYWORD_SKETCH_NAMESPACE, 'cumulative', cumulative.to_dict(), source='crawl')
+            print(f"[스케치] 누적 스케치 병합 (누적 토큰 {cumulative.cms.total}개)")
+        except Exception as e:
+            print(f"[스케치] 누적 스케치 병합 실패: {e}")
+    
+    def load_keyword_sketch_history(self) -> Optional[KeywordSketch]:
+        """저장된 누적 스케치 (없으면 None)"""
+        stored = self.cache_store.get(KEYWORD_SKETCH_NAMESPACE, 'cumulative')
+        return KeywordSketch.from_dict(stored) if stored else None
+    
+    def count_occurrences_by_gallery(self, posts: List[Dict], words: List[str]) -> Dict[str, Dict[str, int]]:
+        """단어별 갤러리 등장 횟수 집계 (extract_all_keywords와 같은 토큰화 사용)"""
+        targets = set(words)
+        counts: Dict[str, Counter] = {word: Counter() for word in targets}
+        if not targets:
+            return {}
+        for post in posts:
+            gallery = post.get('gallery') or post.get('source') or 'unknown'
+            text = ' '.join(part for part in (post.get('title', ''), post.get('content', '')) if part)
+            for token in re.findall(r'[가-힣]{2,15}', text):
+                cleaned = self.remove_particles(token)
+                if cleaned in targets:
+                    counts[cleaned][gallery] += 1
+        return {word: dict(counter) for word, counter in counts.items() if counter}
+    
     def filter_slang_candidates(self, keyword_counts: Counter) -> Dict[str, int]:
         """기본 필터링 (일반 단어 제외)"""
         filtered = {}
@@ -658,30 +703,43 @@ class Crawler:
     
     def _load_naver_dict_cache(self):
         """네이버 사전 확인 결과 캐시 로드"""
-        if not os.path.exists(self.naver_dict_cache_file):
-            return
-        
         try:
-            with open(self.naver_dict_cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            # True(표준어) 항목만 유지
-            filtered = {word: value for word, value in data.items() if value}
-            removed = len(data) - len(filtered)
-            self.naver_dict_cache = filtered
+            # True(표준어) 항목만 가져옴
+            self.cache_store.import_json_file(
+                NAVER_DICT_CACHE_NAMESPACE, self.naver_dict_cache_file,
+                transform=lambda word, value: True if value else None
+            )
+            data = self.cache_store.items(NAVER_DICT_CACHE_NAMESPACE)
+            self.naver_dict_cache = {word: True for word, value in data.items() if value}
+            # False 항목이 남아 있으면 해당 키만 삭제
+            removed = [word for word, value in data.items() if not value]
             if removed:
-                print(f"[네이버 사전 캐시] {removed}개 False 항목 제거 후 {len(filtered)}개 유지")
-                self._save_naver_dict_cache()
+                self.cache_store.delete_many(NAVER_DICT_CACHE_NAMESPACE, removed)
+                print(f"[네이버 사전 캐시] {len(removed)}개 False 항목 제거 후 {len(self.naver_dict_cache)}개 유지")
             else:
                 print(f"[네이버 사전 캐시] {len(self.naver_dict_cache)}개 결과 로드됨")
         except Exception as e:
             print(f"[네이버 사전 캐시] 로드 실패: {e}")
             self.naver_dict_cache = {}
     
+    def _set_naver_dict_cache(self, word: str, is_standard: bool):
+        """네이버 사전 결과를 메모리 캐시에 반영 (True만 유지, False는 삭제)"""
+        if is_standard:
+            if not self.naver_dict_cache.get(word):
+                self.naver_dict_cache[word] = True
+                self._naver_cache_changes[word] = True
+        elif word in self.naver_dict_cache:
+            del self.naver_dict_cache[word]
+            self._naver_cache_changes[word] = None
+    
     def _save_naver_dict_cache(self):
-        """네이버 사전 확인 결과 캐시 저장"""
+        """네이버 사전 확인 결과 캐시 저장 (변경된 단어만 기록)"""
+        if not self._naver_cache_changes:
+            return
         try:
-            with open(self.naver_dict_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.naver_dict_cache, f, ensure_ascii=False, indent=2)
+            changes = self._naver_cache_changes
+            self._naver_cache_changes = {}
+            self.cache_store.apply_changes(NAVER_DICT_CACHE_NAMESPACE, changes, source='naver')
         except Exception as e:
             print(f"[네이버 사전 캐시] 저장 실패: {e}")
     
@@ -694,15 +752,8 @@ class Crawler:
         # 캐시에 없으면 API 호출
         result = self._check_naver_dictionary_api(word)
         
-        # True(표준어)만 캐시에 저장
-        if result:
-            self.naver_dict_cache[word] = True
-            self._naver_cache_dirty = True
-        else:
-            # False 결과는 캐시에서 제거하여 불필요한 저장 방지
-            if word in self.naver_dict_cache:
-                del self.naver_dict_cache[word]
-                self._naver_cache_dirty = True
+        # True(표준어)만 캐시에 저장, False 결과는 캐시에서 제거하여 불필요한 저장 방지
+        self._set_naver_dict_cache(word, result)
         return result
     
     def _check_naver_dictionary_api(self, word: str) -> bool:
@@ -768,11 +819,7 @@ class Crawler:
                 try:
                     result = future.result()
                     results[word] = result
-                    if result:
-                        self.naver_dict_cache[word] = True
-                        self._naver_cache_dirty = True
-                    elif word in self.naver_dict_cache:
-                        del self.naver_dict_cache[word]
+                    self._set_naver_dict_cache(word, result)
                 except Exception as e:
                     print(f"[WARNING] 네이버 사전 확인 실패 ({word}): {e}")
                     results[word] = False
@@ -811,8 +858,7 @@ class Crawler:
             )
             answer = response.choices[0].message.content.strip().upper()
             is_profane = answer.startswith("YES")
-            self.profane_cache[word] = is_profane
-            self._profane_cache_dirty = True
+            self._set_profane_cache(word, is_profane)
             if is_profane:
                 print(f"[욕설필터] '{word}' → GPT 판별: 욕설/비속어 (제외)")
             else:
@@ -879,8 +925,7 @@ class Crawler:
                     is_profane = True
                 
                 results[word] = is_profane
-                self.profane_cache[word] = is_profane
-                self._profane_cache_dirty = True
+                self._set_profane_cache(word, is_profane)
                 
                 if is_profane:
                     print(f"[욕설필터] '{word}' → GPT 판별: 욕설/비속어 (제외)")
@@ -970,9 +1015,7 @@ class Crawler:
         else:
             print(f"[욕설필터] {len(safe_candidates)}개 안전한 후보 선택 완료 (비속어 {profane_count}개 제외)")
         
-        if self._profane_cache_dirty:
-            self._save_profane_cache()
-            self._profane_cache_dirty = False
+        self._save_profane_cache()
         
         return safe_candidates
     
@@ -997,28 +1040,12 @@ class Crawler:
         
         return score
     
-    def enhanced_filter_slang_candidates(
-        self, 
-        word_counts: Counter, 
-        all_texts: List[str],
-        use_naver: bool = True,
-        use_gpt: bool = False,  # 기본값을 False로 변경 (필터링에서 GPT 비활성화)
-        min_count: int = 2,
-        target_count: int = 30,  # 상위 30개 반환
-        nlp_analysis_count: int = 2000,  # NLP로 분석할 단어 개수
-        nlp_threshold: float = 0.41  # NLP 확률 임계값
-    ) -> List[Dict]:
-        """
-        필터링: 네이버 사전 + NLP 확률 기반 필터링
+    def prefilter_candidates(self, word_counts: Counter, all_texts: List[str],
+                             min_count: int = 2) -> Dict:
+        """네이버 사전 확인 전 단계 (1 ~ 1.6단계 + 차단 리스트)
         
-        프로세스:
-        1. 기본 필터링 (common_words, 패턴 제외)
-        1.5. 네이버 사전 전 사전 필터링 (빈도수, 패턴, 길이 등) - API 호출 수 감소
-        1.6. 포함 관계 필터링 (짧은 단어를 포함한 더 긴 단어구 제거) - API 호출 수 감소
-        2. 네이버 사전 확인 (표준어 제외)
-        3. NLP로 분석 (배치 처리, 최대 nlp_analysis_count개)
-        4. 확률 0.41 미만 제외
-        5. 확률 기준으로 상위 30개 선택
+        Returns:
+            {'candidates': {단어: 횟수}, 'contexts': {단어: [맥락, ...]}}
         """
         total_words = len(word_counts)
         print(f"[필터링] 총 {total_words}개 단어 후보 분석 시작...")
@@ -1028,15 +1055,7 @@ class Crawler:
         print(f"[필터링] 1단계 - 기본 필터링 후: {len(filtered)}개")
         
         # 맥락 수집
-        word_contexts = {}
-        for text in all_texts:
-            words_in_text = re.findall(r'[가-힣]{2,8}', text)
-            for word in words_in_text:
-                cleaned = self.remove_particles(word)
-                if cleaned in filtered:
-                    if cleaned not in word_contexts:
-                        word_contexts[cleaned] = []
-                    word_contexts[cleaned].append(text[:200])
+        word_contexts = self.collect_contexts(all_texts, filtered)
         
         # 1.5단계: 네이버 사전 API 호출 전 사전 필터링 (빈도수, 패턴, 길이 등)
         pre_naver_filtered = self.pre_naver_filter(filtered, min_count=min_count)
@@ -1046,14 +1065,48 @@ class Crawler:
         pre_naver_filtered = self.filter_contained_words(pre_naver_filtered)
         print(f"[필터링] 1.6단계 - 포함 관계 필터링 후: {len(pre_naver_filtered)}개")
         
-        # 2단계: 네이버 사전 확인 및 차단 리스트 체크
-        # 차단 리스트 먼저 적용
+        # 차단 리스트 적용
         filtered_by_block = {}
+        block_set = self.word_rules_service.block_set
         for word, count in pre_naver_filtered.items():
-            if word in self.word_rules.get('block', []):
+            if word in block_set:
                 continue
             filtered_by_block[word] = count
         
+        return {
+            'candidates': filtered_by_block,
+            'contexts': {word: word_contexts.get(word, []) for word in filtered_by_block}
+        }
+    
+    def collect_contexts(self, all_texts: List[str], targets) -> Dict[str, List[str]]:
+        """대상 단어가 등장한 텍스트(앞 200자)를 등장 순서대로 수집"""
+        workers = self._parallel_tokenize_workers(all_texts)
+        if workers:
+            try:
+                postings = parallel_tokenizer.collect_postings(
+                    all_texts, frozenset(targets), self.korean_particles, workers
+                )
+                return {word: [all_texts[i][:200] for i in indexes] for word, indexes in postings.items()}
+            except Exception as e:
+                print(f"[토큰화] 병렬 맥락 수집 실패, 단일 프로세스로 처리: {e}")
+        
+        word_contexts = {}
+        for text in all_texts:
+            words_in_text = re.findall(r'[가-힣]{2,8}', text)
+            for word in words_in_text:
+                cleaned = self.remove_particles(word)
+                if cleaned in targets:
+                    if cleaned not in word_contexts:
+                        word_contexts[cleaned] = []
+                    word_contexts[cleaned].append(text[:200])
+        return word_contexts
+    
+    def dictionary_filter_candidates(self, prefiltered: Dict, use_naver: bool = True,
+                                     nlp_analysis_count: int = 2000) -> List[Dict]:
+        """2단계: 네이버 사전 확인 (표준어 제외) 후 NLP 분석 대상 선정"""
+        filtered_by_block = prefiltered['candidates']
+        word_contexts = prefiltered['contexts']
+        
         # 네이버 사전 확인 (배치 처리)
         naver_results = {}
         if use_naver and filtered_by_block:
@@ -1082,6 +1135,16 @@ class Crawler:
             pre_nlp_candidates = pre_nlp_candidates[:nlp_analysis_count]
             print(f"[필터링] NLP 분석 대상: 상위 {nlp_analysis_count}개로 제한 (빈도순)")
         
+        self._save_naver_dict_cache()
+        
+        return pre_nlp_candidates
+    
+    def classify_candidates(self, pre_nlp_candidates: List[Dict], nlp_threshold: float = 0.41,
+                            raise_errors: bool = False) -> List[Dict]:
+        """3~5단계: NLP 분류 → 확률 임계값 필터 → 확률 기준 정렬
+        
+        raise_errors: NLP 분석 실패 시 빈 결과 대신 예외 발생 (체크포인트 사용 시 - 빈 결과가 저장되지 않도록)
+        """
         # 3단계: NLP 분류기로 단어 분석 (배치 처리)
         nlp_results = {}
         if self.nlp_classifier and pre_nlp_candidates:
@@ -1111,6 +1174,8 @@ class Crawler:
                 print(f"[필터링] NLP 분석 완료: {len(nlp_results)}개 결과")
             except Exception as e:
                 print(f"[필터링] NLP 배치 분석 실패: {e}")
+                if raise_errors:
+                    raise
                 # NLP 실패 시 빈 결과 반환
                 return []
         else:
@@ -1146,7 +1211,10 @@ class Crawler:
         # 5단계: 확률 기준으로 정렬
         filtered_by_nlp.sort(key=lambda x: x['nlp_probability'], reverse=True)
         
-        # 5.5단계: GPT 욕설 필터 적용 (가능한 경우)
+        return filtered_by_nlp
+    
+    def moderate_candidates(self, filtered_by_nlp: List[Dict], target_count: int = 30) -> List[Dict]:
+        """5.5단계: GPT 욕설 필터 적용 후 최종 후보 구성 (점수 계산)"""
         final_candidates = self._filter_profane_candidates(filtered_by_nlp, target_count)
         
         # 최종 결과 구성
@@ -1178,21 +1246,213 @@ class Crawler:
                 prob = item.get('nlp_probability', 0.0)
                 print(f"  {idx:2d}. {item['word']} - NLP 확률 {prob:.3f}")
         
-        if self._naver_cache_dirty:
-            self._save_naver_dict_cache()
-            self._naver_cache_dirty = False
-        
         return candidates
     
-    def crawl_and_analyze(self, use_enhanced_filter: bool = True) -> List[Dict]:
-        """ 크롤링 및 분석 실행 (디시인사이드 전용)"""
+    def enhanced_filter_slang_candidates(
+        self, 
+        word_counts: Counter, 
+        all_texts: List[str],
+        use_naver: bool = True,
+        use_gpt: bool = False,  # 기본값을 False로 변경 (필터링에서 GPT 비활성화)
+        min_count: int = 2,
+        target_count: int = 30,  # 상위 30개 반환
+        nlp_analysis_count: int = 2000,  # NLP로 분석할 단어 개수
+        nlp_threshold: float = 0.41  # NLP 확률 임계값
+    ) -> List[Dict]:
+        """
+        필터링: 네이버 사전 + NLP 확률 기반 필터링
+        
+        프로세스:
+        1. 기본 필터링 (common_words, 패턴 제외)
+        1.5. 네이버 사전 전 사전 필터링 (빈도수, 패턴, 길이 등) - API 호출 수 감소
+        1.6. 포함 관계 필터링 (짧은 단어를 포함한 더 긴 단어구 제거) - API 호출 수 감소
+        2. 네이버 사전 확인 (표준어 제외)
+        3. NLP로 분석 (배치 처리, 최대 nlp_analysis_count개)
+        4. 확률 0.41 미만 제외
+        5. 확률 기준으로 상위 30개 선택
+        """
+        prefiltered = self.prefilter_candidates(word_counts, all_texts, min_count=min_count)
+        pre_nlp_candidates = self.dictionary_filter_candidates(
+            prefiltered, use_naver=use_naver, nlp_analysis_count=nlp_analysis_count
+        )
+        filtered_by_nlp = self.classify_candidates(pre_nlp_candidates, nlp_threshold=nlp_threshold)
+        return self.moderate_candidates(filtered_by_nlp, target_count=target_count)
+    
+    def generate_meanings(self, enhanced_candidates: List[Dict], posts: List[Dict]) -> List[Dict]:
+        """의미 생성 (수동 사전 → 캐시 → GPT 배치) 후 최종 결과 구성"""
+        scored_slangs = []
+        # 수동 의미 사전 (/meanings/bulk 또는 파일 수정이 다음 크롤링에 바로 반영되도록 매번 조회)
+        manual_meanings = get_manual_meanings_service().get()
+        print(f"[의미사전] 수동 의미 {len(manual_meanings)}개 로드 (예문 포함)")
+        
+        # 의미 생성 배치 처리 준비
+        from meaning_extractor import MeaningExtractor
+        from meaning_engine import MeaningEngine
+        extractor = MeaningExtractor(openai_client=self.openai_client)
+        
+        # 배치 입력 구성 (컨텍스트 최소화)
+        batch_items = []
+        for candidate in enhanced_candidates:
+            word = candidate['word']
+            contexts = candidate.get('contexts', [])
+            # 캐시에 없을 때만 배치에 포함
+            # 수동 의미 사전에 있으면 배치 제외
+            if manual_meanings.get(word):
+                continue
+            if not self.meaning_cache.get(word):
+                # 컨텍스트 최소화: 첫 번째 컨텍스트만 사용 (토큰 절약)
+                batch_items.append({
+                    'word': word,
+                    'contexts': [contexts[0]] if contexts else []
+                })
+        
+        batch_results = {}
+        if self.openai_client and batch_items:
+            # 예상 토큰 수에 맞춘 묶음을 분당 요청 한도 안에서 동시에 요청 (빠진 단어는 다시 요청)
+            # 묶음 결과는 도착하는 대로 의미 캐시에 저장
+            engine = MeaningEngine(
+                extractor,
+                on_results=lambda found: self._save_meaning_cache(
+                    {word: (meaning, True) for word, meaning in found.items()}
+                )
+            )
+            batch_results = engine.generate(batch_items)
+            # 결과를 파일로 저장
+            try:
+                import datetime
+                data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+                data_dir = os.path.abspath(data_dir)
+                os.makedirs(data_dir, exist_ok=True)
+                ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+                out_path = os.path.join(data_dir, f'meanings_{ts}.json')
+                with open(out_path, 'w', encoding='utf-8') as f:
+                    json.dump(batch_results, f, ensure_ascii=False, indent=2)
+                print(f"[의미추출] 배치 결과 저장: {out_path}")
+            except Exception as e:
+                print(f"[의미추출] 배치 결과 파일 저장 실패: {e}")
+        
+        #  필터링 결과 추가 (수동 사전/배치 결과 적용)
+        for candidate in enhanced_candidates:
+            word = candidate['word']
+            contexts = candidate.get('contexts', [])
+            meaning = f'{word}의 의미 (분석 중)'
+            gpt_meaning_success = None
+            
+            cached = self.meaning_cache.get(word)
+            if cached:
+                if isinstance(cached, tuple):
+                    meaning, gpt_meaning_success = cached
+                else:
+                    meaning = cached
+            else:
+                # 수동 의미 우선 적용
+                manual_data = manual_meanings.get(word)
+                if manual_data:
+                    if isinstance(manual_data, dict):
+                        meaning = manual_data.get('meaning', f'{word}의 의미 (분석 중)')
+                    else:
+                        # 구 형식 호환
+                        meaning = str(manual_data)
+                    gpt_meaning_success = None  # 수동 입력
+                    self.meaning_cache[word] = (meaning, gpt_meaning_success)
+                elif word in batch_results:
+                    meaning = batch_results[word]
+                    gpt_meaning_success = True if meaning and meaning != f'{word}의 의미 (분석 중)' else False
+                    self.meaning_cache[word] = (meaning, gpt_meaning_success)
+                else:
+                    # GPT 비활성화 또는 배치 실패 시 기본값 유지
+                    pass
+            
+            # 예문 설정 (수동 예문 우선)
+            final_examples = contexts[:3]
+            manual_data = manual_meanings.get(word)
+            if manual_data and isinstance(manual_data, dict):
+                manual_examples = manual_data.get('examples', [])
+                if manual_examples and isinstance(manual_examples, list) and len(manual_examples) > 0:
+                    final_examples = manual_examples
+            
+            scored_slangs.append({
+                'word': word,
+                'count': candidate['count'],
+                'score': candidate['score'],
+                'contexts': contexts,
+                'meaning': meaning,
+                'examples': final_examples,
+                'method': 'enhanced',
+                'is_standard_word': False,
+                'gpt_probability': candidate.get('gpt_probability'),
+                'gpt_meaning_success': gpt_meaning_success,
+                'nlp_probability': candidate.get('nlp_probability')
+            })
+        
+        # 중복 제거 및 정렬
+        unique_slangs = {}
+        for slang in scored_slangs:
+            word = slang['word']
+            if word not in unique_slangs or slang['score'] > unique_slangs[word]['score']:
+                unique_slangs[word] = slang
+        
+        result = list(unique_slangs.values())
+        # NLP 확률 우선 정렬 (동률 시 사용 횟수, 점수 순)
+        result.sort(
+            key=lambda x: (
+                x.get('nlp_probability', 0.0),
+                x.get('count', 0),
+                x.get('score', 0)
+            ),
+            reverse=True
+        )
+        
+        enhanced_count = sum(1 for s in result if s.get('method') == 'enhanced')
+        
+        print(f"\n[결과] 총 {len(result)}개 신조어 후보 발견 (중복 제거 후)")
+        if enhanced_count > 0:
+            print(f"  -  필터링: {enhanced_count}개")
+        
+        result = result[:30]  # 상위 30개 반환
+        
+        # 갤러리별 등장 횟수 (사용량 이력 테이블 기록용)
+        gallery_counts = self.count_occurrences_by_gallery(posts, [s['word'] for s in result])
+        for slang in result:
+            slang['gallery_counts'] = gallery_counts.get(slang['word'], {})
+        
+        return result
+    
+    def crawl_and_analyze(self, use_enhanced_filter: bool = True,
+                          progress: Optional[Callable[[str], None]] = None,
+                          checkpoints=None) -> List[Dict]:
+        """ 크롤링 및 분석 실행 (디시인사이드 전용)
+        
+        단계: fetch → tokenize → prefilter → dictionary → classify → moderate → meanings
+        
+        progress: 단계를 시작할 때 호출되는 콜백 (단계 이름)
+        checkpoints: load(stage)/save(stage, data)를 가진 저장소. 주어지면 각 단계 결과를 저장하고,
+                     이미 저장된 단계는 다시 실행하지 않습니다 (중단된 작업 이어서 실행).
+                     이 경우 오류는 빈 결과 대신 예외로 전달됩니다.
+        """
         print(" 크롤링 시작...")
+        report = progress or (lambda stage: None)
+        
+        def run_stage(stage: str, compute: Callable[[], object]):
+            if checkpoints is not None:
+                saved = checkpoints.load(stage)
+                if saved is not None:
+                    print(f"[체크포인트] '{stage}' 단계 저장 결과 사용 (건너뜀)")
+                    return saved
+            report(stage)
+            data = compute()
+            if checkpoints is not None:
+                checkpoints.save(stage, data)
+            return data
         
         try:
             # 디시인사이드 크롤링만 실행 (게시글 내용 포함)
-            print("디시인사이드 크롤링 중... (제목 + 내용)")
-            dc_posts = self.crawl_dcinside(include_content=True, max_posts_per_gallery=15)
-            print(f"디시인사이드에서 {len(dc_posts)}개 게시물 수집")
+            def fetch():
+                print("디시인사이드 크롤링 중... (제목 + 내용)")
+                posts = self.crawl_dcinside(include_content=True, max_posts_per_gallery=15)
+                print(f"디시인사이드에서 {len(posts)}개 게시물 수집")
+                return posts
+            dc_posts = run_stage('fetch', fetch)
             
             if not dc_posts:
                 print("[WARNING] 수집된 게시물이 없습니다. 기본 크롤링을 사용하세요.")
@@ -1209,167 +1469,35 @@ class Crawler:
                 combined_text = ' '.join(text_parts)
                 if combined_text.strip():
                     all_texts.append(combined_text)
-            scored_slangs = []
             
             #  필터링만 사용
-            if use_enhanced_filter:
-                print("\n 필터링 (네이버 사전) 시작... (GPT는 의미 생성에만 사용)")
-                all_keyword_counts = self.extract_all_keywords(all_texts)
-                
-                filtered_counts = Counter(all_keyword_counts)
-                
-                #  필터링 실행 (NLP 확률 기반 필터링)
-                enhanced_candidates = self.enhanced_filter_slang_candidates(
-                    filtered_counts,
-                    all_texts,
-                    use_naver=True,
-                    use_gpt=False,  # 필터링에서는 GPT 사용 안 함 (Rate Limit 방지)
-                    min_count=self.filter_min_count,
-                    target_count=self.filter_target_count,  # 상위 N개 반환
-                    nlp_analysis_count=2000,  # NLP로 분석할 단어 개수
-                    nlp_threshold=self.filter_nlp_threshold  # NLP 확률 임계값
-                )
-                
-                # 의미 생성 배치 처리 준비
-                from meaning_extractor import MeaningExtractor
-                extractor = MeaningExtractor(openai_client=self.openai_client)
-                
-                # 배치 입력 구성 (컨텍스트 최소화)
-                batch_items = []
-                for candidate in enhanced_candidates:
-                    word = candidate['word']
-                    contexts = candidate.get('contexts', [])
-                    # 캐시에 없을 때만 배치에 포함
-                    # 수동 의미 사전에 있으면 배치 제외
-                    if self.manual_meanings.get(word):
-                        continue
-                    if not self.meaning_cache.get(word):
-                        # 컨텍스트 최소화: 첫 번째 컨텍스트만 사용 (토큰 절약)
-                        batch_items.append({
-                            'word': word,
-                            'contexts': [contexts[0]] if contexts else []
-                        })
-                
-                batch_results = {}
-                if self.openai_client and batch_items:
-                    # 배치 호출 (RPM=3 준수를 위해 5개 단위로 분할, 각 배치 사이 30초 대기)
-                    batch_results = {}
-                    chunk_size = 5  # RPM 제한 준수를 위해 5개로 줄임
-                    import math
-                    for i in range(0, len(batch_items), chunk_size):
-                        chunk = batch_items[i:i+chunk_size]
-                        print(f"[의미추출] 배치 처리 중 ({i//chunk_size + 1}/{(len(batch_items)-1)//chunk_size + 1}): {len(chunk)}개 단어")
-                        res = extractor.extract_meanings_batch(chunk)
-                        if res:
-                            batch_results.update(res)
-                            print(f"[의미추출] 배치 성공: {len(res)}개 의미 추출")
-                        else:
-                            print(f"[의미추출] 배치 실패 또는 Rate Limit - 다음 배치까지 대기")
-                            # Rate Limit 발생 시 즉시 중단 (재시도 없음)
-                            if i + chunk_size < len(batch_items):
-                                break
-                        
-                        # RPM=3 준수: 각 배치 사이 최소 30초 대기
-                        if i + chunk_size < len(batch_items):
-                            wait_time = 10
-                            print(f"[의미추출] RPM 제한 준수를 위해 {wait_time}초 대기...")
-                            time.sleep(wait_time)
-                    # 결과를 파일로 저장
-                    try:
-                        import json, datetime
-                        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-                        data_dir = os.path.abspath(data_dir)
-                        os.makedirs(data_dir, exist_ok=True)
-                        ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-                        out_path = os.path.join(data_dir, f'meanings_{ts}.json')
-                        with open(out_path, 'w', encoding='utf-8') as f:
-                            json.dump(batch_results, f, ensure_ascii=False, indent=2)
-                        print(f"[의미추출] 배치 결과 저장: {out_path}")
-                    except Exception as e:
-                        print(f"[의미추출] 배치 결과 파일 저장 실패: {e}")
-                
-                #  필터링 결과 추가 (수동 사전/배치 결과 적용)
-                for candidate in enhanced_candidates:
-                    word = candidate['word']
-                    contexts = candidate.get('contexts', [])
-                    meaning = f'{word}의 의미 (분석 중)'
-                    gpt_meaning_success = None
-                    
-                    cached = self.meaning_cache.get(word)
-                    if cached:
-                        if isinstance(cached, tuple):
-                            meaning, gpt_meaning_success = cached
-                        else:
-                            meaning = cached
-                    else:
-                        # 수동 의미 우선 적용
-                        manual_data = self.manual_meanings.get(word)
-                        if manual_data:
-                            if isinstance(manual_data, dict):
-                                meaning = manual_data.get('meaning', f'{word}의 의미 (분석 중)')
-                            else:
-                                # 구 형식 호환
-                                meaning = str(manual_data)
-                            gpt_meaning_success = None  # 수동 입력
-                            self.meaning_cache[word] = (meaning, gpt_meaning_success)
-                        elif word in batch_results:
-                            meaning = batch_results[word]
-                            gpt_meaning_success = True if meaning and meaning != f'{word}의 의미 (분석 중)' else False
-                            self.meaning_cache[word] = (meaning, gpt_meaning_success)
-                        else:
-                            # GPT 비활성화 또는 배치 실패 시 기본값 유지
-                            pass
-                    
-                    # 예문 설정 (수동 예문 우선)
-                    final_examples = contexts[:3]
-                    manual_data = self.manual_meanings.get(word)
-                    if manual_data and isinstance(manual_data, dict):
-                        manual_examples = manual_data.get('examples', [])
-                        if manual_examples and isinstance(manual_examples, list) and len(manual_examples) > 0:
-                            final_examples = manual_examples
-                    
-                    scored_slangs.append({
-                        'word': word,
-                        'count': candidate['count'],
-                        'score': candidate['score'],
-                        'contexts': contexts,
-                        'meaning': meaning,
-                        'examples': final_examples,
-                        'method': 'enhanced',
-                        'is_standard_word': False,
-                        'gpt_probability': candidate.get('gpt_probability'),
-                        'gpt_meaning_success': gpt_meaning_success,
-                        'nlp_probability': candidate.get('nlp_probability')
-                    })
-            
-            # 중복 제거 및 정렬
-            unique_slangs = {}
-            for slang in scored_slangs:
-                word = slang['word']
-                if word not in unique_slangs or slang['score'] > unique_slangs[word]['score']:
-                    unique_slangs[word] = slang
-            
-            result = list(unique_slangs.values())
-            # NLP 확률 우선 정렬 (동률 시 사용 횟수, 점수 순)
-            result.sort(
-                key=lambda x: (
-                    x.get('nlp_probability', 0.0),
-                    x.get('count', 0),
-                    x.get('score', 0)
-                ),
-                reverse=True
-            )
+            if not use_enhanced_filter:
+                return []
             
-            enhanced_count = sum(1 for s in result if s.get('method') == 'enhanced')
+            print("\n 필터링 (네이버 사전) 시작... (GPT는 의미 생성에만 사용)")
+            keyword_counts = run_stage('tokenize', lambda: dict(self.extract_all_keywords(all_texts)))
             
-            print(f"\n[결과] 총 {len(result)}개 신조어 후보 발견 (중복 제거 후)")
-            if enhanced_count > 0:
-                print(f"  -  필터링: {enhanced_count}개")
+            #  필터링 실행 (NLP 확률 기반 필터링, 단계별로 저장)
+            prefiltered = run_stage('prefilter', lambda: self.prefilter_candidates(
+                Counter(keyword_counts), all_texts, min_count=self.filter_min_count
+            ))
+            pre_nlp_candidates = run_stage('dictionary', lambda: self.dictionary_filter_candidates(
+                prefiltered, use_naver=True, nlp_analysis_count=2000  # NLP로 분석할 단어 개수
+            ))
+            filtered_by_nlp = run_stage('classify', lambda: self.classify_candidates(
+                pre_nlp_candidates, nlp_threshold=self.filter_nlp_threshold,  # NLP 확률 임계값
+                raise_errors=checkpoints is not None
+            ))
+            enhanced_candidates = run_stage('moderate', lambda: self.moderate_candidates(
+                filtered_by_nlp, target_count=self.filter_target_count  # 상위 N개 반환
+            ))
             
-            return result[:30]  # 상위 30개 반환
+            return run_stage('meanings', lambda: self.generate_meanings(enhanced_candidates, dc_posts))
             
         except Exception as e:
             print(f"[ERROR]  크롤링 실패: {e}")
             import traceback
             traceback.print_exc()
+            if checkpoints is not None:
+                raise
             return []
@@ -1,8 +1,37 @@
 import sqlite3
 import json
 import os
-from datetime import datetime
-from typing import List, Dict, Optional
+import threading
+from datetime import datetime, timedelta
+import base64
+from typing import List, Dict, Optional, Tuple
+from hangul import decompose, jamo_ngrams, dice_similarity
+
+# 랭킹 응답에서 선택 가능한 필드
+RANKING_FIELDS = ('word', 'meaning', 'examples', 'usage_count', 'method', 'updated_at')
+
+# 추세 상태 컬럼 (TrendEngine과 주고받는 순서)
+TREND_STATE_COLUMNS = ('word', 'ewma_mean', 'ewma_var', 'cost_base', 'cost_burst', 'last_count',
+                       'z_score', 'burst_state', 'burst_strength', 'trend_score', 'observations',
+                       'first_seen', 'updated_at')
+
+
+def encode_ranking_cursor(usage_count: int, updated_at, word: str) -> str:
+    """랭킹 키셋 커서 인코딩 (URL-safe base64 JSON)"""
+    raw = json.dumps([usage_count, str(updated_at) if updated_at is not None else None, word],
+                     ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_ranking_cursor(cursor: str) -> Tuple[int, str, str]:
+    """랭킹 키셋 커서 디코딩 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        usage_count, updated_at, word = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return int(usage_count), updated_at, str(word)
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
 
 class Database:
     def __init__(self, db_path: str = None):
@@ -15,11 +44,43 @@ class Database:
             self.db_path = os.path.join(data_dir, "slangs.db")
         else:
             self.db_path = db_path
+        # 스레드별 연결 재사용 (요청마다 connect/close 하지 않음)
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
         self.init_database()
     
+    def _get_connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (없으면 생성 후 PRAGMA 설정)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # cached_statements: 같은 SQL 문자열의 prepared statement 재사용
+            conn = sqlite3.connect(self.db_path, timeout=30, cached_statements=256,
+                                   check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA cache_size=-16000')  # 약 16MB
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def close(self):
+        """열려 있는 모든 연결 종료"""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._connections = []
+        self._local = threading.local()
+    
     def init_database(self):
         """데이터베이스 초기화"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         # 신조어 테이블
@@ -77,24 +138,257 @@ class Database:
                 like_count INTEGER,
                 caption_match_times TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                stats_updated_at TIMESTAMP,
                 UNIQUE(slang_word, video_id)
             )
         ''')
         
+        # 기존 테이블에 통계 갱신 시각 컬럼 추가 (마이그레이션)
+        try:
+            cursor.execute('ALTER TABLE slang_videos ADD COLUMN stats_updated_at TIMESTAMP')
+        except sqlite3.OperationalError:
+            pass  # 이미 컬럼이 있으면 무시
+        
+        # 데이터 버전 (랭킹 스냅샷 무효화용, 쓰기 트랜잭션 안에서 증가)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS app_meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        
+        # 신조어 등장 이력 (크롤링 1회 x 갤러리별 등장 횟수)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS slang_occurrences (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                crawl_id TEXT NOT NULL,
+                word TEXT NOT NULL,
+                gallery TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                observed_at TIMESTAMP NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_slang_occurrences_word ON slang_occurrences(word, observed_at)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_slang_occurrences_crawl ON slang_occurrences(crawl_id)
+        ''')
+        
+        # 시간/일 단위 사용량 집계 (등장 이력 기록 시 증분 갱신)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS slang_usage_hourly (
+                bucket TEXT NOT NULL,
+                word TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, word)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS slang_usage_daily (
+                bucket TEXT NOT NULL,
+                word TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, word)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_slang_usage_daily_word ON slang_usage_daily(word, bucket)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_slang_usage_hourly_word ON slang_usage_hourly(word, bucket)
+        ''')
+        
+        # 검색 인덱스: 단어/의미/예문 전문 검색 (FTS5, rowid = slangs.id)
+        self.fts_enabled = True
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS slangs_fts USING fts5(
+                    word, meaning, examples, prefix='1 2'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            self.fts_enabled = False
+            print(f"[검색 인덱스] FTS5를 사용할 수 없어 전문 검색이 비활성화됩니다: {e}")
+        
+        # 검색 인덱스: 자모 문자열(접두어 자동완성)과 자모 bigram(오타 허용 검색)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS slang_jamo (
+                word TEXT PRIMARY KEY,
+                jamo TEXT NOT NULL,
+                gram_count INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_slang_jamo_jamo ON slang_jamo(jamo)
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS slang_ngrams (
+                gram TEXT NOT NULL,
+                word TEXT NOT NULL,
+                PRIMARY KEY (gram, word)
+            ) WITHOUT ROWID
+        ''')
+        
+        # 단어별 추세 상태 (크롤링마다 전체 단어를 한 번에 갱신 - 이력을 다시 읽지 않음)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS slang_trends (
+                word TEXT PRIMARY KEY,
+                ewma_mean REAL NOT NULL DEFAULT 0,
+                ewma_var REAL NOT NULL DEFAULT 0,
+                cost_base REAL NOT NULL DEFAULT 0,
+                cost_burst REAL NOT NULL DEFAULT 0,
+                last_count INTEGER NOT NULL DEFAULT 0,
+                z_score REAL NOT NULL DEFAULT 0,
+                burst_state INTEGER NOT NULL DEFAULT 0,
+                burst_strength REAL NOT NULL DEFAULT 0,
+                trend_score REAL NOT NULL DEFAULT 0,
+                observations INTEGER NOT NULL DEFAULT 0,
+                first_seen TIMESTAMP,
+                updated_at REAL NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_slang_trends_score ON slang_trends(trend_score)
+        ''')
+        
+        # 크롤링 작업 (진행 상황 기록, active=1인 작업은 동시에 하나만 존재)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_jobs (
+                id TEXT PRIMARY KEY,
+                trigger TEXT NOT NULL,
+                status TEXT NOT NULL,
+                stage TEXT,
+                stage_index INTEGER NOT NULL DEFAULT 0,
+                stage_total INTEGER NOT NULL DEFAULT 0,
+                message TEXT,
+                result_count INTEGER,
+                error TEXT,
+                active INTEGER,
+                created_at TIMESTAMP NOT NULL,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP,
+                heartbeat_at TIMESTAMP NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_crawl_jobs_active ON crawl_jobs(active) WHERE active IS NOT NULL
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_crawl_jobs_created ON crawl_jobs(created_at)
+        ''')
+        # 크롤링 단계별 결과 (중단된 작업을 마지막 완료 단계부터 이어서 실행)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_job_checkpoints (
+                job_id TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (job_id, stage)
+            )
+        ''')
+        
+        # 일회성 데이터 마이그레이션 (app_meta의 schema_version으로 한 번만 실행)
+        row = cursor.execute("SELECT value FROM app_meta WHERE key = 'schema_version'").fetchone()
+        schema_version = row[0] if row else 0
+        if schema_version < 1:
+            # v1: 랭킹 정렬 키 정규화 (NULL/0 → 1, 이전 버전이 남긴 행만 - 쓰기 경로는 항상 1 이상 저장)
+            cursor.execute('''
+                UPDATE slangs SET usage_count = 1 WHERE usage_count IS NULL OR usage_count < 1
+            ''')
+            cursor.execute('''
+                INSERT INTO app_meta (key, value) VALUES ('schema_version', 1)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            ''')
+        
         # 인덱스 추가
+        # 랭킹 정렬 (usage_count DESC, updated_at DESC, word DESC) 순서 인덱스
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_slangs_ranking ON slangs(usage_count, updated_at, word)
+        ''')
+        # 기간 필터용 인덱스
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_slangs_updated_at ON slangs(updated_at)
+        ''')
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_slang_videos_word ON slang_videos(slang_word)
         ''')
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_slang_videos_video_id ON slang_videos(video_id)
         ''')
+        # 통계 갱신 대상 선택 (오래된 순)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_slang_videos_stats ON slang_videos(stats_updated_at, video_id)
+        ''')
         
         conn.commit()
-        conn.close()
+        
+        # 기존 데이터에 검색 인덱스가 없으면 한 번 재구축
+        self._backfill_search_index()
+    
+    def _index_slangs(self, cursor: sqlite3.Cursor, words: List[str]):
+        """검색 인덱스 증분 갱신 (호출자 트랜잭션 안에서 실행)"""
+        if not words:
+            return
+        rows = []
+        for word in words:
+            row = cursor.execute(
+                'SELECT id, word, meaning, examples FROM slangs WHERE word = ?', (word,)
+            ).fetchone()
+            if row:
+                rows.append(row)
+        
+        if self.fts_enabled:
+            fts_rows = []
+            for slang_id, word, meaning, examples_json in rows:
+                try:
+                    examples = json.loads(examples_json) if examples_json else []
+                except (TypeError, ValueError):
+                    examples = []
+                fts_rows.append((slang_id, word, meaning or '', ' '.join(str(e) for e in examples)))
+            cursor.executemany('DELETE FROM slangs_fts WHERE rowid = ?', [(r[0],) for r in fts_rows])
+            cursor.executemany(
+                'INSERT INTO slangs_fts (rowid, word, meaning, examples) VALUES (?, ?, ?, ?)', fts_rows
+            )
+        
+        # 자모/ngram은 단어 자체에만 의존하므로 새 단어만 추가
+        jamo_rows = []
+        gram_rows = []
+        for _, word, _, _ in rows:
+            grams = jamo_ngrams(word)
+            jamo_rows.append((word, decompose(word), len(grams)))
+            gram_rows.extend((gram, word) for gram in grams)
+        cursor.executemany(
+            'INSERT OR IGNORE INTO slang_jamo (word, jamo, gram_count) VALUES (?, ?, ?)', jamo_rows
+        )
+        cursor.executemany('INSERT OR IGNORE INTO slang_ngrams (gram, word) VALUES (?, ?)', gram_rows)
+    
+    def _backfill_search_index(self):
+        """검색 인덱스가 비어 있는 기존 단어들을 색인"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        missing = [row[0] for row in cursor.execute('''
+            SELECT word FROM slangs WHERE word NOT IN (SELECT word FROM slang_jamo)
+        ''').fetchall()]
+        if self.fts_enabled:
+            fts_count = cursor.execute('SELECT COUNT(*) FROM slangs_fts').fetchone()[0]
+            slang_count = cursor.execute('SELECT COUNT(*) FROM slangs').fetchone()[0]
+            if fts_count != slang_count:
+                cursor.execute('DELETE FROM slangs_fts')
+                missing = [row[0] for row in cursor.execute('SELECT word FROM slangs').fetchall()]
+        if not missing:
+            return
+        try:
+            self._index_slangs(cursor, missing)
+            conn.commit()
+            print(f"[검색 인덱스] {len(missing)}개 단어 색인 완료")
+        except Exception as e:
+            conn.rollback()
+            print(f"[검색 인덱스] 색인 실패: {e}")
     
     def create_user(self, username: str, password: str, email: str = None) -> bool:
         """사용자 생성"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         try:
@@ -105,16 +399,16 @@ class Database:
             conn.commit()
             return True
         except sqlite3.IntegrityError:
+            conn.rollback()
             return False
         except Exception as e:
+            conn.rollback()
             print(f"Error creating user: {e}")
             return False
-        finally:
-            conn.close()
     
     def get_user(self, username: str) -> Optional[Dict]:
         """사용자 조회 (사용자 이름으로)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -123,7 +417,6 @@ class Database:
         ''', (username,))
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return {
@@ -137,7 +430,7 @@ class Database:
     
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """사용자 조회 (이메일로)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -146,7 +439,6 @@ class Database:
         ''', (email,))
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return {
@@ -160,7 +452,7 @@ class Database:
     
     def get_user_by_id(self, user_id: int) -> Optional[Dict]:
         """사용자 ID로 조회"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -169,7 +461,6 @@ class Database:
         ''', (user_id,))
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return {
@@ -182,7 +473,7 @@ class Database:
     
     def toggle_newsletter_subscription(self, user_id: int) -> bool:
         """뉴스레터 구독 토글"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         try:
@@ -200,74 +491,222 @@ class Database:
             conn.commit()
             return True
         except Exception as e:
+            conn.rollback()
             print(f"Error toggling subscription: {e}")
             return False
-        finally:
-            conn.close()
     
     def get_newsletter_subscription_status(self, user_id: int) -> bool:
         """뉴스레터 구독 상태 조회"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         cursor.execute('SELECT newsletter_subscribed FROM users WHERE id = ?', (user_id,))
         row = cursor.fetchone()
-        conn.close()
         
         return bool(row[0]) if row else False
     
     def add_slang(self, word: str, meaning: str = "", examples: List[str] = None, 
                   usage_count: int = 1, method: str = 'enhanced') -> bool:
-        """신조어 추가"""
-        if examples is None:
-            examples = []
-            
-        conn = sqlite3.connect(self.db_path)
+        """신조어 추가 (단일 단어용 - add_slangs_many 사용)"""
+        return self.add_slangs_many([{
+            'word': word,
+            'meaning': meaning,
+            'examples': examples or [],
+            'count': usage_count,
+            'method': method
+        }]) == 1
+    
+    def add_slangs_many(self, slangs: List[Dict], crawl_id: Optional[str] = None,
+                        raise_errors: bool = False) -> int:
+        """신조어 일괄 업서트 (한 트랜잭션)
+        
+        slangs: [{"word", "meaning", "examples", "count", "method", "gallery_counts"}] (크롤링 결과 형식)
+        usage_count 병합 규칙은 기존과 동일:
+        - 기존 값이 없거나 기본값(0/1)이면 새 값으로 교체
+        - 둘 다 유효한 값이면 더 큰 값 사용
+        crawl_id가 주어지면 등장 이력과 시간/일 집계도 같은 트랜잭션에서 기록합니다.
+        raise_errors가 True면 실패 시 롤백 후 예외를 다시 발생시킵니다 (크롤링 작업이 실패로 기록되도록).
+        
+        Returns:
+            저장된 단어 수 (실패 시 0)
+        """
+        now = datetime.now()
+        rows = []
+        for slang in slangs:
+            word = slang.get('word')
+            if not word:
+                continue
+            usage_count = slang.get('count', slang.get('usage_count', 1)) or 1
+            rows.append((
+                word,
+                slang.get('meaning') or '',
+                json.dumps(slang.get('examples') or [], ensure_ascii=False),
+                usage_count if usage_count > 0 else 1,
+                slang.get('method') or 'enhanced',
+                now
+            ))
+        if not rows:
+            return 0
+        
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         try:
-            # 기존 단어가 있으면 usage_count 확인
-            cursor.execute('SELECT usage_count FROM slangs WHERE word = ?', (word,))
-            existing = cursor.fetchone()
-            
-            if existing:
-                existing_count = existing[0]
-                # 기존 단어면 usage_count를 업데이트
-                # 기존 값이 1 (기본값)이면 무조건 새로운 값으로 교체
-                if existing_count is None or existing_count == 0 or existing_count == 1:
-                    # 기존 값이 기본값이면 무조건 새로운 값으로 교체
-                    new_count = usage_count if usage_count > 0 else 1
-                    print(f"[DB 업데이트] '{word}': 기존값 {existing_count} -> 새값 {usage_count}로 교체")
-                else:
-                    # 둘 다 유효한 값이면 더 큰 값 사용
-                    new_count = max(existing_count, usage_count)
-                    if new_count != existing_count:
-                        print(f"[DB 업데이트] '{word}': {existing_count} -> {new_count}로 업데이트")
-                cursor.execute('''
-                    UPDATE slangs 
-                    SET meaning = ?, examples = ?, usage_count = ?, method = ?, updated_at = ?
-                    WHERE word = ?
-                ''', (meaning, json.dumps(examples, ensure_ascii=False), new_count, method, datetime.now(), word))
-            else:
-                # 새 단어면 추가
-                actual_usage_count = usage_count if usage_count > 0 else 1
-                cursor.execute('''
-                    INSERT INTO slangs (word, meaning, examples, usage_count, method, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (word, meaning, json.dumps(examples, ensure_ascii=False), actual_usage_count, method, datetime.now()))
-                print(f"[DB 추가] '{word}': {actual_usage_count}회로 저장")
-            
+            # 한 트랜잭션으로 기록 → 읽는 쪽은 이전 랭킹 또는 완성된 랭킹만 보게 됨
+            cursor.executemany('''
+                INSERT INTO slangs (word, meaning, examples, usage_count, method, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(word) DO UPDATE SET
+                    meaning = excluded.meaning,
+                    examples = excluded.examples,
+                    usage_count = CASE
+                        WHEN slangs.usage_count IS NULL OR slangs.usage_count IN (0, 1)
+                            THEN excluded.usage_count
+                        ELSE MAX(slangs.usage_count, excluded.usage_count)
+                    END,
+                    method = excluded.method,
+                    updated_at = excluded.updated_at
+            ''', rows)
+            if crawl_id:
+                self._record_occurrences(cursor, crawl_id, slangs, now)
+            self._index_slangs(cursor, [row[0] for row in rows])
+            self._bump_data_version(cursor, 'ranking')
             conn.commit()
-            return True
+            print(f"[DB 저장] {len(rows)}개 신조어 일괄 저장")
+            return len(rows)
         except Exception as e:
-            print(f"Error adding slang: {e}")
-            return False
-        finally:
-            conn.close()
+            conn.rollback()
+            print(f"Error adding slangs: {e}")
+            if raise_errors:
+                raise
+            return 0
+    
+    def _bump_data_version(self, cursor: sqlite3.Cursor, key: str):
+        """데이터 버전 증가 (호출자 트랜잭션 안에서 실행 → 다른 프로세스도 변경을 감지)"""
+        cursor.execute('''
+            INSERT INTO app_meta (key, value) VALUES (?, 1)
+            ON CONFLICT(key) DO UPDATE SET value = value + 1
+        ''', (key,))
+    
+    def get_data_version(self, key: str = 'ranking') -> int:
+        """데이터 버전 조회 (변경 감지용 포인트 조회)"""
+        row = self._get_connection().execute('SELECT value FROM app_meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else 0
+    
+    def _record_occurrences(self, cursor: sqlite3.Cursor, crawl_id: str, slangs: List[Dict],
+                            observed_at: datetime):
+        """등장 이력 기록 + 시간/일 집계 증분 갱신 (호출자 트랜잭션 안에서 실행)"""
+        occurrences = []
+        totals: Dict[str, int] = {}
+        for slang in slangs:
+            word = slang.get('word')
+            if not word:
+                continue
+            gallery_counts = slang.get('gallery_counts') or {}
+            if not gallery_counts:
+                # 갤러리 정보가 없으면 전체 횟수를 하나의 항목으로 기록
+                gallery_counts = {'all': slang.get('count', slang.get('usage_count', 1)) or 1}
+            for gallery, count in gallery_counts.items():
+                if count and count > 0:
+                    occurrences.append((crawl_id, word, gallery, count, observed_at))
+                    totals[word] = totals.get(word, 0) + count
+        if not occurrences:
+            return
+        
+        cursor.executemany('''
+            INSERT INTO slang_occurrences (crawl_id, word, gallery, count, observed_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', occurrences)
+        
+        hour_bucket = observed_at.strftime('%Y-%m-%d %H:00')
+        day_bucket = observed_at.strftime('%Y-%m-%d')
+        for table, bucket in (('slang_usage_hourly', hour_bucket), ('slang_usage_daily', day_bucket)):
+            cursor.executemany(f'''
+                INSERT INTO {table} (bucket, word, count) VALUES (?, ?, ?)
+                ON CONFLICT(bucket, word) DO UPDATE SET count = count + excluded.count
+            ''', [(bucket, word, total) for word, total in totals.items()])
+    
+    def _period_start_bucket(self, period: str) -> Optional[str]:
+        """기간 필터의 시작 일 버킷 (로컬 시간 기준, 오늘 포함)"""
+        days = {'today': 1, 'week': 7, 'month': 30}.get(period)
+        if not days:
+            return None
+        return (datetime.now() - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+    
+    def has_usage_history(self) -> bool:
+        """사용량 집계 데이터 존재 여부"""
+        row = self._get_connection().execute('SELECT 1 FROM slang_usage_daily LIMIT 1').fetchone()
+        return row is not None
+    
+    def get_usage_history(self, word: str, granularity: str = 'daily', limit: int = 30) -> List[Dict]:
+        """단어별 사용량 시계열 조회 (최근 버킷부터)
+        
+        Args:
+            granularity: 'hourly' 또는 'daily'
+        """
+        table = 'slang_usage_hourly' if granularity == 'hourly' else 'slang_usage_daily'
+        cursor = self._get_connection().execute(f'''
+            SELECT bucket, count FROM {table}
+            WHERE word = ?
+            ORDER BY bucket DESC
+            LIMIT ?
+        ''', (word, limit))
+        return [{'bucket': bucket, 'count': count} for bucket, count in cursor.fetchall()]
+    
+    def load_trend_state(self) -> List[Tuple]:
+        """전체 단어의 추세 상태 (TREND_STATE_COLUMNS 순서의 튜플 목록)"""
+        columns = ', '.join(TREND_STATE_COLUMNS)
+        return self._get_connection().execute(f'SELECT {columns} FROM slang_trends').fetchall()
+    
+    def save_trend_state(self, rows: List[Tuple]) -> int:
+        """추세 상태 일괄 저장 (한 트랜잭션)"""
+        if not rows:
+            return 0
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        columns = ', '.join(TREND_STATE_COLUMNS)
+        placeholders = ', '.join('?' * len(TREND_STATE_COLUMNS))
+        try:
+            cursor.executemany(f'INSERT OR REPLACE INTO slang_trends ({columns}) VALUES ({placeholders})', rows)
+            self._bump_data_version(cursor, 'trends')
+            conn.commit()
+            return len(rows)
+        except Exception as e:
+            conn.rollback()
+            print(f"Error saving trend state: {e}")
+            return 0
+    
+    def get_trending(self, limit: int = 20, min_score: float = 0.0) -> List[Dict]:
+        """급상승 단어 조회 (추세 점수 내림차순)"""
+        cursor = self._get_connection().execute('''
+            SELECT t.word, s.meaning, t.last_count, t.ewma_mean, t.z_score, t.burst_state,
+                   t.burst_strength, t.trend_score, t.observations, t.first_seen
+            FROM slang_trends t
+            LEFT JOIN slangs s ON s.word = t.word
+            WHERE t.trend_score > ?
+            ORDER BY t.trend_score DESC
+            LIMIT ?
+        ''', (min_score, limit))
+        results = []
+        for row in cursor.fetchall():
+            word, meaning, count, baseline, z_score, burst_state, burst_strength, score, observations, first_seen = row
+            results.append({
+                'word': word,
+                'meaning': meaning or '',
+                'count': count,
+                'baseline': round(baseline, 3),
+                'z_score': round(z_score, 3),
+                'bursting': bool(burst_state),
+                'burst_strength': round(burst_strength, 3),
+                'trend_score': round(score, 3),
+                'is_new': observations <= 1,
+                'first_seen': first_seen
+            })
+        return results
     
     def get_slang_by_word(self, word: str) -> Optional[Dict]:
         """특정 신조어 조회"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -277,7 +716,6 @@ class Database:
         ''', (word,))
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             word, meaning, examples_json, usage_count, method, updated_at = row
@@ -292,61 +730,230 @@ class Database:
             }
         return None
     
-    def get_ranking(self, limit: int = 20, period: Optional[str] = None) -> List[Dict]:
+    def suggest_slangs(self, query: str, limit: int = 10, min_score: float = 0.4) -> List[Dict]:
+        """자동완성/오타 허용 검색
+        
+        1. 자모 접두어 일치 (입력 중인 글자도 매칭, 사용 횟수 순)
+        2. 부족하면 자모 bigram Dice 유사도 기반 근접 단어
+        3. 그래도 부족하면 의미/예문 전문 검색 (FTS5)
+        
+        Returns:
+            [{"word", "usage_count", "score", "match": "prefix"|"fuzzy"|"fulltext"}]
+        """
+        query = (query or '').strip()
+        if not query or limit <= 0:
+            return []
+        conn = self._get_connection()
+        query_grams = jamo_ngrams(query)
+        results = []
+        seen = set()
+        
+        # 1. 자모 접두어 (인덱스 범위 검색)
+        prefix = decompose(query)
+        rows = conn.execute('''
+            SELECT j.word, s.usage_count
+            FROM slang_jamo j JOIN slangs s ON s.word = j.word
+            WHERE j.jamo >= ? AND j.jamo < ?
+            ORDER BY s.usage_count DESC, j.word
+            LIMIT ?
+        ''', (prefix, prefix + '\U0010ffff', limit)).fetchall()
+        for word, usage_count in rows:
+            seen.add(word)
+            results.append({
+                'word': word,
+                'usage_count': usage_count or 1,
+                'score': round(dice_similarity(query_grams, jamo_ngrams(word)), 3),
+                'match': 'prefix'
+            })
+        
+        # 2. 자모 bigram 유사도
+        if len(results) < limit and query_grams:
+            grams = list(query_grams)
+            placeholders = ','.join('?' * len(grams))
+            rows = conn.execute(f'''
+                SELECT n.word, COUNT(*) AS shared, j.gram_count, s.usage_count
+                FROM slang_ngrams n
+                JOIN slang_jamo j ON j.word = n.word
+                JOIN slangs s ON s.word = n.word
+                WHERE n.gram IN ({placeholders})
+                GROUP BY n.word
+                ORDER BY shared DESC
+                LIMIT ?
+            ''', (*grams, limit * 5)).fetchall()
+            fuzzy = []
+            for word, shared, gram_count, usage_count in rows:
+                if word in seen:
+                    continue
+                score = 2.0 * shared / (len(query_grams) + gram_count)
+                if score >= min_score:
+                    fuzzy.append({
+                        'word': word,
+                        'usage_count': usage_count or 1,
+                        'score': round(score, 3),
+                        'match': 'fuzzy'
+                    })
+            fuzzy.sort(key=lambda x: (x['score'], x['usage_count']), reverse=True)
+            for item in fuzzy[:limit - len(results)]:
+                seen.add(item['word'])
+                results.append(item)
+        
+        # 3. 의미/예문 전문 검색
+        if len(results) < limit:
+            for item in self.search_slangs(query, limit=limit):
+                if len(results) >= limit:
+                    break
+                if item['word'] in seen:
+                    continue
+                seen.add(item['word'])
+                results.append({
+                    'word': item['word'],
+                    'usage_count': item['usage_count'],
+                    'score': 0.0,
+                    'match': 'fulltext'
+                })
+        
+        return results
+    
+    def search_slangs(self, query: str, limit: int = 20) -> List[Dict]:
+        """단어/의미/예문 전문 검색 (FTS5, 접두어 매칭)"""
+        if not self.fts_enabled:
+            return []
+        terms = [t for t in (query or '').split() if t]
+        if not terms:
+            return []
+        # 사용자 입력을 문자열 토큰으로 감싸 FTS 문법 오류 방지
+        match = ' '.join('"' + t.replace('"', '""') + '"*' for t in terms)
+        try:
+            rows = self._get_connection().execute('''
+                SELECT s.word, s.meaning, s.usage_count
+                FROM slangs_fts f JOIN slangs s ON s.id = f.rowid
+                WHERE slangs_fts MATCH ?
+                ORDER BY bm25(slangs_fts), s.usage_count DESC
+                LIMIT ?
+            ''', (match, limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            print(f"[검색 인덱스] 전문 검색 실패 ({query}): {e}")
+            return []
+        return [
+            {'word': word, 'meaning': meaning or '', 'usage_count': usage_count or 1}
+            for word, meaning, usage_count in rows
+        ]
+    
+    def get_ranking(self, limit: int = 20, period: Optional[str] = None, offset: int = 0) -> List[Dict]:
         """신조어 랭킹 조회
         
         Args:
             limit: 반환할 최대 개수
             period: 시간 필터 ('today', 'week', 'month', None=전체)
+            offset: 건너뛸 개수
         
         정렬: usage_count 내림차순 (높은 사용 횟수 우선), 동일하면 updated_at 내림차순
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        results, _ = self.get_ranking_page(limit, period, offset=offset)
+        return results
+    
+    def get_ranking_page(self, limit: int = 20, period: Optional[str] = None,
+                         cursor: Optional[str] = None, fields: Optional[List[str]] = None,
+                         offset: int = 0) -> Tuple[List[Dict], Optional[str]]:
+        """신조어 랭킹 페이지 조회 (키셋 커서 + 필드 선택)
+        
+        Args:
+            limit: 페이지 크기
+            period: 시간 필터 ('today', 'week', 'month', None=전체)
+            cursor: 이전 페이지의 next_cursor (usage_count, updated_at, word 기준)
+            fields: 반환할 필드 목록 (None이면 전체, word는 항상 포함)
+            offset: 건너뛸 개수 (커서 없이 쓸 때)
+        
+        정렬/필터/LIMIT은 모두 SQL에서 처리하고, JSON 예문은 반환되는 행(요청한 경우)만 디코딩합니다.
+        - 전체 랭킹: idx_slangs_ranking 인덱스 순서대로 스캔 (정렬 없이 LIMIT만큼 읽고 나머지 컬럼은 행에서 조회)
+        - 기간 랭킹: 일 단위 집계 테이블(slang_usage_daily)에서 기간 내 버킷만 합산
+          (집계 이력이 없는 기존 DB는 updated_at 기준 필터)
+        
+        Returns:
+            (결과 목록, 다음 페이지 커서 또는 None)
+        """
+        fields = list(fields) if fields else list(RANKING_FIELDS)
+        unknown = [f for f in fields if f not in RANKING_FIELDS]
+        if unknown:
+            raise ValueError(f"알 수 없는 필드: {', '.join(unknown)}")
+        if 'word' not in fields:
+            fields.insert(0, 'word')
+        extra_columns = [f for f in ('meaning', 'examples', 'method') if f in fields]
         
-        # 시간 필터 조건 구성
-        date_filter = ""
-        if period == 'today':
-            date_filter = "AND DATE(updated_at) = DATE('now')"
-        elif period == 'week':
-            date_filter = "AND updated_at >= datetime('now', '-7 days')"
-        elif period == 'month':
-            date_filter = "AND updated_at >= datetime('now', '-30 days')"
+        params: List = []
+        where = ''
+        if period and self.has_usage_history():
+            # 기간 내 실제 등장 횟수 합계 기준
+            count_expr = 'u.total'
+            source = '''
+                (
+                    SELECT word, SUM(count) AS total
+                    FROM slang_usage_daily
+                    WHERE bucket >= ?
+                    GROUP BY word
+                ) u
+                JOIN slangs s ON s.word = u.word
+            '''
+            params.append(self._period_start_bucket(period))
+        else:
+            count_expr = 's.usage_count'
+            source = 'slangs s'
+            # 인덱스를 쓸 수 있도록 컬럼에 함수 적용하지 않음
+            if period == 'today':
+                where = "AND s.updated_at >= DATE('now') AND s.updated_at < DATE('now', '+1 day')"
+            elif period == 'week':
+                where = "AND s.updated_at >= datetime('now', '-7 days')"
+            elif period == 'month':
+                where = "AND s.updated_at >= datetime('now', '-30 days')"
+        
+        if cursor:
+            cursor_count, cursor_updated_at, cursor_word = decode_ranking_cursor(cursor)
+            where += f" AND ({count_expr}, s.updated_at, s.word) < (?, ?, ?)"
+            params.extend([cursor_count, cursor_updated_at, cursor_word])
         
-        # 모든 데이터 가져오기 (시간 필터 적용)
+        select_columns = ', '.join([count_expr, 's.updated_at', 's.word'] + [f's.{c}' for c in extra_columns])
         query = f'''
-            SELECT word, meaning, examples, usage_count, method, updated_at
-            FROM slangs
-            WHERE 1=1 {date_filter}
-            ORDER BY 
-                CASE WHEN usage_count IS NULL OR usage_count = 0 THEN 1 ELSE usage_count END DESC,
-                updated_at DESC
+            SELECT {select_columns}
+            FROM {source}
+            WHERE 1=1 {where}
+            ORDER BY {count_expr} DESC, s.updated_at DESC, s.word DESC
+            LIMIT ? OFFSET ?
         '''
-        cursor.execute(query)
+        limit = max(int(limit), 0)
+        params.extend([limit, max(int(offset), 0)])
+        rows = self._get_connection().execute(query, params).fetchall()
         
         results = []
-        for row in cursor.fetchall():
-            word, meaning, examples_json, usage_count, method, updated_at = row
-            examples = json.loads(examples_json) if examples_json else []
-            # usage_count가 None이거나 0이면 1로 처리
-            actual_count = usage_count if usage_count and usage_count > 0 else 1
-            results.append({
-                'word': word,
-                'meaning': meaning,
-                'examples': examples,
-                'usage_count': actual_count,
-                'method': method or 'enhanced',  # None이면 enhanced로 처리
-                'updated_at': updated_at
-            })
-        
-        conn.close()
+        for row in rows:
+            usage_count, updated_at, word = row[0], row[1], row[2]
+            extra = dict(zip(extra_columns, row[3:]))
+            item = {}
+            for field in fields:
+                if field == 'word':
+                    item['word'] = word
+                elif field == 'usage_count':
+                    # usage_count가 None이거나 0이면 1로 처리
+                    item['usage_count'] = usage_count if usage_count and usage_count > 0 else 1
+                elif field == 'updated_at':
+                    item['updated_at'] = updated_at
+                elif field == 'examples':
+                    examples_json = extra.get('examples')
+                    item['examples'] = json.loads(examples_json) if examples_json else []
+                elif field == 'method':
+                    item['method'] = extra.get('method') or 'enhanced'  # None이면 enhanced로 처리
+                else:
+                    item[field] = extra.get(field)
+            results.append(item)
         
-        # limit 적용 (Python 레벨에서)
-        return results[:limit]
+        next_cursor = None
+        if limit and len(rows) == limit:
+            last = rows[-1]
+            next_cursor = encode_ranking_cursor(last[0], last[1], last[2])
+        return results, next_cursor
     
     def add_subscriber(self, email: str) -> bool:
         """구독자 추가"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         try:
@@ -357,14 +964,13 @@ class Database:
             conn.commit()
             return True
         except Exception as e:
+            conn.rollback()
             print(f"Error adding subscriber: {e}")
             return False
-        finally:
-            conn.close()
     
     def remove_subscriber(self, email: str) -> bool:
         """구독자 제거"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         try:
@@ -374,14 +980,13 @@ class Database:
             conn.commit()
             return cursor.rowcount > 0
         except Exception as e:
+            conn.rollback()
             print(f"Error removing subscriber: {e}")
             return False
-        finally:
-            conn.close()
     
     def get_active_subscribers(self) -> List[str]:
         """활성 구독자 목록 조회 (기존 subscribers 테이블)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -389,12 +994,11 @@ class Database:
         ''')
         
         results = [row[0] for row in cursor.fetchall()]
-        conn.close()
         return results
     
     def get_newsletter_subscribers(self) -> List[str]:
         """뉴스레터 구독자 이메일 목록 조회 (users 테이블)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -403,7 +1007,6 @@ class Database:
         ''')
         
         results = [row[0] for row in cursor.fetchall()]
-        conn.close()
         return results
     
     def add_slang_video(self, slang_word: str, video_id: str, video_title: str = None, 
@@ -411,7 +1014,7 @@ class Database:
                        view_count: int = None, like_count: int = None, 
                        caption_match_times: List[float] = None) -> bool:
         """신조어별 영상 추가"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         try:
@@ -419,21 +1022,114 @@ class Database:
             cursor.execute('''
                 INSERT OR REPLACE INTO slang_videos 
                 (slang_word, video_id, video_title, video_thumbnail, video_duration,
-                 view_count, like_count, caption_match_times, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 view_count, like_count, caption_match_times, created_at, stats_updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (slang_word, video_id, video_title, video_thumbnail, video_duration,
-                  view_count, like_count, match_times_json, datetime.now()))
+                  view_count, like_count, match_times_json, datetime.now(), datetime.now()))
             conn.commit()
             return True
         except Exception as e:
+            conn.rollback()
             print(f"Error adding slang video: {e}")
             return False
-        finally:
-            conn.close()
+    
+    def add_slang_videos(self, slang_word: str, videos: List[Dict]) -> int:
+        """신조어별 영상 일괄 저장 (한 트랜잭션, 이미 있는 영상은 정보와 저장 시각 갱신)"""
+        if not videos:
+            return 0
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            now = datetime.now()
+            cursor.executemany('''
+                INSERT OR REPLACE INTO slang_videos 
+                (slang_word, video_id, video_title, video_thumbnail, video_duration,
+                 view_count, like_count, caption_match_times, created_at, stats_updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (slang_word, video['video_id'], video.get('title'), video.get('thumbnail'),
+                 video.get('duration', 0), video.get('view_count', 0), video.get('like_count', 0),
+                 json.dumps(video['match_times']) if video.get('match_times') else None, now, now)
+                for video in videos
+            ])
+            conn.commit()
+            return len(videos)
+        except Exception as e:
+            conn.rollback()
+            print(f"Error adding slang videos: {e}")
+            return 0
+    
+    def get_videos_for_stats_refresh(self, stale_before: datetime, limit: int = 5000) -> List[str]:
+        """통계 갱신이 필요한 영상 ID (단어와 무관하게 한 번씩, 한 번도 갱신하지 않은 것부터 오래된 순)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT video_id, MIN(COALESCE(stats_updated_at, '')) AS oldest
+            FROM slang_videos
+            GROUP BY video_id
+            HAVING oldest < ?
+            ORDER BY oldest
+            LIMIT ?
+        ''', (stale_before, limit))
+        return [row[0] for row in cursor.fetchall()]
+    
+    def update_video_stats_many(self, stats: List[Dict], checked_ids: List[str] = None) -> int:
+        """영상 통계 일괄 갱신 (같은 영상의 모든 단어 행, 한 트랜잭션)
+        
+        checked_ids 중 stats에 없는 영상(삭제/비공개)은 갱신 시각만 기록해 바로 다시 조회하지 않음
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            now = datetime.now()
+            cursor.executemany('''
+                UPDATE slang_videos
+                SET view_count = ?, like_count = ?, video_duration = ?, stats_updated_at = ?
+                WHERE video_id = ?
+            ''', [(item['view_count'], item['like_count'], item['duration'], now, item['video_id'])
+                  for item in stats])
+            updated = cursor.rowcount
+            refreshed = {item['video_id'] for item in stats}
+            unavailable = [(now, video_id) for video_id in (checked_ids or []) if video_id not in refreshed]
+            if unavailable:
+                cursor.executemany('''
+                    UPDATE slang_videos SET stats_updated_at = ? WHERE video_id = ?
+                ''', unavailable)
+            conn.commit()
+            return updated
+        except Exception as e:
+            conn.rollback()
+            print(f"Error updating video stats: {e}")
+            return 0
+    
+    def get_video_cache_status(self, words: List[str]) -> Dict[str, Dict]:
+        """단어별 저장된 영상 수와 마지막 저장 시각 (영상이 없는 단어는 포함되지 않음)"""
+        words = list(dict.fromkeys(words))
+        if not words:
+            return {}
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        placeholders = ','.join('?' * len(words))
+        cursor.execute(f'''
+            SELECT slang_word, COUNT(*), MAX(created_at)
+            FROM slang_videos
+            WHERE slang_word IN ({placeholders})
+            GROUP BY slang_word
+        ''', words)
+        status = {}
+        for word, count, refreshed_at in cursor.fetchall():
+            try:
+                refreshed_at = datetime.fromisoformat(str(refreshed_at)) if refreshed_at else None
+            except ValueError:
+                refreshed_at = None
+            status[word] = {'count': count, 'refreshed_at': refreshed_at}
+        return status
     
     def get_videos_for_word(self, slang_word: str, limit: int = 5) -> List[Dict]:
         """특정 신조어의 영상 목록 조회"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -459,12 +1155,11 @@ class Database:
                 'match_times': match_times
             })
         
-        conn.close()
         return results
     
     def get_stats(self) -> Dict:
         """통계 정보 조회"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
         
         # 총 신조어 수
@@ -482,11 +1177,174 @@ class Database:
         ''')
         recent_slangs = cursor.fetchone()[0]
         
-        conn.close()
-        
         return {
             'total_slangs': total_slangs,
             'total_subscribers': total_subscribers,
             'recent_slangs': recent_slangs
         }
-
+    
+    def claim_crawl_job(self, job_id: str, trigger: str, stale_after: timedelta) -> Tuple[Dict, bool]:
+        """크롤링 작업 등록 (이미 실행 중인 작업이 있으면 그 작업을 반환)
+        
+        active 컬럼의 유니크 인덱스로 API/스케줄러/다른 프로세스 사이에서도 하나만 실행됩니다.
+        heartbeat가 stale_after 이상 끊긴 작업은 중단된 것으로 보고 정리합니다.
+        
+        Returns:
+            (작업 정보, 새로 등록되었는지 여부)
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        now = datetime.now()
+        try:
+            cursor.execute('''
+                UPDATE crawl_jobs
+                SET status = 'failed', error = '응답 없음 (중단된 작업)', active = NULL, finished_at = ?
+                WHERE active IS NOT NULL AND heartbeat_at < ?
+            ''', (now, now - stale_after))
+            cursor.execute('''
+                INSERT INTO crawl_jobs (id, trigger, status, stage_total, active, created_at, heartbeat_at)
+                VALUES (?, ?, 'queued', 0, 1, ?, ?)
+            ''', (job_id, trigger, now, now))
+            conn.commit()
+            return self.get_crawl_job(job_id), True
+        except sqlite3.IntegrityError:
+            conn.rollback()
+            return self.get_active_crawl_job(), False
+        except Exception:
+            conn.rollback()
+            raise
+    
+    def reclaim_crawl_job(self, job_id: str, stale_after: timedelta) -> Tuple[Optional[Dict], bool]:
+        """실패한 크롤링 작업을 다시 실행 상태로 전환 (이어서 실행용)
+        
+        Returns:
+            (작업 정보 또는 다른 실행 중 작업, 전환되었는지 여부)
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        now = datetime.now()
+        try:
+            cursor.execute('''
+                UPDATE crawl_jobs
+                SET status = 'failed', error = '응답 없음 (중단된 작업)', active = NULL, finished_at = ?
+                WHERE active IS NOT NULL AND heartbeat_at < ?
+            ''', (now, now - stale_after))
+            cursor.execute('''
+                UPDATE crawl_jobs
+                SET status = 'queued', active = 1, error = NULL, finished_at = NULL, heartbeat_at = ?
+                WHERE id = ? AND status = 'failed'
+            ''', (now, job_id))
+            reclaimed = cursor.rowcount > 0
+            conn.commit()
+            return self.get_crawl_job(job_id), reclaimed
+        except sqlite3.IntegrityError:
+            conn.rollback()
+            return self.get_active_crawl_job(), False
+        except Exception:
+            conn.rollback()
+            raise
+    
+    def update_crawl_job(self, job_id: str, **fields) -> bool:
+        """크롤링 작업 진행 상황 갱신 (heartbeat 포함, 종료 상태면 active 해제)"""
+        allowed = ('status', 'stage', 'stage_index', 'stage_total', 'message',
+                   'result_count', 'error', 'started_at', 'finished_at')
+        updates = {k: v for k, v in fields.items() if k in allowed}
+        now = datetime.now()
+        updates['heartbeat_at'] = now
+        if updates.get('status') in ('succeeded', 'failed'):
+            updates['active'] = None
+            updates.setdefault('finished_at', now)
+        assignments = ', '.join(f'{column} = ?' for column in updates)
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(f'UPDATE crawl_jobs SET {assignments} WHERE id = ?',
+                                  (*updates.values(), job_id))
+            conn.commit()
+            return cursor.rowcount > 0
+        except Exception as e:
+            conn.rollback()
+            print(f"Error updating crawl job: {e}")
+            return False
+    
+    def _crawl_job_from_row(self, row) -> Optional[Dict]:
+        if row is None:
+            return None
+        keys = ('id', 'trigger', 'status', 'stage', 'stage_index', 'stage_total', 'message',
+                'result_count', 'error', 'created_at', 'started_at', 'finished_at', 'heartbeat_at')
+        return dict(zip(keys, row))
+    
+    def get_crawl_job(self, job_id: str) -> Optional[Dict]:
+        """크롤링 작업 조회"""
+        row = self._get_connection().execute('''
+            SELECT id, trigger, status, stage, stage_index, stage_total, message,
+                   result_count, error, created_at, started_at, finished_at, heartbeat_at
+            FROM crawl_jobs WHERE id = ?
+        ''', (job_id,)).fetchone()
+        return self._crawl_job_from_row(row)
+    
+    def get_active_crawl_job(self) -> Optional[Dict]:
+        """실행 중(대기 포함)인 크롤링 작업 조회"""
+        row = self._get_connection().execute('''
+            SELECT id, trigger, status, stage, stage_index, stage_total, message,
+                   result_count, error, created_at, started_at, finished_at, heartbeat_at
+            FROM crawl_jobs WHERE active IS NOT NULL
+        ''').fetchone()
+        return self._crawl_job_from_row(row)
+    
+    def get_recent_crawl_jobs(self, limit: int = 20) -> List[Dict]:
+        """최근 크롤링 작업 목록"""
+        rows = self._get_connection().execute('''
+            SELECT id, trigger, status, stage, stage_index, stage_total, message,
+                   result_count, error, created_at, started_at, finished_at, heartbeat_at
+            FROM crawl_jobs ORDER BY created_at DESC LIMIT ?
+        ''', (limit,)).fetchall()
+        return [self._crawl_job_from_row(row) for row in rows]
+    
+    def save_crawl_checkpoint(self, job_id: str, stage: str, data) -> bool:
+        """크롤링 단계 결과 저장"""
+        conn = self._get_connection()
+        try:
+            conn.execute('''
+                INSERT INTO crawl_job_checkpoints (job_id, stage, payload, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(job_id, stage) DO UPDATE SET
+                    payload = excluded.payload,
+                    created_at = excluded.created_at
+            ''', (job_id, stage, json.dumps(data, ensure_ascii=False), datetime.now()))
+            conn.commit()
+            return True
+        except Exception as e:
+            conn.rollback()
+            print(f"Error saving crawl checkpoint: {e}")
+            return False
+    
+    def load_crawl_checkpoint(self, job_id: str, stage: str):
+        """크롤링 단계 결과 조회 (없으면 None)"""
+        row = self._get_connection().execute(
+            'SELECT payload FROM crawl_job_checkpoints WHERE job_id = ? AND stage = ?', (job_id, stage)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def get_crawl_checkpoint_stages(self, job_id: str) -> List[str]:
+        """저장된 단계 목록"""
+        rows = self._get_connection().execute(
+            'SELECT stage FROM crawl_job_checkpoints WHERE job_id = ? ORDER BY created_at', (job_id,)
+        ).fetchall()
+        return [row[0] for row in rows]
+    
+    def delete_crawl_checkpoints(self, job_id: Optional[str] = None, older_than: Optional[datetime] = None) -> int:
+        """단계 결과 삭제 (특정 작업 또는 오래된 작업)"""
+        conn = self._get_connection()
+        try:
+            if job_id is not None:
+                cursor = conn.execute('DELETE FROM crawl_job_checkpoints WHERE job_id = ?', (job_id,))
+            elif older_than is not None:
+                cursor = conn.execute('DELETE FROM crawl_job_checkpoints WHERE created_at < ?', (older_than,))
+            else:
+                return 0
+            conn.commit()
+            return cursor.rowcount
+        except Exception as e:
+            conn.rollback()
+            print(f"Error deleting crawl checkpoints: {e}")
+            return 0
@@ -0,0 +1,38 @@
+"""
+블로킹 작업용 스레드 풀
+이벤트 루프를 막지 않도록 SQLite/파일 I/O와 외부 API 호출(YouTube, GPT)을 별도 풀에서 실행합니다.
+- DB 풀: 짧은 조회/쓰기 (작게 유지)
+- 외부 풀: 느린 네트워크 호출 (외부 호출이 몰려도 DB 조회는 계속 처리됨)
+"""
+import os
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+DB_POOL_WORKERS = int(os.getenv('DB_POOL_WORKERS', '8') or 8)
+EXTERNAL_POOL_WORKERS = int(os.getenv('EXTERNAL_POOL_WORKERS', '16') or 16)
+
+db_executor = ThreadPoolExecutor(max_workers=DB_POOL_WORKERS, thread_name_prefix='db')
+external_executor = ThreadPoolExecutor(max_workers=EXTERNAL_POOL_WORKERS, thread_name_prefix='external')
+
+
+async def _run_in(executor: ThreadPoolExecutor, func: Callable, *args, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+async def run_db(func: Callable, *args, **kwargs) -> Any:
+    """DB/파일 I/O 작업을 DB 풀에서 실행"""
+    return await _run_in(db_executor, func, *args, **kwargs)
+
+
+async def run_external(func: Callable, *args, **kwargs) -> Any:
+    """외부 API 호출(YouTube, GPT 등)을 외부 풀에서 실행"""
+    return await _run_in(external_executor, func, *args, **kwargs)
+
+
+def shutdown_executors(wait: bool = False):
+    """서버 종료 시 풀 정리"""
+    db_executor.shutdown(wait=wait)
+    external_executor.shutdown(wait=wait)
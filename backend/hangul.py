@@ -0,0 +1,53 @@
+"""
+한글 자모 분해 유틸리티
+검색 인덱스(접두어 자동완성, 오타 허용 검색)에서 사용합니다.
+"""
+from typing import Set
+
+# 호환용 자모 (초성 19, 중성 21, 종성 27)
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅗㅏ', 'ㅗㅐ', 'ㅗㅣ', 'ㅛ', 'ㅜ',
+             'ㅜㅓ', 'ㅜㅔ', 'ㅜㅣ', 'ㅠ', 'ㅡ', 'ㅡㅣ', 'ㅣ']
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄱㅅ', 'ㄴ', 'ㄴㅈ', 'ㄴㅎ', 'ㄷ', 'ㄹ', 'ㄹㄱ', 'ㄹㅁ', 'ㄹㅂ', 'ㄹㅅ',
+             'ㄹㅌ', 'ㄹㅍ', 'ㄹㅎ', 'ㅁ', 'ㅂ', 'ㅂㅅ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 입력 중인 겹자모도 같은 형태로 풀어줌 (예: 'ㄳ' → 'ㄱㅅ', 'ㅘ' → 'ㅗㅏ')
+COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+
+def decompose(text: str) -> str:
+    """한글 음절을 자모 문자열로 분해 (예: '갓생' → 'ㄱㅏㅅㅅㅐㅇ')"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            result.append(CHOSEONG[offset // 588])
+            result.append(JUNGSEONG[(offset % 588) // 28])
+            result.append(JONGSEONG[offset % 28])
+        else:
+            result.append(COMPOUND_JAMO.get(char, char.lower()))
+    return ''.join(result)
+
+
+def jamo_ngrams(text: str, n: int = 2) -> Set[str]:
+    """자모 n-gram 집합 (단어 경계 포함)"""
+    jamo = '^' + decompose(text) + '$'
+    if len(jamo) <= n:
+        return {jamo}
+    return {jamo[i:i + n] for i in range(len(jamo) - n + 1)}
+
+
+def dice_similarity(a: Set[str], b: Set[str]) -> float:
+    """두 n-gram 집합의 Dice 계수"""
+    if not a or not b:
+        return 0.0
+    return 2.0 * len(a & b) / (len(a) + len(b))
+
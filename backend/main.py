@@ -1,16 +1,22 @@
-from fastapi import FastAPI, HTTPException, Depends, status, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, status, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import os
 import sys
 import hashlib
 import secrets
 import json
 import re
+import uuid
+import asyncio
 from dotenv import load_dotenv
+from executors import run_db, run_external, shutdown_executors
+from single_flight import SingleFlightCache
+from cache_store import get_cache_store
+from search_cache import SearchResultCache, BackgroundRefresher, SEARCH_PARTS
 
 # 모듈 import 시 에러 처리 - 실패해도 서버는 시작됨
 Database = None
@@ -18,6 +24,7 @@ EmailService = None
 Crawler = None
 start_scheduler_thread = None
 YouTubeService = None
+get_youtube_service = None
 
 try:
     from database import Database
@@ -44,11 +51,50 @@ except Exception as e:
     print(f"[서버 시작] scheduler 모듈 로드 실패 (선택적): {e}")
 
 try:
-    from youtube_service import YouTubeService
+    from rules_service import get_word_rules_service, get_manual_meanings_service
+    print("[서버 시작] rules_service 모듈 로드 완료")
+except Exception as e:
+    get_word_rules_service = None
+    get_manual_meanings_service = None
+    print(f"[서버 시작] rules_service 모듈 로드 실패 (선택적): {e}")
+
+try:
+    from ranking_snapshot import RankingSnapshotCache
+    print("[서버 시작] ranking_snapshot 모듈 로드 완료")
+except Exception as e:
+    RankingSnapshotCache = None
+    print(f"[서버 시작] ranking_snapshot 모듈 로드 실패 (선택적): {e}")
+
+try:
+    from crawl_jobs import get_crawl_job_manager, TERMINAL_STATUSES
+    print("[서버 시작] crawl_jobs 모듈 로드 완료")
+except Exception as e:
+    get_crawl_job_manager = None
+    print(f"[서버 시작] crawl_jobs 모듈 로드 실패 (선택적): {e}")
+
+try:
+    from trends import TrendEngine
+    print("[서버 시작] trends 모듈 로드 완료")
+except Exception as e:
+    TrendEngine = None
+    print(f"[ERROR] [서버 시작] trends 모듈 로드 실패 - /trending 비활성화 "
+          f"(backend/requirements.txt의 numpy 설치 확인): {e}")
+    import traceback
+    traceback.print_exc()
+
+try:
+    from youtube_service import YouTubeService, get_youtube_service
     print("[서버 시작] youtube_service 모듈 로드 완료")
 except Exception as e:
     print(f"[서버 시작] youtube_service 모듈 로드 실패 (선택적): {e}")
 
+try:
+    from video_prefetch import VideoPrefetcher
+    print("[서버 시작] video_prefetch 모듈 로드 완료")
+except Exception as e:
+    VideoPrefetcher = None
+    print(f"[서버 시작] video_prefetch 모듈 로드 실패 (선택적): {e}")
+
 # 백그라운드 작업에서도 로그가 즉시 출력되도록 설정
 sys.stdout.reconfigure(line_buffering=True) if hasattr(sys.stdout, 'reconfigure') else None
 
@@ -67,6 +113,11 @@ else:
 
 app = FastAPI(title="Slang Bridge API", version="1.0.0")
 
+@app.on_event("shutdown")
+def close_executors():
+    """블로킹 작업용 스레드 풀 정리"""
+    shutdown_executors()
+
 # 서버 시작 시 상세 로그 출력
 print("=" * 60)
 print("[서버 시작] FastAPI 애플리케이션 초기화 중...")
@@ -102,18 +153,41 @@ if Database:
 else:
     print("[서버 시작] Database 모듈이 없어 데이터베이스 기능이 비활성화됩니다")
 
-# 전역 크롤러 (수동 의미 사전 접근용) - 지연 로딩
-global_crawler_for_meanings = None
+# 단어 규칙 / 수동 의미 사전 (파일 변경 시에만 다시 읽음 - 읽기 경로에서 크롤러를 만들지 않음)
+word_rules_service = get_word_rules_service() if get_word_rules_service else None
+manual_meanings_service = get_manual_meanings_service() if get_manual_meanings_service else None
 print("[서버 시작] 전역 변수 초기화 완료")
 
-def get_global_crawler():
-    """전역 크롤러를 지연 로딩으로 가져오기 (서버 시작 시 메모리 부족 방지)"""
-    global global_crawler_for_meanings
-    if Crawler is None:
-        raise HTTPException(status_code=503, detail="크롤러 모듈이 로드되지 않았습니다. 필요한 패키지를 설치해주세요.")
-    if global_crawler_for_meanings is None:
-        global_crawler_for_meanings = Crawler()
-    return global_crawler_for_meanings
+def get_rules_service():
+    """단어 규칙 서비스 조회"""
+    if word_rules_service is None:
+        raise HTTPException(status_code=503, detail="단어 규칙 모듈이 로드되지 않았습니다.")
+    return word_rules_service
+
+def get_manual_meaning(word: str):
+    """수동 의미 사전 조회 (없으면 None)"""
+    if manual_meanings_service is None:
+        return None
+    return manual_meanings_service.lookup(word)
+
+# 크롤링 작업 관리자 (API와 스케줄러가 공유, 동시에 하나의 크롤링만 실행)
+crawl_jobs = get_crawl_job_manager(db) if (db and get_crawl_job_manager) else None
+
+# 추세 엔진 (크롤링 작업에서 갱신, /trending에서 조회)
+trend_engine = crawl_jobs.trends if crawl_jobs is not None else None
+
+# 급상승/랭킹 상위 단어 영상 미리 가져오기 (크롤링 후 백그라운드, 차단 단어 제외)
+video_prefetcher = VideoPrefetcher(
+    db, get_youtube_service, trend_engine=trend_engine,
+    word_filter=lambda word: word_rules_service is None or word not in word_rules_service.block_set
+) if (db and VideoPrefetcher and get_youtube_service) else None
+
+# 랭킹 스냅샷 (데이터가 바뀔 때만 다시 생성, ETag/압축 본문 제공)
+ranking_snapshots = RankingSnapshotCache(db, word_rules_service) if (db and RankingSnapshotCache) else None
+# 크롤링 직후 미리 만들어 둘 랭킹 (프론트엔드 기본 요청: limit=200, 표시 필드만)
+RANKING_WARM_LIMIT = 200
+RANKING_WARM_FIELDS = ('word', 'meaning', 'usage_count', 'method')
+RANKING_PERIODS = [None, 'today', 'week', 'month']
 
 # 세션 저장소 (간단한 in-memory)
 sessions = {}
@@ -181,7 +255,9 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": time.time(),
-        "message": "서버가 정상적으로 실행 중입니다"
+        "message": "서버가 정상적으로 실행 중입니다",
+        "word_requests": word_requests.stats(),
+        "trends_enabled": trend_engine is not None
     }
 
 @app.post("/register")
@@ -189,7 +265,7 @@ async def register(request: RegisterRequest):
     """회원가입"""
     try:
         # 이메일 중복 확인
-        if db.get_user_by_email(request.email):
+        if await run_db(db.get_user_by_email, request.email):
             raise HTTPException(status_code=400, detail="이미 사용 중인 이메일입니다.")
         
         # 이메일에서 자동으로 사용자 이름 생성 (이메일의 @ 앞부분)
@@ -198,7 +274,7 @@ async def register(request: RegisterRequest):
         # 사용자 이름이 이미 존재하면 숫자 추가
         original_username = username
         counter = 1
-        while db.get_user(username):
+        while await run_db(db.get_user, username):
             username = f"{original_username}{counter}"
             counter += 1
         
@@ -206,7 +282,7 @@ async def register(request: RegisterRequest):
         hashed_password = hash_password(request.password)
         
         # 사용자 생성
-        success = db.create_user(username, hashed_password, request.email)
+        success = await run_db(db.create_user, username, hashed_password, request.email)
         if success:
             return {"success": True, "message": "회원가입이 완료되었습니다."}
         else:
@@ -222,7 +298,7 @@ async def login(request: LoginRequest):
     if db is None:
         raise HTTPException(status_code=503, detail="데이터베이스가 초기화되지 않았습니다. 필요한 패키지를 설치해주세요.")
     try:
-        user = db.get_user_by_email(request.email)
+        user = await run_db(db.get_user_by_email, request.email)
         if not user:
             raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 잘못되었습니다.")
         
@@ -262,7 +338,7 @@ async def get_current_user_info(session_id: Optional[str] = None):
     if not session_id:
         return {"success": False, "message": "로그인이 필요합니다."}
     
-    user = get_current_user(session_id)
+    user = await run_db(get_current_user, session_id)
     if not user:
         return {"success": False, "message": "세션이 만료되었습니다."}
     
@@ -276,60 +352,120 @@ async def get_current_user_info(session_id: Optional[str] = None):
         }
     }
 
+def parse_ranking_fields(fields: Optional[str]) -> Optional[tuple]:
+    """fields 파라미터 파싱 (예: 'word,meaning,usage_count')"""
+    if not fields:
+        return None
+    return tuple(dict.fromkeys(f.strip() for f in fields.split(',') if f.strip())) or None
+
+def build_ranking_payload(limit: int, period: Optional[str], offset: int = 0,
+                          cursor: Optional[str] = None, fields: Optional[tuple] = None,
+                          compact: bool = False) -> Dict:
+    """랭킹 응답 본문 생성 (DB 조회 + 차단 규칙 적용)
+    
+    compact=True면 행을 필드 순서대로 배열로 내려 키 이름 반복을 줄입니다.
+    """
+    ranking, next_cursor = db.get_ranking_page(limit, period, cursor=cursor, fields=fields, offset=offset)
+    # 단어 규칙 적용 (차단) - 메모리 캐시 (파일이 바뀐 경우에만 다시 읽음)
+    block = get_rules_service().block_set
+    if block:
+        original_count = len(ranking)
+        ranking = [item for item in ranking if item.get('word') and item['word'] not in block]
+        filtered_count = len(ranking)
+        
+        # 디버그 정보 출력
+        if filtered_count == 0 and original_count > 0:
+            print(f"[랭킹 필터링] 원본 {original_count}개 → 필터링 후 {filtered_count}개")
+            print(f"[랭킹 필터링] block={len(block)}개")
+    if compact:
+        columns = list(ranking[0].keys()) if ranking else list(fields or [])
+        return {
+            "success": True,
+            "fields": columns,
+            "rows": [[item.get(c) for c in columns] for item in ranking],
+            "period": period or "all",
+            "next_cursor": next_cursor,
+        }
+    return {"success": True, "data": ranking, "period": period or "all", "next_cursor": next_cursor}
+
+def snapshot_response(snapshot, request: Request) -> Response:
+    """스냅샷을 ETag/304/압축 응답으로 변환"""
+    headers = {
+        "ETag": snapshot.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if snapshot.matches(request.headers.get('if-none-match')):
+        return Response(status_code=304, headers=headers)
+    body, encoding = snapshot.select_body(request.headers.get('accept-encoding'))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def warm_ranking_snapshots():
+    """쓰기 이후 기본 랭킹 스냅샷을 미리 생성"""
+    if ranking_snapshots is None:
+        return
+    warm = {
+        ('ranking', period, RANKING_WARM_LIMIT, 0, None, RANKING_WARM_FIELDS, False):
+            (lambda p=period: build_ranking_payload(RANKING_WARM_LIMIT, p, fields=RANKING_WARM_FIELDS))
+        for period in RANKING_PERIODS
+    }
+    ranking_snapshots.refresh(warm)
+
+if crawl_jobs is not None:
+    # 크롤링 결과 저장 후 랭킹 스냅샷 미리 갱신
+    crawl_jobs.add_completion_hook(lambda job: warm_ranking_snapshots())
+    if video_prefetcher is not None:
+        # 새로 뜬 단어의 영상 패널이 DB에서 바로 나오도록 영상 캐시 갱신
+        crawl_jobs.add_completion_hook(lambda job: video_prefetcher.submit())
+
 @app.get("/ranking")
-async def get_ranking(limit: int = 100, period: Optional[str] = None):
+async def get_ranking(request: Request, limit: int = 100, period: Optional[str] = None, offset: int = 0,
+                      cursor: Optional[str] = None, fields: Optional[str] = None, compact: bool = False):
     """신조어 랭킹 조회
     
     Args:
         limit: 반환할 최대 개수 (기본값: 100)
         period: 시간 필터 ('today', 'week', 'month', None=전체)
+        offset: 건너뛸 개수 (기본값: 0)
+        cursor: 이전 응답의 next_cursor (다음 페이지)
+        fields: 반환할 필드 (쉼표 구분, 예: 'word,meaning,usage_count')
+        compact: True면 {fields, rows} 배열 형식으로 응답
+    
+    데이터가 바뀌지 않았으면 메모리 스냅샷을 그대로 제공합니다 (If-None-Match → 304).
     """
     if db is None:
         return {"success": True, "data": [], "message": "데이터베이스가 초기화되지 않았습니다. 필요한 패키지를 설치해주세요."}
     try:
         if period and period not in ['today', 'week', 'month']:
             raise HTTPException(status_code=400, detail="period는 'today', 'week', 'month' 중 하나여야 합니다.")
-        ranking = db.get_ranking(limit, period)
-        # 단어 규칙 적용 (차단/허용) - 파일에서 최신 규칙 로드
-        try:
-            import json
-            data_dir = os.path.join(current_dir, 'data')
-            rules_path = os.path.join(data_dir, 'word_rules.json')
-            rules = {"allow": [], "block": []}
-            if os.path.exists(rules_path):
-                with open(rules_path, 'r', encoding='utf-8-sig') as f:
-                    content = f.read().strip()
-                    if content:
-                        rules = json.loads(content)
-                        if not isinstance(rules, dict):
-                            rules = {"allow": [], "block": []}
-            # 메모리 캐시도 갱신
-            get_global_crawler().word_rules = rules
-        except Exception as e:
-            print(f"[랭킹] 단어 규칙 로드 실패: {e}")
-            rules = get_global_crawler().word_rules
-        
-        if rules and rules.get('block'):
-            block = set(rules.get('block') or [])
-            original_count = len(ranking)
-            
-            def _allowed(item):
-                w = item.get('word')
-                if not w:
-                    return False
-                # block 리스트에 있으면 무조건 제외
-                if w in block:
-                    return False
-                return True
-            
-            ranking = list(filter(_allowed, ranking))
-            filtered_count = len(ranking)
-            
-            # 디버그 정보 출력
-            if filtered_count == 0 and original_count > 0:
-                print(f"[랭킹 필터링] 원본 {original_count}개 → 필터링 후 {filtered_count}개")
-                print(f"[랭킹 필터링] block={len(block)}개")
-        return {"success": True, "data": ranking, "period": period or "all"}
+        field_list = parse_ranking_fields(fields)
+        builder = lambda: build_ranking_payload(limit, period, offset, cursor, field_list, compact)
+        if ranking_snapshots is None:
+            return await run_db(builder)
+        snapshot = await run_db(ranking_snapshots.get,
+                                ('ranking', period, limit, offset, cursor, field_list, compact), builder)
+        return snapshot_response(snapshot, request)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # 잘못된 커서/필드
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/trending")
+async def get_trending(limit: int = 20):
+    """급상승/신규 신조어 (EWMA z-score + 버스트 상태 기반 추세 점수 순)"""
+    if trend_engine is None:
+        raise HTTPException(status_code=503, detail="추세 엔진이 비활성화되어 있습니다. (numpy 필요)")
+    try:
+        limit = max(1, min(limit, 100))
+        block = get_rules_service().block_set
+        trending = await run_db(trend_engine.trending, limit + len(block))
+        trending = [item for item in trending if item['word'] not in block][:limit]
+        return {"success": True, "data": trending}
     except HTTPException:
         raise
     except Exception as e:
@@ -341,14 +477,14 @@ async def toggle_subscription(session_id: Optional[str] = None):
     if not session_id:
         raise HTTPException(status_code=401, detail="로그인이 필요합니다.")
     
-    user = get_current_user(session_id)
+    user = await run_db(get_current_user, session_id)
     if not user:
         raise HTTPException(status_code=401, detail="세션이 만료되었습니다.")
     
     try:
-        success = db.toggle_newsletter_subscription(user['id'])
+        success = await run_db(db.toggle_newsletter_subscription, user['id'])
         if success:
-            new_status = db.get_newsletter_subscription_status(user['id'])
+            new_status = await run_db(db.get_newsletter_subscription_status, user['id'])
             return {
                 "success": True,
                 "message": "구독 상태가 변경되었습니다.",
@@ -367,70 +503,102 @@ async def get_subscription_status(session_id: Optional[str] = None):
     if not session_id:
         return {"success": False, "subscribed": False}
     
-    user = get_current_user(session_id)
+    user = await run_db(get_current_user, session_id)
     if not user:
         return {"success": False, "subscribed": False}
     
-    status = db.get_newsletter_subscription_status(user['id'])
+    status = await run_db(db.get_newsletter_subscription_status, user['id'])
     return {"success": True, "subscribed": status}
 
-def run_crawler_task():
-    """백그라운드에서 실행할 크롤러 작업"""
-    try:
-        # 즉시 출력되도록 flush
-        print("[크롤러] 백그라운드 크롤링 시작...", flush=True)
-        sys.stdout.flush()
-        
-        crawler = Crawler()
-        result = crawler.crawl_and_analyze()
-        
-        print(f"[크롤러] 크롤링 완료: {len(result)}개 신조어 발견", flush=True)
-        sys.stdout.flush()
-        
-        # 데이터베이스에 저장
-        added_count = 0
-        for slang_data in result:
-            if db.add_slang(
-                slang_data['word'], 
-                slang_data['meaning'], 
-                slang_data.get('examples', []),
-                usage_count=slang_data.get('count', 1),
-                method=slang_data.get('method', 'enhanced')
-            ):
-                added_count += 1
-        
-        print(f"[크롤러] 데이터베이스 저장 완료: {added_count}개 신조어 저장됨", flush=True)
-        sys.stdout.flush()
-    except Exception as e:
-        print(f"[크롤러] 크롤링 실패: {e}", flush=True)
-        sys.stdout.flush()
-        import traceback
-        traceback.print_exc()
-        sys.stdout.flush()
+def get_crawl_jobs():
+    """크롤링 작업 관리자 조회"""
+    if crawl_jobs is None:
+        raise HTTPException(status_code=503, detail="크롤링 작업 관리자가 초기화되지 않았습니다.")
+    return crawl_jobs
 
 @app.post("/crawl")
-async def trigger_crawl(background_tasks: BackgroundTasks):
-    """크롤링 실행 (백그라운드 작업)"""
+async def trigger_crawl():
+    """크롤링 실행 (백그라운드 작업, 실행 중인 작업이 있으면 그 작업을 반환)"""
+    manager = get_crawl_jobs()
     try:
-        # 백그라운드 작업으로 크롤링 실행
-        background_tasks.add_task(run_crawler_task)
-        print("[크롤러] 크롤링 작업이 백그라운드에서 시작되었습니다.")
+        job, created = await run_db(manager.submit, 'api')
+        if created:
+            message = "크롤링이 시작되었습니다. 몇 분 후 랭킹을 새로고침해주세요."
+        else:
+            message = "이미 크롤링이 진행 중입니다. 진행 상황은 작업 ID로 확인할 수 있습니다."
         return {
             "success": True,
-            "message": "크롤링이 시작되었습니다. 몇 분 후 랭킹을 새로고침해주세요.",
-            "status": "started"
+            "message": message,
+            "status": "started" if created else "already_running",
+            "job_id": job['id'] if job else None,
+            "job": job
         }
     except Exception as e:
         print(f"[크롤러] 크롤링 시작 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/crawl/{job_id}")
+async def get_crawl_job(job_id: str):
+    """크롤링 작업 상태 조회 (단계별 진행 상황)"""
+    job = await run_db(get_crawl_jobs().get, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="크롤링 작업을 찾을 수 없습니다.")
+    return {"success": True, "job": job}
+
+@app.post("/crawl/{job_id}/resume")
+async def resume_crawl_job(job_id: str):
+    """실패한 크롤링 작업을 마지막 완료 단계부터 이어서 실행"""
+    job, resumed = await run_db(get_crawl_jobs().resume, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="크롤링 작업을 찾을 수 없습니다.")
+    if not resumed:
+        if job['id'] != job_id:
+            message = "다른 크롤링이 진행 중입니다."
+        else:
+            message = "실패한 작업만 이어서 실행할 수 있습니다."
+        return {"success": False, "message": message, "status": job['status'], "job": job}
+    return {"success": True, "message": "크롤링 작업을 이어서 실행합니다.", "status": "resumed",
+            "job_id": job_id, "job": job}
+
+@app.get("/crawl/{job_id}/events")
+async def stream_crawl_job(job_id: str):
+    """크롤링 진행 상황 SSE 스트림 (상태가 바뀔 때마다 progress 이벤트, 끝나면 done 이벤트)"""
+    manager = get_crawl_jobs()
+    if not await run_db(manager.get, job_id):
+        raise HTTPException(status_code=404, detail="크롤링 작업을 찾을 수 없습니다.")
+    
+    async def events():
+        last_state = None
+        idle_seconds = 0
+        while True:
+            job = await run_db(manager.get, job_id)
+            if job is None:
+                break
+            state = (job['status'], job['stage'], job['message'])
+            if state != last_state:
+                last_state = state
+                idle_seconds = 0
+                event = 'done' if job['status'] in TERMINAL_STATUSES else 'progress'
+                yield f"event: {event}\ndata: {json.dumps(job, ensure_ascii=False, default=str)}\n\n"
+                if event == 'done':
+                    break
+            elif idle_seconds >= 15:
+                # 프록시 연결 유지용 주석
+                idle_seconds = 0
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(1)
+            idle_seconds += 1
+    
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 @app.get("/stats")
 async def get_stats():
     """통계 정보 조회"""
     if db is None:
         return {"success": True, "data": {"total_slangs": 0, "total_users": 0}, "message": "데이터베이스가 초기화되지 않았습니다."}
     try:
-        stats = db.get_stats()
+        stats = await run_db(db.get_stats)
         return {"success": True, "data": stats}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -442,19 +610,10 @@ async def upsert_bulk_meanings(payload: BulkMeaningsRequest):
     - 구 형식: { "meanings": { "단어": "설명", ... } }
     - 새 형식: { "meanings": { "단어": {"meaning": "설명", "examples": [...]}, ... } }
     """
+    if manual_meanings_service is None:
+        raise HTTPException(status_code=503, detail="수동 의미 사전 모듈이 로드되지 않았습니다.")
     try:
-        data_dir = os.path.join(current_dir, 'data')
-        os.makedirs(data_dir, exist_ok=True)
-        manual_path = os.path.join(data_dir, 'manual_meanings.json')
-        existing = {}
-        if os.path.exists(manual_path):
-            with open(manual_path, 'r', encoding='utf-8-sig') as f:
-                try:
-                    content = f.read().strip()
-                    if content:
-                        existing = json.loads(content) or {}
-                except Exception:
-                    existing = {}
+        existing = {k: dict(v) for k, v in (await run_db(manual_meanings_service.get)).items()}
         # 병합 (구 형식과 새 형식 모두 지원)
         for k, v in (payload.meanings or {}).items():
             if v:
@@ -469,155 +628,154 @@ async def upsert_bulk_meanings(payload: BulkMeaningsRequest):
                     else:
                         # 새로 추가하면 기본 구조로 변환
                         existing[str(k)] = {"meaning": v, "examples": []}
-        # 저장
-        with open(manual_path, 'w', encoding='utf-8') as f:
-            json.dump(existing, f, ensure_ascii=False, indent=2)
-        # 전역 크롤러 캐시 갱신
-        get_global_crawler().manual_meanings = existing
+        # 저장 (메모리 캐시도 함께 갱신)
+        await run_db(manual_meanings_service.write, existing)
+        # 바뀐 단어의 저장된 검색 결과 삭제 (다음 검색에서 새 수동 의미로 다시 만듦)
+        changed = [str(k) for k, v in (payload.meanings or {}).items() if v]
+        await run_db(search_results.invalidate, changed)
+        for word in changed:
+            word_requests.invalidate(('search', word))
         return {"updated": len(payload.meanings or {}), "total": len(existing)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/words/rules")
 async def get_word_rules():
-    return get_global_crawler().word_rules
+    return await run_db(get_rules_service().get)
 
 @app.post("/words/rules")
 async def upsert_word_rules(payload: WordRulesRequest):
+    rules_service = get_rules_service()
     try:
-        data_dir = os.path.join(current_dir, 'data')
-        os.makedirs(data_dir, exist_ok=True)
-        rules_path = os.path.join(data_dir, 'word_rules.json')
-        # 기존 로드
-        rules = {"allow": [], "block": []}
-        if os.path.exists(rules_path):
-            with open(rules_path, 'r', encoding='utf-8-sig') as f:
-                content = f.read().strip()
-                if content:
-                    rules = json.loads(content)
-                    if not isinstance(rules, dict):
-                        rules = {"allow": [], "block": []}
-        # 병합/치환
-        if payload.allow is not None:
-            rules['allow'] = [str(w) for w in payload.allow if w]
-        if payload.block is not None:
-            rules['block'] = [str(w) for w in payload.block if w]
-        # 저장 (BOM 없이)
-        with open(rules_path, 'w', encoding='utf-8') as f:
-            json.dump(rules, f, ensure_ascii=False, indent=2)
-        # 메모리 갱신
-        get_global_crawler().word_rules = rules
-        return rules
+        # 병합/치환 후 저장 (BOM 없이), 메모리 캐시 갱신
+        return await run_db(rules_service.update, allow=payload.allow, block=payload.block)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/youtube/quota")
+async def get_youtube_quota():
+    """YouTube API 오늘 사용량/남은 할당량 (엔드포인트별)"""
+    if get_youtube_service is None:
+        return {"success": False, "data": None, "message": "YouTube 서비스를 사용할 수 없습니다."}
+    try:
+        youtube_service = await run_external(get_youtube_service)
+        quota = await run_db(youtube_service.quota.snapshot)
+        return {"success": True, "data": quota}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 같은 단어의 영상/검색 요청이 몰리면 YouTube/GPT 처리는 한 번만 (성공 결과는 잠시 보관)
+word_requests = SingleFlightCache(cache_if=lambda result: bool(result.get('success')))
+
 @app.get("/ranking/videos")
 async def get_word_videos(word: str, limit: int = 5):
     """특정 신조어가 사용된 숏폼 영상 조회
     Query parameter로 word를 받습니다 (한글 인코딩 문제 해결)
     """
     try:
-        # 1. 캐시된 영상 확인
-        cached_videos = db.get_videos_for_word(word, limit=limit)
-        
-        if cached_videos and len(cached_videos) >= limit:
+        return await word_requests.run(('videos', word, limit), lambda: load_word_videos(word, limit))
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"[ERROR] 영상 조회 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def load_word_videos(word: str, limit: int) -> Dict:
+    """DB에 저장된 영상 → 부족하면 YouTube 검색"""
+    # 1. 캐시된 영상 확인 (DB 풀)
+    cached_videos = await run_db(db.get_videos_for_word, word, limit=limit)
+    
+    if cached_videos and len(cached_videos) >= limit:
+        return {
+            "success": True,
+            "word": word,
+            "videos": cached_videos,
+            "cached": True
+        }
+    
+    # 2. YouTube API로 검색 및 분석 (외부 풀 - 느린 호출이 다른 요청을 막지 않도록)
+    return await run_external(search_word_videos, word, limit, cached_videos)
+
+def search_word_videos(word: str, limit: int, cached_videos: List[Dict]) -> Dict:
+    """YouTube에서 신조어 영상을 찾아 저장 (블로킹 - 외부 풀에서 실행)"""
+    youtube_service = get_youtube_service()
+    
+    if not youtube_service.youtube:
+        # YouTube API가 설정되지 않은 경우
+        if cached_videos:
             return {
                 "success": True,
                 "word": word,
                 "videos": cached_videos,
-                "cached": True
+                "cached": True,
+                "message": "YouTube API 키가 설정되지 않았습니다. 캐시된 영상만 표시합니다."
             }
-        
-        # 2. YouTube API로 검색 및 분석
-        youtube_service = YouTubeService()
-        
-        if not youtube_service.youtube:
-            # YouTube API가 설정되지 않은 경우
-            if cached_videos:
-                return {
-                    "success": True,
-                    "word": word,
-                    "videos": cached_videos,
-                    "cached": True,
-                    "message": "YouTube API 키가 설정되지 않았습니다. 캐시된 영상만 표시합니다."
-                }
-            return {
-                "success": False,
-                "word": word,
-                "videos": [],
-                "message": "YouTube API 키를 설정해야 영상을 검색할 수 있습니다. .env 파일에 YOUTUBE_API_KEY를 추가해주세요."
-            }
-        
-        print(f"[영상 조회] '{word}' 검색 시작 (캐시: {len(cached_videos)}개)")
+        return {
+            "success": False,
+            "word": word,
+            "videos": [],
+            "message": "YouTube API 키를 설정해야 영상을 검색할 수 있습니다. .env 파일에 YOUTUBE_API_KEY를 추가해주세요."
+        }
+    
+    print(f"[영상 조회] '{word}' 검색 시작 (캐시: {len(cached_videos)}개)")
+    if video_prefetcher is not None:
+        # 영상 저장 + 자막에 함께 나온 다른 신조어의 영상도 저장
+        videos = video_prefetcher.find_and_store(youtube_service, word, limit)
+    else:
         videos = youtube_service.find_videos_with_slang(word, max_results=limit)
-        print(f"[영상 조회] '{word}' 검색 완료: {len(videos)}개 영상 발견")
-        
-        if not videos:
-            # 캐시된 영상이 있으면 반환 (부족하더라도)
-            if cached_videos:
-                print(f"[영상 조회] '{word}' - 캐시된 영상 반환 ({len(cached_videos)}개)")
-                return {
-                    "success": True,
-                    "word": word,
-                    "videos": cached_videos,
-                    "cached": True,
-                    "message": "새로운 영상을 찾지 못했습니다. 캐시된 영상만 표시합니다."
-                }
-            
-            # YouTube API가 설정되어 있는데 결과가 없으면
-            print(f"[영상 조회] '{word}' - 검색 결과 없음 (API 설정: {youtube_service.youtube is not None})")
+        db.add_slang_videos(word, videos)
+    print(f"[영상 조회] '{word}' 검색 완료: {len(videos)}개 영상 발견")
+    
+    if not videos:
+        # 캐시된 영상이 있으면 반환 (부족하더라도)
+        if cached_videos:
+            print(f"[영상 조회] '{word}' - 캐시된 영상 반환 ({len(cached_videos)}개)")
             return {
-                "success": False,
+                "success": True,
                 "word": word,
-                "videos": [],
-                "message": f"'{word}' 키워드로 YouTube를 검색했지만 결과가 없습니다. 다른 키워드로 시도해보세요."
+                "videos": cached_videos,
+                "cached": True,
+                "message": "새로운 영상을 찾지 못했습니다. 캐시된 영상만 표시합니다."
             }
         
-        # 3. 영상 정보를 DB에 저장
-        for video in videos:
-            db.add_slang_video(
-                slang_word=word,
-                video_id=video['video_id'],
-                video_title=video.get('title'),
-                video_thumbnail=video.get('thumbnail'),
-                video_duration=video.get('duration', 0),
-                view_count=video.get('view_count', 0),
-                like_count=video.get('like_count', 0),
-                caption_match_times=video.get('match_times', [])
-            )
-        
-        # 4. 응답 형식 맞추기
-        formatted_videos = []
-        for video in videos:
-            formatted_videos.append({
-                'video_id': video['video_id'],
-                'title': video.get('title', ''),
-                'thumbnail': video.get('thumbnail', ''),
-                'duration': video.get('duration', 0),
-                'view_count': video.get('view_count', 0),
-                'like_count': video.get('like_count', 0),
-                'match_times': video.get('match_times', [])
-            })
-        
+        # YouTube API가 설정되어 있는데 결과가 없으면
+        print(f"[영상 조회] '{word}' - 검색 결과 없음 (API 설정: {youtube_service.youtube is not None})")
         return {
-            "success": True,
+            "success": False,
             "word": word,
-            "videos": formatted_videos,
-            "cached": False
+            "videos": [],
+            "message": f"'{word}' 키워드로 YouTube를 검색했지만 결과가 없습니다. 다른 키워드로 시도해보세요."
         }
     
-    except Exception as e:
-        print(f"[ERROR] 영상 조회 실패: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    # 3. 응답 형식 맞추기
+    formatted_videos = []
+    for video in videos:
+        formatted_videos.append({
+            'video_id': video['video_id'],
+            'title': video.get('title', ''),
+            'thumbnail': video.get('thumbnail', ''),
+            'duration': video.get('duration', 0),
+            'view_count': video.get('view_count', 0),
+            'like_count': video.get('like_count', 0),
+            'match_times': video.get('match_times', [])
+        })
+    
+    return {
+        "success": True,
+        "word": word,
+        "videos": formatted_videos,
+        "cached": False
+    }
 
 @app.get("/ranking/enhanced")
 async def get_ranking_with_videos(limit: int = 20, include_videos: bool = True):
     """랭킹 + 각 신조어별 영상 정보 포함"""
     try:
         # 기본 랭킹 조회
-        ranking = db.get_ranking(limit)
+        ranking = await run_db(db.get_ranking, limit)
         
         if not include_videos:
             return {"success": True, "data": ranking}
@@ -626,7 +784,7 @@ async def get_ranking_with_videos(limit: int = 20, include_videos: bool = True):
         top_words = ranking[:5]
         
         enhanced_ranking = []
-        youtube_service = YouTubeService()
+        missing_videos = []
         
         for item in ranking:
             enhanced_item = item.copy()
@@ -634,12 +792,12 @@ async def get_ranking_with_videos(limit: int = 20, include_videos: bool = True):
             # 상위 5개만 영상 정보 추가
             if item in top_words:
                 # 캐시된 영상 확인
-                videos = db.get_videos_for_word(item['word'], limit=3)
+                videos = await run_db(db.get_videos_for_word, item['word'], limit=3)
                 
-                # 캐시가 없거나 부족하면 API 호출 (비동기로 처리하거나 간단히 스킵)
+                # 캐시가 없으면 응답은 빈 리스트로 두고 백그라운드에서 미리 가져오기
                 if not videos:
-                    # 비동기로 처리하지 않고, 간단히 빈 리스트로 설정
                     videos = []
+                    missing_videos.append(item['word'])
                 
                 enhanced_item['videos'] = videos
             else:
@@ -647,6 +805,9 @@ async def get_ranking_with_videos(limit: int = 20, include_videos: bool = True):
             
             enhanced_ranking.append(enhanced_item)
         
+        if missing_videos and video_prefetcher is not None:
+            video_prefetcher.submit(missing_videos)
+        
         return {
             "success": True,
             "data": enhanced_ranking,
@@ -659,217 +820,346 @@ async def get_ranking_with_videos(limit: int = 20, include_videos: bool = True):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+# 근접 단어로 간주할 자모 유사도 (0~1)
+SEARCH_FUZZY_THRESHOLD = float(os.getenv('SEARCH_FUZZY_THRESHOLD', '0.7') or 0.7)
+
+def find_near_miss_slang(word: str) -> Optional[Dict]:
+    """오타 허용 검색으로 이미 분석된 근접 단어 찾기 (없으면 None)"""
+    for suggestion in db.suggest_slangs(word, limit=5):
+        if suggestion['match'] == 'fulltext' or suggestion['score'] < SEARCH_FUZZY_THRESHOLD:
+            continue
+        candidate = db.get_slang_by_word(suggestion['word'])
+        if candidate and candidate.get('meaning') and '분석 중' not in candidate['meaning']:
+            return candidate
+    return None
+
+@app.get("/slangs/suggest")
+async def suggest_slangs(q: str, limit: int = 10):
+    """신조어 자동완성 (자모 접두어 + 오타 허용 + 의미 전문 검색)"""
+    if db is None:
+        return {"success": True, "data": []}
+    try:
+        limit = max(1, min(limit, 50))
+        return {"success": True, "query": q, "data": await run_db(db.suggest_slangs, q, limit=limit)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/slangs/search")
 async def search_slang(word: str):
     """신조어 검색 (의미 + 예문 + 영상)"""
     try:
-        from crawler import Crawler
-        from youtube_service import YouTubeService
-        
         word = word.strip()
         if not word:
             raise HTTPException(status_code=400, detail="검색할 단어를 입력해주세요.")
         
-        print(f"[검색] '{word}' 검색 시작")
+        return await word_requests.run(('search', word), lambda: load_slang_search(word))
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"[ERROR] 신조어 검색 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def load_slang_search(word: str) -> Dict:
+    """저장된 검색 결과 → 근접 단어 → 의미/예문/영상 수집
+    
+    저장된 결과가 있으면 바로 반환하고, 오래되었거나 덜 채워진 부분은 백그라운드에서 갱신합니다.
+    """
+    print(f"[검색] '{word}' 검색 시작")
+    
+    # 0. 저장된 검색 결과 (stale-while-revalidate)
+    entry = await run_db(search_results.get, word)
+    
+    if entry is None:
+        # 1. 데이터베이스에서 기존 정보 확인 (DB 풀)
+        db_result = await run_db(db.get_slang_by_word, word)
+        
+        # 1-1. 정확히 일치하는 단어가 없으면 오타/근접 단어 확인 (외부 API 호출 전에)
+        if not db_result:
+            near_miss = await run_db(find_near_miss_slang, word)
+            if near_miss:
+                print(f"[검색] '{word}' → 근접 단어 '{near_miss['word']}' 결과 반환 (외부 API 호출 생략)")
+                return {
+                    "success": True,
+                    "query": word,
+                    "corrected": True,
+                    "data": {
+                        "word": near_miss['word'],
+                        "meaning": near_miss['meaning'],
+                        "examples": near_miss.get('examples', [])[:5],
+                        "videos": await run_db(db.get_videos_for_word, near_miss['word'], limit=5)
+                    }
+                }
+        
+        if db_result and is_usable_meaning(db_result.get('meaning')):
+            # 1-2. 의미가 이미 있으면 DB 내용으로 바로 응답 (부족한 예문/영상은 백그라운드에서)
+            entry = await run_db(store_slang_search_from_db, word, db_result)
+        else:
+            # 2~5. 보여줄 의미가 없으면 요청 안에서 수집 (YouTube, GPT 호출 - 외부 풀)
+            result = await run_external(build_slang_search_result, word, db_result)
+            entry = await run_db(search_results.store, word, result)
+    
+    stale = search_results.stale_parts(entry)
+    refreshing = search_refresher.submit(word, stale) if stale else False
+    if stale:
+        print(f"[검색] '{word}' 저장된 결과 반환, 백그라운드 갱신: {', '.join(stale)}")
+    return search_results.response(entry, stale, refreshing)
+
+def is_usable_meaning(meaning: Optional[str]) -> bool:
+    """보여줄 수 있는 의미인지 (비어 있거나 '(분석 중)' 임시 문구가 아님)"""
+    return bool(meaning) and '분석 중' not in meaning
+
+def manual_meaning_text(word: str) -> str:
+    """수동 의미 사전의 의미 (없으면 빈 문자열)"""
+    manual_data = get_manual_meaning(word)
+    if not manual_data:
+        return ''
+    if isinstance(manual_data, dict):
+        return manual_data.get('meaning', '') or ''
+    # 구 형식 호환
+    return str(manual_data)
+
+def store_slang_search_from_db(word: str, db_result: Dict) -> Dict:
+    """DB에 저장된 의미/예문/영상으로 검색 결과 저장 (수동 의미 우선, 채워진 부분만 현재 시각으로)"""
+    examples = []
+    manual_data = get_manual_meaning(word)
+    if manual_data and isinstance(manual_data, dict) and isinstance(manual_data.get('examples'), list):
+        examples.extend(manual_data['examples'])
+    existing_examples = db_result.get('examples') or []
+    if isinstance(existing_examples, str):
+        existing_examples = json.loads(existing_examples)
+    examples.extend(example for example in existing_examples if example not in examples)
+    
+    result = {
+        "success": True,
+        "data": {
+            "word": word,
+            "meaning": manual_meaning_text(word) or db_result['meaning'],
+            "examples": examples[:5],
+            "videos": db.get_videos_for_word(word, limit=5)
+        }
+    }
+    incomplete = search_results.incomplete_parts(result)
+    return search_results.store(word, result, [part for part in SEARCH_PARTS if part not in incomplete])
+
+def refresh_slang_search(word: str, parts: Tuple[str, ...]):
+    """오래된/덜 채워진 부분 다시 만들기 (백그라운드 작업자)"""
+    result = build_slang_search_result(word, db.get_slang_by_word(word), force=parts)
+    search_results.store(word, result, parts)
+    print(f"[검색 갱신] '{word}' 갱신 완료: {', '.join(parts)}")
+
+# 단어별 검색 결과 저장소 + 백그라운드 갱신 작업자
+search_results = SearchResultCache(get_cache_store())
+search_refresher = BackgroundRefresher(refresh_slang_search)
+
+def invalidate_crawled_searches(words: List[str]):
+    """크롤링으로 의미가 바뀐 단어의 저장된 검색 결과 삭제 (작업 스레드에서 호출)"""
+    search_results.invalidate(words)
+    word_requests.invalidate_threadsafe(('search', word) for word in words)
+
+if crawl_jobs is not None:
+    crawl_jobs.add_persist_hook(invalidate_crawled_searches)
+
+class SearchVideoMaterial:
+    """신조어 검색 요청 하나에서 공유하는 영상 검색/자막 결과
+    
+    영상 검색은 요청당 한 번, 자막은 영상당 한 번만 가져와 의미 맥락/예문/영상 목록에 재사용합니다.
+    """
+    
+    def __init__(self, word: str, max_results: int = 10):
+        self.word = word
+        self.max_results = max_results
+        self.youtube_service = get_youtube_service() if get_youtube_service else None
+        self._videos: Optional[List[Dict]] = None
+        self._captions: Dict[str, List[Dict]] = {}
+    
+    @property
+    def available(self) -> bool:
+        return self.youtube_service is not None and self.youtube_service.youtube is not None
+    
+    def videos(self) -> List[Dict]:
+        """영상 검색 (첫 호출에서만 실행)"""
+        if self._videos is None:
+            self._videos = self.youtube_service.find_videos_with_slang(
+                self.word, max_results=self.max_results, captions_out=self._captions
+            )
+        return self._videos
+    
+    def captions(self, video_id: str) -> List[Dict]:
+        """파싱된 자막 (검색 중 분석한 영상은 그 결과 재사용)"""
+        if video_id not in self._captions:
+            caption_text = self.youtube_service.get_video_captions(video_id)
+            self._captions[video_id] = self.youtube_service.parse_srt(caption_text) if caption_text else []
+        return self._captions[video_id]
+
+def build_slang_search_result(word: str, db_result: Optional[Dict], force: Tuple[str, ...] = ()) -> Dict:
+    """의미 생성 + 예문/영상 수집 후 저장 (블로킹 - 외부 풀에서 실행)
+    
+    force에 넣은 부분('meaning', 'examples', 'videos')은 저장된 값이 있어도 다시 만듭니다.
+    """
+    material = SearchVideoMaterial(word)
+    
+    # 2. 의미 생성 (수동 의미 우선, GPT는 필요시)
+    from meaning_extractor import MeaningExtractor, get_openai_client
+    
+    db_meaning = db_result.get('meaning', '') if db_result else ''
+    meaning = db_meaning
+    
+    if 'meaning' in force or not is_usable_meaning(meaning):
+        # 저장된 의미 다시 읽기 (수동 의미 → DB 의미)
+        meaning = manual_meaning_text(word) or db_meaning
+    
+    if not is_usable_meaning(meaning):
+        # 수동/DB 의미가 없거나 임시 문구일 때만 GPT로 생성
+        print(f"[검색] '{word}' 의미 추출 중...")
         
-        # 1. 데이터베이스에서 기존 정보 확인
-        db_result = db.get_slang_by_word(word)
+        # GPT 클라이언트 가져오기 (크롤러 전체를 만들지 않고 공용 클라이언트만 사용)
+        openai_client = get_openai_client()
         
-        # 2. 의미 생성 (수동 의미 우선, GPT는 필요시)
-        from meaning_extractor import MeaningExtractor
-        from crawler import Crawler
+        # 의미 추출기 초기화 (GPT 클라이언트 포함)
+        extractor = MeaningExtractor(openai_client=openai_client)
         
-        meaning = db_result.get('meaning', '') if db_result else ''
+        # 컨텍스트와 예문 준비
+        contexts = []
+        examples = []
         
-        if not meaning or meaning == '' or '분석 중' in meaning:
-            print(f"[검색] '{word}' 의미 추출 중...")
-            
-            # 수동 의미 우선 적용
-            manual_data = get_global_crawler().manual_meanings.get(word)
-            if manual_data:
-                if isinstance(manual_data, dict):
-                    meaning = manual_data.get('meaning', '')
+        if db_result:
+            # 기존 예문을 컨텍스트로 사용
+            existing_examples = db_result.get('examples', [])
+            if existing_examples:
+                if isinstance(existing_examples, str):
+                    examples = json.loads(existing_examples)
                 else:
-                    # 구 형식 호환
-                    meaning = str(manual_data)
-            
-            # GPT 클라이언트 가져오기 (수동 의미 없을 때만)
-            crawler = Crawler() if not manual_data else global_crawler_for_meanings
-            openai_client = crawler.openai_client if crawler else None
-            
-            # 의미 추출기 초기화 (GPT 클라이언트 포함)
-            extractor = MeaningExtractor(openai_client=openai_client)
-            
-            # 컨텍스트와 예문 준비
-            contexts = []
-            examples = []
-            
-            if db_result:
-                # 기존 예문을 컨텍스트로 사용
-                existing_examples = db_result.get('examples', [])
-                if existing_examples:
-                    if isinstance(existing_examples, str):
-                        examples = json.loads(existing_examples)
-                    else:
-                        examples = existing_examples
-                    contexts = examples.copy()
-            
-            # 영상 자막에서 예문 수집 (아직 수집되지 않은 경우)
-            if len(examples) < 3:
-                from youtube_service import YouTubeService
-                youtube_service = YouTubeService()
-                if youtube_service.youtube:
-                    try:
-                        videos = youtube_service.find_videos_with_slang(word, max_results=3)
-                        for video in videos[:2]:
-                            try:
-                                caption_text = youtube_service.get_video_captions(video['video_id'])
-                                if caption_text:
-                                    captions = youtube_service.parse_srt(caption_text)
-                                    for caption in captions[:10]:  # 상위 10개만
-                                        text = caption['text'].strip()
-                                        if word in text and len(text) > 10:
-                                            contexts.append(text[:200])
-                                            if len(contexts) >= 5:
-                                                break
-                            except:
-                                continue
-                    except Exception as e:
-                        print(f"[검색] 예문 수집 실패: {e}")
-            
-            # 여러 방법으로 의미 추출 시도
-            meaning = extractor.extract_meaning(word, contexts=contexts, examples=examples)
-            
-            print(f"[검색] '{word}' 의미 추출 완료: {meaning}")
+                    examples = existing_examples
+                contexts = examples.copy()
         
-        # 3. 예문 수집 (수동 예문 우선 → DB → 영상 자막)
-        examples = []
+        # 영상 자막에서 예문 수집 (아직 수집되지 않은 경우)
+        if len(examples) < 3 and material.available:
+            try:
+                for video in material.videos()[:2]:
+                    for caption in material.captions(video['video_id'])[:10]:  # 상위 10개만
+                        text = caption['text'].strip()
+                        if word in text and len(text) > 10:
+                            contexts.append(text[:200])
+                            if len(contexts) >= 5:
+                                break
+            except Exception as e:
+                print(f"[검색] 예문 수집 실패: {e}")
         
-        # 수동 예문 우선 적용
-        manual_data = get_global_crawler().manual_meanings.get(word)
-        if manual_data and isinstance(manual_data, dict):
-            manual_examples = manual_data.get('examples', [])
-            if manual_examples and isinstance(manual_examples, list):
-                examples.extend(manual_examples)
-                print(f"[검색] '{word}' 수동 예문 {len(manual_examples)}개 사용")
+        # 여러 방법으로 의미 추출 시도
+        meaning = extractor.extract_meaning(word, contexts=contexts, examples=examples)
         
-        # 기존 예문이 있으면 추가 (수동 예문이 부족할 때만)
-        if len(examples) < 3 and db_result and db_result.get('examples'):
-            existing_examples = json.loads(db_result['examples']) if isinstance(db_result['examples'], str) else db_result['examples']
-            examples.extend(existing_examples)
+        print(f"[검색] '{word}' 의미 추출 완료: {meaning}")
+    
+    # 3. 예문 수집 (수동 예문 우선 → DB → 영상 자막)
+    examples = []
+    
+    # 수동 예문 우선 적용
+    manual_data = get_manual_meaning(word)
+    if manual_data and isinstance(manual_data, dict):
+        manual_examples = manual_data.get('examples', [])
+        if manual_examples and isinstance(manual_examples, list):
+            examples.extend(manual_examples)
+            print(f"[검색] '{word}' 수동 예문 {len(manual_examples)}개 사용")
+    
+    # 기존 예문이 있으면 추가 (수동 예문이 부족할 때만)
+    if len(examples) < 3 and db_result and db_result.get('examples'):
+        existing_examples = json.loads(db_result['examples']) if isinstance(db_result['examples'], str) else db_result['examples']
+        examples.extend(existing_examples)
+    
+    # 예문이 부족하면 영상 자막에서 추출
+    if (len(examples) < 5 or 'examples' in force) and material.available:
+        print(f"[검색] '{word}' 예문 수집 중... (현재 {len(examples)}개)")
         
-        # 예문이 부족하면 영상 자막에서 추출
-        if len(examples) < 5:
-            print(f"[검색] '{word}' 예문 수집 중... (현재 {len(examples)}개)")
-            youtube_service = YouTubeService()
+        # 영상 자막에서 예문 추출
+        for video in material.videos():
+            if len(examples) >= 10:  # 충분히 수집했으면 중단
+                break
             
-            if youtube_service.youtube:
-                # 영상 검색
-                videos = youtube_service.find_videos_with_slang(word, max_results=10)
-                
-                # 영상 자막에서 예문 추출
-                for video in videos:
-                    if len(examples) >= 10:  # 충분히 수집했으면 중단
+            try:
+                # 단어가 포함된 자막 문장 추출
+                for caption in material.captions(video['video_id']):
+                    if len(examples) >= 10:
                         break
                     
-                    try:
-                        caption_text = youtube_service.get_video_captions(video['video_id'])
-                        if caption_text:
-                            captions = youtube_service.parse_srt(caption_text)
-                            
-                            # 단어가 포함된 자막 문장 추출
-                            for caption in captions:
-                                if len(examples) >= 10:
-                                    break
-                                
-                                text = caption['text'].strip()
-                                if word in text:
-                                    # 문장 정리 (중복 제거, 길이 필터링)
-                                    sentence = text.strip()
-                                    # 특수 문자나 URL 제거
-                                    sentence = re.sub(r'http[s]?://\S+', '', sentence)
-                                    sentence = re.sub(r'\[.*?\]', '', sentence)
-                                    sentence = sentence.strip()
-                                    
-                                    # 유효한 문장인지 확인
-                                    if (len(sentence) > 10 and len(sentence) < 200 and 
-                                        sentence not in examples and 
-                                        not sentence.startswith('http')):
-                                        examples.append(sentence)
-                            
-                            if len(examples) >= 10:
-                                break
-                    except Exception as e:
-                        print(f"[검색] 예문 추출 실패 ({video.get('video_id', 'unknown')}): {e}")
-                        continue
-        
-        # 예문이 없으면 기본 메시지
-        if not examples:
-            examples = [f"{word}를 사용한 예문을 찾는 중입니다..."]
-        
-        # 4. 영상 정보 가져오기
-        videos = []
-        youtube_service = YouTubeService()
-        if youtube_service.youtube:
-            # 캐시된 영상 먼저 확인
-            cached_videos = db.get_videos_for_word(word, limit=5)
-            if cached_videos and len(cached_videos) >= 3:
-                videos = cached_videos[:5]
-            else:
-                # 새로 검색
-                videos_data = youtube_service.find_videos_with_slang(word, max_results=5)
-                
-                # 영상 정보 저장
-                for video in videos_data:
-                    db.add_slang_video(
-                        slang_word=word,
-                        video_id=video['video_id'],
-                        video_title=video.get('title'),
-                        video_thumbnail=video.get('thumbnail'),
-                        video_duration=video.get('duration', 0),
-                        view_count=video.get('view_count', 0),
-                        like_count=video.get('like_count', 0),
-                        caption_match_times=video.get('match_times', [])
-                    )
-                
-                videos = [{
-                    'video_id': v['video_id'],
-                    'title': v.get('title', ''),
-                    'thumbnail': v.get('thumbnail', ''),
-                    'duration': v.get('duration', 0),
-                    'view_count': v.get('view_count', 0),
-                    'like_count': v.get('like_count', 0)
-                } for v in videos_data]
-        
-        # 5. 데이터베이스에 업데이트 (의미나 예문이 새로 생성된 경우)
-        if not db_result or (meaning and meaning != db_result.get('meaning')):
-            db.add_slang(
-                word=word,
-                meaning=meaning,
-                examples=examples[:5],
-                usage_count=db_result.get('usage_count', 1) if db_result else 1,
-                method=db_result.get('method', 'search') if db_result else 'search'
-            )
-        
-        print(f"[검색] '{word}' 검색 완료 - 의미: {meaning}, 예문: {len(examples)}개, 영상: {len(videos)}개")
-        
-        return {
-            "success": True,
-            "data": {
-                "word": word,
-                "meaning": meaning,
-                "examples": examples[:5],
-                "videos": videos[:5]
-            }
-        }
+                    text = caption['text'].strip()
+                    if word in text:
+                        # 문장 정리 (중복 제거, 길이 필터링)
+                        sentence = text.strip()
+                        # 특수 문자나 URL 제거
+                        sentence = re.sub(r'http[s]?://\S+', '', sentence)
+                        sentence = re.sub(r'\[.*?\]', '', sentence)
+                        sentence = sentence.strip()
+                        
+                        # 유효한 문장인지 확인
+                        if (len(sentence) > 10 and len(sentence) < 200 and 
+                            sentence not in examples and 
+                            not sentence.startswith('http')):
+                            examples.append(sentence)
+            except Exception as e:
+                print(f"[검색] 예문 추출 실패 ({video.get('video_id', 'unknown')}): {e}")
+                continue
     
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"[ERROR] 신조어 검색 실패: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    # 예문이 없으면 기본 메시지
+    if not examples:
+        examples = [f"{word}를 사용한 예문을 찾는 중입니다..."]
+    
+    # 4. 영상 정보 가져오기
+    videos = []
+    if material.available:
+        # 캐시된 영상 먼저 확인
+        cached_videos = db.get_videos_for_word(word, limit=5)
+        if cached_videos and len(cached_videos) >= 3 and 'videos' not in force:
+            videos = cached_videos[:5]
+        else:
+            # 의미/예문 수집에서 찾은 영상 재사용 (아직 검색하지 않았으면 여기서 한 번 검색)
+            videos_data = material.videos()[:5]
+            
+            # 영상 정보 저장
+            for video in videos_data:
+                db.add_slang_video(
+                    slang_word=word,
+                    video_id=video['video_id'],
+                    video_title=video.get('title'),
+                    video_thumbnail=video.get('thumbnail'),
+                    video_duration=video.get('duration', 0),
+                    view_count=video.get('view_count', 0),
+                    like_count=video.get('like_count', 0),
+                    caption_match_times=video.get('match_times', [])
+                )
+            
+            videos = [{
+                'video_id': v['video_id'],
+                'title': v.get('title', ''),
+                'thumbnail': v.get('thumbnail', ''),
+                'duration': v.get('duration', 0),
+                'view_count': v.get('view_count', 0),
+                'like_count': v.get('like_count', 0)
+            } for v in videos_data]
+    
+    # 5. 데이터베이스에 업데이트 (DB에 의미가 없거나 임시 문구였는데 새 의미가 생긴 경우만 - 기존 의미는 덮어쓰지 않음)
+    if not db_result or (is_usable_meaning(meaning) and not is_usable_meaning(db_meaning)):
+        db.add_slang(
+            word=word,
+            meaning=meaning,
+            examples=examples[:5],
+            usage_count=db_result.get('usage_count', 1) if db_result else 1,
+            method=db_result.get('method', 'search') if db_result else 'search'
+        )
+    
+    print(f"[검색] '{word}' 검색 완료 - 의미: {meaning}, 예문: {len(examples)}개, 영상: {len(videos)}개")
+    
+    return {
+        "success": True,
+        "data": {
+            "word": word,
+            "meaning": meaning,
+            "examples": examples[:5],
+            "videos": videos[:5]
+        }
+    }
 
 if __name__ == "__main__":
     # 스케줄러 시작 (선택적)
@@ -0,0 +1,207 @@
+"""
+신조어 의미 생성 엔진 (동시 배치 + 재시도)
+후보 단어를 예상 토큰 수에 맞춰 묶고, 분당 요청 한도 안에서 여러 묶음을 동시에 GPT로 보냅니다.
+- 응답은 왔지만 빠진 단어가 있으면 묶음을 반으로 나눠 다시 요청하고, 한 단어까지 줄어들면 정해진 횟수만큼 재시도
+- Rate Limit(429)을 받으면 모든 작업자가 함께 잠시 쉬었다가 같은 묶음을 다시 요청
+- 사용 한도 소진(insufficient_quota)이면 남은 요청을 모두 취소하고 받은 결과만 반환
+- 묶음 결과는 도착하는 대로 콜백으로 넘겨 바로 저장 (중간에 멈춰도 받은 의미는 남음)
+"""
+import os
+import time
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from meaning_extractor import (BATCH_CONTEXT_CHARS, BATCH_OUTPUT_TOKENS_BASE,
+                               BATCH_OUTPUT_TOKENS_PER_WORD, MeaningQuotaExceededError,
+                               MeaningRateLimitError, batch_max_tokens)
+
+# 분당 GPT 요청 수 / 동시에 보내는 묶음 수
+MEANING_RPM = float(os.getenv('MEANING_RPM', '60') or 60)
+MEANING_WORKERS = int(os.getenv('MEANING_WORKERS', '4') or 4)
+# 묶음 하나의 예상 토큰 상한 (입력 + 응답) / 묶음당 최대 단어 수
+MEANING_CHUNK_TOKENS = int(os.getenv('MEANING_CHUNK_TOKENS', '1500') or 1500)
+MEANING_CHUNK_MAX_WORDS = int(os.getenv('MEANING_CHUNK_MAX_WORDS', '20') or 20)
+# 단어 하나만 보내는 재요청 최대 횟수 (Rate Limit 재요청 제외)
+MEANING_MAX_ATTEMPTS = int(os.getenv('MEANING_MAX_ATTEMPTS', '3') or 3)
+# Rate Limit 재요청 한도 / 첫 대기 시간(초, 연속될수록 두 배)
+MEANING_RATE_LIMIT_RETRIES = int(os.getenv('MEANING_RATE_LIMIT_RETRIES', '5') or 5)
+MEANING_RATE_LIMIT_BACKOFF = float(os.getenv('MEANING_RATE_LIMIT_BACKOFF', '5') or 5)
+
+# 프롬프트(지시문 + 시스템 메시지)의 대략적인 토큰 수
+PROMPT_TOKENS = 150
+
+
+def estimate_item_tokens(item: Dict) -> int:
+    """단어 하나가 입력/응답에 차지하는 예상 토큰 수 (한글은 대략 글자당 1토큰)"""
+    contexts = item.get('contexts') or []
+    context_chars = min(len(contexts[0]), BATCH_CONTEXT_CHARS) if contexts else 0
+    # {"word": .., "ctx": ..} 틀 + 단어 + 문맥
+    input_tokens = 10 + len(item['word']) + context_chars
+    return input_tokens + BATCH_OUTPUT_TOKENS_PER_WORD
+
+
+def plan_chunks(items: List[Dict], token_budget: int = MEANING_CHUNK_TOKENS,
+                max_words: int = MEANING_CHUNK_MAX_WORDS) -> List[List[Dict]]:
+    """예상 토큰 합이 상한을 넘지 않게 순서대로 묶음"""
+    chunks: List[List[Dict]] = []
+    current: List[Dict] = []
+    used = PROMPT_TOKENS + BATCH_OUTPUT_TOKENS_BASE
+    for item in items:
+        tokens = estimate_item_tokens(item)
+        if current and (used + tokens > token_budget or len(current) >= max_words):
+            chunks.append(current)
+            current, used = [], PROMPT_TOKENS + BATCH_OUTPUT_TOKENS_BASE
+        current.append(item)
+        used += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class RequestRateLimiter:
+    """분당 요청 수 제한 (요청 시각을 일정 간격으로 배정, Rate Limit 시 전체 대기)"""
+
+    def __init__(self, rpm: float = MEANING_RPM):
+        self.interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        """다음 요청 시각까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def pause(self, seconds: float):
+        """Rate Limit 응답 후 모든 요청을 seconds 동안 멈춤"""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RequestRateLimiter:
+    """프로세스 공용 GPT 요청 제한 (크롤링이 겹쳐도 한도를 함께 나눠 씀)"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RequestRateLimiter()
+    return _rate_limiter
+
+
+class MeaningEngine:
+    """단어 묶음을 동시에 요청하고 빠진 단어를 다시 요청해 모든 후보의 의미를 채움"""
+
+    def __init__(self, extractor, rate_limiter: Optional[RequestRateLimiter] = None,
+                 workers: int = MEANING_WORKERS, max_attempts: int = MEANING_MAX_ATTEMPTS,
+                 on_results: Optional[Callable[[Dict[str, str]], None]] = None):
+        self.extractor = extractor
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.on_results = on_results
+        # 사용 한도 소진 시 실행 중인 요청의 Rate Limit 재요청도 멈춤
+        self._stopped = threading.Event()
+
+    def _request(self, chunk: List[Dict]) -> Optional[Dict[str, str]]:
+        """묶음 하나 요청 (Rate Limit이면 대기 후 같은 묶음을 다시 요청, 재요청 한도를 넘으면 None)"""
+        for retry in range(MEANING_RATE_LIMIT_RETRIES + 1):
+            self.rate_limiter.acquire()
+            if self._stopped.is_set():
+                return None
+            try:
+                return self.extractor.extract_meanings_batch(
+                    chunk, max_tokens=batch_max_tokens(len(chunk)), raise_errors=True
+                )
+            except MeaningRateLimitError:
+                wait_seconds = MEANING_RATE_LIMIT_BACKOFF * (2 ** retry)
+                print(f"[의미추출] Rate Limit - 전체 요청 {wait_seconds:.0f}초 대기 후 재시도")
+                self.rate_limiter.pause(wait_seconds)
+        return None
+
+    def _retry_chunks(self, missing: List[Dict], attempts: Dict[str, int]) -> List[List[Dict]]:
+        """빠진 단어 재요청 묶음 (여러 개면 반으로 나눔, 단어별 요청 횟수를 다 쓴 단어는 제외)"""
+        if len(missing) > 1:
+            half = (len(missing) + 1) // 2
+            return [missing[:half], missing[half:]]
+        return [[item] for item in missing if attempts[item['word']] < self.max_attempts]
+
+    def generate(self, items: List[Dict]) -> Dict[str, str]:
+        """{'word', 'contexts'} 목록의 의미 생성 → {word: meaning} (끝까지 실패한 단어는 빠짐)
+        응답을 받지 못한 묶음(API 오류, Rate Limit 재요청 한도 초과)은 나누거나 다시 요청하지 않습니다.
+        """
+        items = [item for item in items if item.get('word')]
+        if not items or not self.extractor.openai_client:
+            return {}
+
+        self._stopped.clear()
+        results: Dict[str, str] = {}
+        attempts = {item['word']: 0 for item in items}
+        chunks = plan_chunks(items)
+        total = len(items)
+        started = time.monotonic()
+        requests = 0
+        print(f"[의미추출] {total}개 단어를 {len(chunks)}개 묶음으로 동시 요청 (작업자 {self.workers}개)")
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="meaning") as executor:
+            pending = {}
+            aborted = False
+
+            def submit(chunk: List[Dict]):
+                # 한 단어만 보낸 요청만 단어별 요청 횟수로 셈 (나눠서 다시 보내는 횟수는 묶음 크기로 제한됨)
+                if len(chunk) == 1:
+                    attempts[chunk[0]['word']] += 1
+                if not aborted:
+                    pending[executor.submit(self._request, chunk)] = chunk
+
+            for chunk in chunks:
+                submit(chunk)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    if future.cancelled():
+                        continue
+                    requests += 1
+                    try:
+                        found = future.result()
+                    except MeaningQuotaExceededError:
+                        # 다시 시도해도 실패하므로 대기 중인 요청을 취소하고 중단 (이미 받은 결과는 유지)
+                        if not aborted:
+                            aborted = True
+                            self._stopped.set()
+                            for other in pending:
+                                other.cancel()
+                            print(f"[의미추출] GPT 사용 한도 소진 - 남은 요청 취소")
+                        continue
+                    except Exception as e:
+                        print(f"[의미추출] 묶음 요청 실패 ({len(chunk)}개): {e}")
+                        continue
+                    if found is None:
+                        print(f"[의미추출] Rate Limit 재요청 한도 초과 - 묶음 {len(chunk)}개 건너뜀")
+                        continue
+                    words = {item['word'] for item in chunk}
+                    found = {word: meaning for word, meaning in found.items() if word in words}
+                    if found:
+                        results.update(found)
+                        if self.on_results is not None:
+                            try:
+                                self.on_results(found)
+                            except Exception as e:
+                                print(f"[의미추출] 결과 저장 실패: {e}")
+                    missing = [item for item in chunk if item['word'] not in results]
+                    for retry_chunk in self._retry_chunks(missing, attempts):
+                        submit(retry_chunk)
+                    print(f"[의미추출] 진행 {len(results)}/{total}개 (이번 묶음 {len(found)}/{len(chunk)}개)")
+
+        failed = total - len(results)
+        print(f"[의미추출] 완료: {len(results)}/{total}개 의미 생성, 실패 {failed}개 "
+              f"(요청 {requests}회, {time.monotonic() - started:.1f}초)")
+        return results
@@ -8,6 +8,54 @@ from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 from collections import Counter
 import os
+import json
+
+# 배치 요청에 넣는 문맥 길이 (자)
+BATCH_CONTEXT_CHARS = 50
+# 배치 응답 토큰 상한 = 단어당 토큰 * 단어 수 + JSON 틀
+BATCH_OUTPUT_TOKENS_PER_WORD = int(os.getenv('MEANING_OUTPUT_TOKENS_PER_WORD', '60') or 60)
+BATCH_OUTPUT_TOKENS_BASE = 30
+
+_BATCH_ITEM = re.compile(r'\{\s*"word"\s*:\s*"((?:[^"\\]|\\.)*)"\s*,\s*"meaning"\s*:\s*"((?:[^"\\]|\\.)*)"\s*\}')
+
+
+class MeaningRateLimitError(Exception):
+    """GPT Rate Limit (429) - 잠시 뒤 다시 시도해야 함"""
+
+
+class MeaningQuotaExceededError(Exception):
+    """GPT 사용 한도 소진 (insufficient_quota) - 다시 시도해도 성공하지 않음"""
+
+
+def is_quota_exhausted_error(error: Exception) -> bool:
+    return 'insufficient_quota' in str(error).lower()
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """잠시 뒤 다시 시도할 수 있는 Rate Limit (사용 한도 소진은 제외)"""
+    error_str = str(error)
+    if is_quota_exhausted_error(error):
+        return False
+    return '429' in error_str or 'rate_limit' in error_str.lower()
+
+
+def batch_max_tokens(word_count: int) -> int:
+    """단어 수에 맞춘 배치 응답 토큰 상한 (응답이 잘리지 않도록)"""
+    return BATCH_OUTPUT_TOKENS_BASE + BATCH_OUTPUT_TOKENS_PER_WORD * max(1, word_count)
+
+
+def _salvage_batch_results(content: str) -> Dict[str, str]:
+    """잘린 배치 응답에서 완성된 {"word", "meaning"} 항목만 추출"""
+    out = {}
+    for raw_word, raw_meaning in _BATCH_ITEM.findall(content or ''):
+        try:
+            word, meaning = json.loads(f'"{raw_word}"'), json.loads(f'"{raw_meaning}"')
+        except ValueError:
+            continue
+        if word and meaning:
+            out[word] = meaning
+    return out
+
 
 class MeaningExtractor:
     """신조어 의미 추출기 (GPT API + 여러 방법 조합)"""
@@ -203,10 +251,14 @@ class MeaningExtractor:
         
         return None
     
-    def extract_meanings_batch(self, items: List[Dict]) -> Dict[str, str]:
+    def extract_meanings_batch(self, items: List[Dict], max_tokens: Optional[int] = None,
+                               raise_errors: bool = False) -> Dict[str, str]:
         """여러 단어의 의미를 한번에 GPT로 요청하여 반환.
         items: [{"word": str, "contexts": [str], "examples": [str]}]
-        returns: { word: meaning }
+        max_tokens: 응답 토큰 상한 (없으면 단어 수에 맞춰 계산)
+        raise_errors: API 오류 시 빈 결과 대신 예외 발생 (호출하는 쪽에서 재시도 여부 판단)
+            - Rate Limit → MeaningRateLimitError, 사용 한도 소진 → MeaningQuotaExceededError
+        returns: { word: meaning } - 응답이 잘렸으면 완성된 항목만
         """
         if not self.openai_client:
             return {}
@@ -219,11 +271,10 @@ class MeaningExtractor:
                     continue
                 # 컨텍스트 최소화: 첫 번째 컨텍스트만, 최대 50자만 사용
                 ctx_list = it.get("contexts") or []
-                ctx_short = ctx_list[0][:50] if ctx_list else ""
+                ctx_short = ctx_list[0][:BATCH_CONTEXT_CHARS] if ctx_list else ""
                 compact.append({"word": w, "ctx": ctx_short})
             if not compact:
                 return {}
-            import json
             user_prompt = (
                 "다음 신조어들의 의미를 웹에서 검색한 결과를 바탕으로 한국어로 매우 간결하게 생성하세요. 각 항목은 30자 이내.\n"
                 "입력은 JSON 배열이며, 각 객체는 {word, ctx}를 가집니다.\n"
@@ -238,9 +289,10 @@ class MeaningExtractor:
                 model="gpt-4o-mini",
                 messages=messages,
                 temperature=0.2,
-                max_tokens=200  # 토큰 절약
+                max_tokens=max_tokens or batch_max_tokens(len(compact)),
+                response_format={"type": "json_object"}
             )
-            content = resp.choices[0].message.content.strip()
+            content = (resp.choices[0].message.content or '').strip()
             # JSON 파싱 시도
             try:
                 data = json.loads(content)
@@ -253,16 +305,24 @@ class MeaningExtractor:
                         out[w] = m
                 return out
             except Exception:
-                print("[의미추출] 배치 응답 JSON 파싱 실패")
-                return {}
+                # 응답이 잘린 경우 완성된 {word, meaning} 항목만 살림
+                out = _salvage_batch_results(content)
+                print(f"[의미추출] 배치 응답 JSON 파싱 실패 (완성된 항목 {len(out)}/{len(compact)}개 사용)")
+                return out
         except Exception as e:
-            error_str = str(e)
-            # Rate Limit 에러는 재시도 없이 즉시 실패 처리
-            if '429' in error_str or 'rate_limit' in error_str.lower() or 'insufficient_quota' in error_str.lower():
+            if is_quota_exhausted_error(e):
+                print(f"[의미추출] 배치 GPT 사용 한도 소진")
+                if raise_errors:
+                    raise MeaningQuotaExceededError(str(e)) from e
+            elif is_rate_limit_error(e):
+                if raise_errors:
+                    raise MeaningRateLimitError(str(e)) from e
                 print(f"[의미추출] 배치 GPT Rate Limit: 재시도 없이 건너뜀")
             else:
                 print(f"[의미추출] 배치 GPT 실패: {e}")
-            return {}  # 재시도 없이 빈 결과 반환
+                if raise_errors:
+                    raise
+            return {}
 
     def extract_meaning(self, word: str, contexts: List[str] = None, examples: List[str] = None, use_gpt: bool = True) -> str:
         """의미 추출 메인 함수 (GPT만 사용)"""
@@ -274,3 +334,30 @@ class MeaningExtractor:
         
         # GPT 실패 또는 비활성화 시 기본값 반환
         return f'{word}의 의미 (분석 중)'
+
+
+_shared_openai_client = None
+_shared_openai_client_loaded = False
+
+
+def get_openai_client():
+    """환경설정에 따른 공용 OpenAI 클라이언트 (GPT 비활성화 시 None)
+    
+    GPT_USE_ENABLED=true 이고 OPENAI_API_KEY가 있을 때만 생성합니다.
+    검색 등 읽기 경로에서 Crawler 전체를 만들지 않고 GPT 클라이언트만 쓰기 위함입니다.
+    """
+    global _shared_openai_client, _shared_openai_client_loaded
+    if _shared_openai_client_loaded:
+        return _shared_openai_client
+    _shared_openai_client_loaded = True
+    use_gpt = os.getenv('GPT_USE_ENABLED', '').strip().lower() in ('true', '1')
+    api_key = os.getenv('OPENAI_API_KEY', '')
+    if not use_gpt or not api_key:
+        return None
+    try:
+        from openai import OpenAI
+        _shared_openai_client = OpenAI(api_key=api_key)
+    except Exception as e:
+        print(f"[의미추출] OpenAI 클라이언트 생성 실패: {e}")
+        _shared_openai_client = None
+    return _shared_openai_client
@@ -0,0 +1,197 @@
+"""
+병렬 토큰화 (대량 크롤링 말뭉치용)
+텍스트를 공유 메모리에 한 번만 올리고, 프로세스 풀 작업자가 각자 구간을 읽어
+부분 Counter(키워드 빈도)와 맥락 포스팅(단어 → 텍스트 번호)을 만든 뒤 트리 방식으로 병합합니다.
+작업자에게는 텍스트 대신 (공유 메모리 이름, 바이트 구간)만 전달됩니다.
+작업자는 spawn으로 새로 시작하고 이 모듈(표준 라이브러리만 사용)만 불러옵니다.
+서버 프로세스는 스레드 풀/모델 스레드가 돌고 있어 fork하면 잠긴 락을 물려받아 멈출 수 있기 때문입니다.
+"""
+import os
+import re
+import threading
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple, TypeVar
+
+KEYWORD_PATTERN = re.compile(r'[가-힣]{2,15}')
+CONTEXT_PATTERN = re.compile(r'[가-힣]{2,8}')
+# 공유 메모리 안에서 텍스트 구분자
+TEXT_SEPARATOR = b'\x00'
+
+T = TypeVar('T')
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def strip_particle(word: str, particles: Sequence[str]) -> str:
+    """조사 제거 (Crawler.remove_particles와 같은 규칙, particles는 긴 조사부터)"""
+    for particle in particles:
+        if word.endswith(particle):
+            return word[:-len(particle)]
+    return word
+
+
+def tree_reduce(parts: List[T], merge: Callable[[T, T], T]) -> Optional[T]:
+    """인접한 부분 결과를 두 개씩 병합 (순서 유지, 병합 크기를 고르게 유지)"""
+    if not parts:
+        return None
+    while len(parts) > 1:
+        merged = [merge(parts[i], parts[i + 1]) for i in range(0, len(parts) - 1, 2)]
+        if len(parts) % 2:
+            merged.append(parts[-1])
+        parts = merged
+    return parts[0]
+
+
+def _merge_counters(a: Counter, b: Counter) -> Counter:
+    if len(a) < len(b):
+        a, b = b, a
+    a.update(b)
+    return a
+
+
+def _merge_postings(a: Dict[str, List[int]], b: Dict[str, List[int]]) -> Dict[str, List[int]]:
+    # a가 앞 구간이므로 a 뒤에 b를 이어 붙여 텍스트 순서를 유지
+    for word, indexes in b.items():
+        existing = a.get(word)
+        if existing is None:
+            a[word] = indexes
+        else:
+            existing.extend(indexes)
+    return a
+
+
+def _read_texts(name: str, start: int, end: int) -> List[str]:
+    # 작업자는 연결만 하고 닫음 (unlink는 부모 프로세스가 담당)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = bytes(shm.buf[start:end])
+    finally:
+        shm.close()
+    return data.decode('utf-8').split(TEXT_SEPARATOR.decode())
+
+
+def _count_shard(task: Tuple[str, int, int, Tuple[str, ...]]) -> Counter:
+    name, start, end, particles = task
+    counts = Counter()
+    for text in _read_texts(name, start, end):
+        for word in KEYWORD_PATTERN.findall(text):
+            cleaned = strip_particle(word, particles)
+            if len(cleaned) >= 2:
+                counts[cleaned] += 1
+    return counts
+
+
+def _postings_shard(task: Tuple[str, int, int, int, Tuple[str, ...], FrozenSet[str]]) -> Dict[str, List[int]]:
+    name, start, end, first_index, particles, targets = task
+    postings: Dict[str, List[int]] = {}
+    for offset, text in enumerate(_read_texts(name, start, end)):
+        index = first_index + offset
+        for word in CONTEXT_PATTERN.findall(text):
+            cleaned = strip_particle(word, particles)
+            if cleaned in targets:
+                postings.setdefault(cleaned, []).append(index)
+    return postings
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """프로세스 풀 재사용 (크롤링마다 작업자를 새로 띄우지 않음)"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(max_workers=workers,
+                                            mp_context=multiprocessing.get_context('spawn'))
+            _executor_workers = workers
+        return _executor
+
+
+def shutdown():
+    """프로세스 풀 정리"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+class SharedTexts:
+    """텍스트 목록을 UTF-8로 공유 메모리에 한 번 올리고, 바이트 크기 기준으로 구간을 나눔"""
+
+    def __init__(self, texts: List[str]):
+        encoded = [t.replace('\x00', ' ').encode('utf-8') for t in texts]
+        self.offsets = [0]
+        for data in encoded:
+            self.offsets.append(self.offsets[-1] + len(data) + 1)
+        size = max(self.offsets[-1], 1)
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        if encoded:
+            self.shm.buf[:self.offsets[-1]] = TEXT_SEPARATOR.join(encoded) + TEXT_SEPARATOR
+        self.count = len(texts)
+
+    def shards(self, shard_count: int) -> List[Tuple[int, int, int]]:
+        """(시작 바이트, 끝 바이트(구분자 제외), 첫 텍스트 번호) 목록"""
+        if self.count == 0:
+            return []
+        total = self.offsets[-1]
+        shard_count = max(1, min(shard_count, self.count))
+        shards = []
+        first = 0
+        for i in range(1, shard_count + 1):
+            # 바이트 크기가 비슷하도록 경계 텍스트 선택
+            target = total * i // shard_count
+            last = first
+            while last < self.count and self.offsets[last + 1] <= target:
+                last += 1
+            if i == shard_count:
+                last = self.count
+            if last <= first:
+                continue
+            shards.append((self.offsets[first], self.offsets[last] - 1, first))
+            first = last
+        return shards
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def count_keywords(texts: List[str], particles: Sequence[str], workers: int) -> Counter:
+    """키워드 빈도 (Crawler.extract_all_keywords와 같은 결과)"""
+    if not texts:
+        return Counter()
+    shared = SharedTexts(texts)
+    try:
+        particles = tuple(particles)
+        # 작업자 수보다 조금 많이 나눠 느린 구간이 전체를 붙잡지 않도록 함
+        tasks = [(shared.shm.name, start, end, particles) for start, end, _ in shared.shards(workers * 4)]
+        parts = list(_get_executor(workers).map(_count_shard, tasks))
+    finally:
+        shared.close()
+    return tree_reduce(parts, _merge_counters) or Counter()
+
+
+def collect_postings(texts: List[str], targets: FrozenSet[str], particles: Sequence[str],
+                     workers: int) -> Dict[str, List[int]]:
+    """대상 단어별 등장 텍스트 번호 (등장할 때마다, 텍스트 순서대로)"""
+    if not texts or not targets:
+        return {}
+    shared = SharedTexts(texts)
+    try:
+        particles = tuple(particles)
+        targets = frozenset(targets)
+        tasks = [(shared.shm.name, start, end, first, particles, targets)
+                 for start, end, first in shared.shards(workers * 4)]
+        parts = list(_get_executor(workers).map(_postings_shard, tasks))
+    finally:
+        shared.close()
+    return tree_reduce(parts, _merge_postings) or {}
@@ -0,0 +1,111 @@
+"""
+랭킹 스냅샷 캐시
+랭킹 응답을 데이터 버전별로 한 번만 만들어 메모리에 두고,
+강한 ETag와 미리 압축한 본문(gzip/brotli)으로 제공합니다.
+"""
+import gzip
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# 압축 효과가 없는 작은 본문은 압축하지 않음
+MIN_COMPRESS_SIZE = 512
+
+
+class RankingSnapshot:
+    """직렬화/압축이 끝난 랭킹 응답"""
+
+    def __init__(self, payload: Dict, version: Tuple):
+        self.version = version
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+        self.gzip_body = None
+        self.brotli_body = None
+        if len(self.body) >= MIN_COMPRESS_SIZE:
+            self.gzip_body = gzip.compress(self.body, compresslevel=9)
+            if BROTLI_AVAILABLE:
+                self.brotli_body = brotli.compress(self.body, quality=11)
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match 헤더가 현재 ETag와 일치하는지 (약한 비교 - W/ 접두어 무시)"""
+        if not if_none_match:
+            return False
+        tags = [t.strip() for t in if_none_match.split(',')]
+        # 압축 프록시 등이 약한 ETag(W/"...")로 바꿔 보내도 같은 응답으로 봄
+        tags = [t[2:] if t.startswith('W/') else t for t in tags]
+        return '*' in tags or self.etag in tags
+
+    def select_body(self, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """Accept-Encoding에 맞는 본문과 Content-Encoding 선택"""
+        accepted = {
+            part.split(';')[0].strip().lower()
+            for part in (accept_encoding or '').split(',')
+            if part.strip() and not part.strip().endswith('q=0')
+        }
+        if self.brotli_body is not None and 'br' in accepted:
+            return self.brotli_body, 'br'
+        if self.gzip_body is not None and ('gzip' in accepted or '*' in accepted):
+            return self.gzip_body, 'gzip'
+        return self.body, None
+
+
+class RankingSnapshotCache:
+    """요청 파라미터별 랭킹 스냅샷 (데이터/규칙 버전이 바뀌면 다시 생성)"""
+
+    def __init__(self, db, rules_service=None, max_entries: int = 64):
+        self.db = db
+        self.rules_service = rules_service
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[RankingSnapshot, Callable[[], Dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def current_version(self) -> Tuple:
+        """스냅샷 유효성 판단 기준 (DB 데이터 버전, 단어 규칙 버전, 날짜)"""
+        rules_version = 0
+        if self.rules_service is not None:
+            self.rules_service.get()
+            rules_version = self.rules_service.version
+        # 기간 랭킹은 날짜가 바뀌면 달라지므로 날짜도 포함
+        return (self.db.get_data_version('ranking'), rules_version, date.today().isoformat())
+
+    def get(self, key: Hashable, builder: Callable[[], Dict]) -> RankingSnapshot:
+        """스냅샷 조회 (없거나 오래됐으면 builder로 생성)"""
+        version = self.current_version()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0].version == version:
+                self._entries.move_to_end(key)
+                return entry[0]
+        snapshot = RankingSnapshot(builder(), version)
+        with self._lock:
+            self._entries[key] = (snapshot, builder)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return snapshot
+
+    def refresh(self, warm: Optional[Dict[Hashable, Callable[[], Dict]]] = None) -> int:
+        """쓰기 이후 호출: 오래된 스냅샷을 미리 다시 생성 (첫 요청이 비용을 내지 않도록)"""
+        version = self.current_version()
+        with self._lock:
+            targets = {key: builder for key, (snapshot, builder) in self._entries.items()
+                       if snapshot.version != version}
+        for key, builder in (warm or {}).items():
+            targets.setdefault(key, builder)
+        for key, builder in targets.items():
+            try:
+                self.get(key, builder)
+            except Exception as e:
+                print(f"[랭킹 스냅샷] 갱신 실패 ({key}): {e}")
+        if targets:
+            print(f"[랭킹 스냅샷] {len(targets)}개 스냅샷 갱신 (버전 {version[0]})")
+        return len(targets)
@@ -0,0 +1,171 @@
+"""
+단어 규칙(word_rules.json)과 수동 의미 사전(manual_meanings.json) 관리
+파일을 한 번만 읽어 메모리에 유지하고, 파일이 바뀐 경우(mtime/inode/크기)에만 다시 읽습니다.
+"""
+import os
+import json
+import tempfile
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+data_dir = os.path.join(current_dir, 'data')
+
+
+class WatchedJsonFile:
+    """변경 감지 기반 JSON 파일 캐시"""
+
+    def __init__(self, path: str, default: Callable[[], Any], normalize: Callable[[Any], Any]):
+        self.path = path
+        self._default = default
+        self._normalize = normalize
+        self._lock = threading.Lock()
+        self._signature = None
+        self._data = default()
+        self.version = 0
+
+    def _stat_signature(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _load(self, signature: Optional[tuple]):
+        data = self._default()
+        if signature is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8-sig') as f:
+                    content = f.read().strip()
+                if content:
+                    data = self._normalize(json.loads(content))
+            except Exception as e:
+                print(f"[파일캐시] {os.path.basename(self.path)} 로드 실패: {e}")
+                # 잘못된 파일이면 이전 값 유지
+                data = self._data
+        self._data = data
+        self._signature = signature
+        self.version += 1
+        self._on_reload()
+
+    def _on_reload(self):
+        """다시 읽은 뒤 파생 데이터 갱신 (하위 클래스용)"""
+
+    def get(self) -> Any:
+        """현재 데이터 (파일이 바뀌었으면 다시 읽음)"""
+        signature = self._stat_signature()
+        if signature != self._signature or self.version == 0:
+            with self._lock:
+                if signature != self._signature or self.version == 0:
+                    self._load(signature)
+        return self._data
+
+    def write(self, data: Any):
+        """원자적으로 저장 (임시 파일 → rename, BOM 없이) 후 메모리 갱신"""
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._load(self._stat_signature())
+
+
+def _normalize_rules(data: Any) -> Dict:
+    if not isinstance(data, dict):
+        return {"allow": [], "block": []}
+    return {
+        'allow': [str(w) for w in (data.get('allow') or []) if w],
+        'block': [str(w) for w in (data.get('block') or []) if w],
+    }
+
+
+def _normalize_meanings(data: Any) -> Dict:
+    # 새 형식: {"단어": {"meaning": "...", "examples": [...]}}
+    # 구 형식 호환: {"단어": "의미"}
+    meanings = {}
+    if isinstance(data, dict):
+        for k, v in data.items():
+            if isinstance(v, dict):
+                meanings[str(k)] = v
+            elif isinstance(v, str):
+                meanings[str(k)] = {"meaning": v, "examples": []}
+    return meanings
+
+
+class WordRulesService(WatchedJsonFile):
+    """단어 노출 규칙 (허용/차단)"""
+
+    def __init__(self, path: str = None):
+        super().__init__(
+            path or os.path.join(data_dir, 'word_rules.json'),
+            default=lambda: {"allow": [], "block": []},
+            normalize=_normalize_rules
+        )
+        self._block_set: FrozenSet[str] = frozenset()
+
+    def _on_reload(self):
+        self._block_set = frozenset(self._data.get('block', []))
+
+    @property
+    def block_set(self) -> FrozenSet[str]:
+        self.get()
+        return self._block_set
+
+    def is_blocked(self, word: str) -> bool:
+        return word in self.block_set
+
+    def update(self, allow=None, block=None) -> Dict:
+        """규칙 병합/치환 후 저장"""
+        rules = dict(self.get())
+        if allow is not None:
+            rules['allow'] = [str(w) for w in allow if w]
+        if block is not None:
+            rules['block'] = [str(w) for w in block if w]
+        self.write(rules)
+        return self.get()
+
+
+class ManualMeaningsService(WatchedJsonFile):
+    """수동 의미/예문 사전"""
+
+    def __init__(self, path: str = None):
+        super().__init__(
+            path or os.path.join(data_dir, 'manual_meanings.json'),
+            default=dict,
+            normalize=_normalize_meanings
+        )
+
+    def lookup(self, word: str) -> Optional[Dict]:
+        return self.get().get(word)
+
+
+_word_rules_service = None
+_manual_meanings_service = None
+_services_lock = threading.Lock()
+
+
+def get_word_rules_service() -> WordRulesService:
+    """프로세스 공용 단어 규칙 서비스"""
+    global _word_rules_service
+    if _word_rules_service is None:
+        with _services_lock:
+            if _word_rules_service is None:
+                _word_rules_service = WordRulesService()
+    return _word_rules_service
+
+
+def get_manual_meanings_service() -> ManualMeaningsService:
+    """프로세스 공용 수동 의미 사전 서비스"""
+    global _manual_meanings_service
+    if _manual_meanings_service is None:
+        with _services_lock:
+            if _manual_meanings_service is None:
+                _manual_meanings_service = ManualMeaningsService()
+    return _manual_meanings_service
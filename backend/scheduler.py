@@ -6,31 +6,32 @@ from database import Database
 from email_service import EmailService
 
 def run_scheduled_crawl():
-    """스케줄된 크롤링 실행"""
+    """스케줄된 크롤링 실행 (API와 같은 작업 관리자 사용 - 실행 중인 크롤링이 있으면 건너뜀)"""
     try:
         print(f"[SCHEDULED] {datetime.now()} - 자동 크롤링 시작")
-        from crawler import Crawler
-        crawler = Crawler()
-        result = crawler.crawl_and_analyze()
+        from crawl_jobs import get_crawl_job_manager
+        job = get_crawl_job_manager().run('scheduler')
         
-        # 데이터베이스에 저장
-        db = Database()
-        added_count = 0
-        for slang_data in result:
-            if db.add_slang(
-                slang_data['word'], 
-                slang_data['meaning'], 
-                slang_data.get('examples', []),
-                usage_count=slang_data.get('count', 1),
-                method=slang_data.get('method', 'enhanced')
-            ):
-                added_count += 1
-        
-        print(f"[SCHEDULED] 크롤링 완료! {added_count}개 신조어 추가")
+        if job is None:
+            print("[SCHEDULED] 이미 진행 중인 크롤링이 있어 건너뜁니다.")
+        elif job['status'] == 'succeeded':
+            print(f"[SCHEDULED] 크롤링 완료! {job['result_count']}개 신조어 추가")
+        else:
+            print(f"[SCHEDULED ERROR] 크롤링 실패: {job.get('error')}")
         
     except Exception as e:
         print(f"[SCHEDULED ERROR] 크롤링 실패: {e}")
 
+def run_scheduled_video_stats_refresh():
+    """스케줄된 영상 통계 갱신 (저장된 영상의 조회수/좋아요를 50개씩 묶어 갱신)"""
+    try:
+        print(f"[SCHEDULED] {datetime.now()} - 영상 통계 갱신 시작")
+        from video_stats import refresh_video_stats
+        from youtube_service import get_youtube_service
+        refresh_video_stats(Database(), get_youtube_service())
+    except Exception as e:
+        print(f"[SCHEDULED ERROR] 영상 통계 갱신 실패: {e}")
+
 def run_scheduled_newsletter():
     """스케줄된 뉴스레터 발송"""
     try:
@@ -72,8 +73,13 @@ def start_scheduler():
     # 매주 월요일 오전 10시에 뉴스레터 발송
     schedule.every().monday.at("10:00").do(run_scheduled_newsletter)
     
+    # 영상 통계 갱신 (통계 유지 시간마다)
+    from video_stats import VIDEO_STATS_REFRESH_HOURS
+    schedule.every(VIDEO_STATS_REFRESH_HOURS).hours.do(run_scheduled_video_stats_refresh)
+    
     print("[SCHEDULER] 스케줄러 시작됨")
     print("[SCHEDULER] - 매일 09:00: 자동 크롤링")
+    print(f"[SCHEDULER] - {VIDEO_STATS_REFRESH_HOURS:g}시간마다: 영상 통계 갱신")
     print("[SCHEDULER] - 매주 월요일 10:00: 뉴스레터 발송")
     
     while True:
@@ -0,0 +1,154 @@
+"""
+신조어 검색 결과 캐시 (stale-while-revalidate)
+단어별 검색 응답을 부분(의미/예문/영상)별 갱신 시각과 함께 cache_store에 저장합니다.
+요청에는 저장된 응답을 바로 돌려주고, 오래되었거나 덜 채워진 부분은 백그라운드 작업자가 다시 만듭니다.
+"""
+import os
+import time
+import queue
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+SEARCH_RESULT_NAMESPACE = 'search_results'
+SEARCH_PARTS = ('meaning', 'examples', 'videos')
+
+# 부분별 유지 시간 (시간)
+SEARCH_TTL_HOURS = {
+    'meaning': float(os.getenv('SEARCH_MEANING_TTL_HOURS', '168') or 168),
+    'examples': float(os.getenv('SEARCH_EXAMPLES_TTL_HOURS', '72') or 72),
+    'videos': float(os.getenv('SEARCH_VIDEOS_TTL_HOURS', '24') or 24),
+}
+# 갱신해도 채워지지 않는 부분(예: 영상 없음)을 다시 시도하기까지 기다리는 시간 (분)
+SEARCH_REFRESH_RETRY_MINUTES = float(os.getenv('SEARCH_REFRESH_RETRY_MINUTES', '30') or 30)
+SEARCH_REFRESH_WORKERS = int(os.getenv('SEARCH_REFRESH_WORKERS', '2') or 2)
+# 영상이 이 개수보다 적으면 덜 채워진 것으로 봄
+SEARCH_MIN_VIDEOS = 3
+
+
+class SearchResultCache:
+    """단어별 검색 응답 + 부분별 갱신 시각"""
+
+    def __init__(self, cache_store):
+        self.cache_store = cache_store
+
+    def get(self, word: str) -> Optional[Dict]:
+        return self.cache_store.get(SEARCH_RESULT_NAMESPACE, word)
+
+    def store(self, word: str, result: Dict, parts: Iterable[str] = SEARCH_PARTS) -> Dict:
+        """응답 저장 (parts의 갱신 시각만 현재로, 나머지는 이전 시각 유지)"""
+        entry = self.get(word) or {'updated_at': {}}
+        now = time.time()
+        for part in parts:
+            entry['updated_at'][part] = now
+        entry['result'] = result
+        self.cache_store.set(SEARCH_RESULT_NAMESPACE, word, entry, source='search')
+        return entry
+
+    def invalidate(self, words: Iterable[str]) -> int:
+        """저장된 응답 삭제 (의미가 바뀐 단어 - 다음 검색에서 새로 만듦)"""
+        return self.cache_store.delete_many(SEARCH_RESULT_NAMESPACE, words)
+
+    @staticmethod
+    def incomplete_parts(result: Dict) -> List[str]:
+        data = result.get('data') or {}
+        parts = []
+        meaning = data.get('meaning') or ''
+        if not meaning or '분석 중' in meaning:
+            parts.append('meaning')
+        examples = data.get('examples') or []
+        if not examples or all('찾는 중입니다' in example for example in examples):
+            parts.append('examples')
+        if len(data.get('videos') or []) < SEARCH_MIN_VIDEOS:
+            parts.append('videos')
+        return parts
+
+    def stale_parts(self, entry: Dict, now: Optional[float] = None) -> List[str]:
+        """유지 시간이 지났거나 덜 채워진 부분"""
+        now = now or time.time()
+        incomplete = self.incomplete_parts(entry['result'])
+        stale = []
+        for part in SEARCH_PARTS:
+            age = now - entry['updated_at'].get(part, 0)
+            if age > SEARCH_TTL_HOURS[part] * 3600:
+                stale.append(part)
+            elif part in incomplete and age > SEARCH_REFRESH_RETRY_MINUTES * 60:
+                stale.append(part)
+        return stale
+
+    @staticmethod
+    def response(entry: Dict, stale: List[str], refreshing: bool) -> Dict:
+        """저장된 응답 + 신선도 정보"""
+        response = dict(entry['result'])
+        response['freshness'] = {
+            'updated_at': {part: entry['updated_at'].get(part) for part in SEARCH_PARTS},
+            'stale': stale,
+            'refreshing': refreshing,
+        }
+        return response
+
+
+class BackgroundRefresher:
+    """키별 갱신 작업 큐 (같은 키는 한 번만 대기, 작업자 스레드에서 실행)
+
+    갱신이 실행 중인 키에 새 요청이 오면 다음 갱신으로 모아 두었다가 실행이 끝난 뒤 다시 큐에 넣습니다.
+    """
+
+    def __init__(self, refresh: Callable[[str, Tuple[str, ...]], None], workers: int = SEARCH_REFRESH_WORKERS):
+        self._refresh = refresh
+        self._workers = workers
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        # 대기 중인 키 → 갱신할 부분 / 실행 중인 키
+        self._pending: Dict[str, set] = {}
+        self._running: set = set()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def _start(self):
+        # 잠금 안에서 호출 - 첫 요청 때 작업자 시작
+        if self._threads:
+            return
+        for i in range(self._workers):
+            thread = threading.Thread(target=self._work, name=f"search-refresh-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, key: str, parts: Iterable[str]) -> bool:
+        """갱신 예약 (이미 대기 중이면 부분만 합침, 실행 중이면 끝난 뒤 다시 실행)"""
+        parts = set(parts)
+        if not parts:
+            return False
+        with self._lock:
+            self._start()
+            pending = self._pending.get(key)
+            if pending is not None:
+                pending.update(parts)
+                return True
+            self._pending[key] = parts
+            if key in self._running:
+                # 실행 중인 작업자가 끝나면서 다시 큐에 넣음 (같은 키를 두 작업자가 동시에 갱신하지 않음)
+                return True
+        self._queue.put(key)
+        return True
+
+    def is_pending(self, key: str) -> bool:
+        with self._lock:
+            return key in self._pending or key in self._running
+
+    def _work(self):
+        while True:
+            key = self._queue.get()
+            with self._lock:
+                parts = self._pending.pop(key, set())
+                self._running.add(key)
+            try:
+                if parts:
+                    self._refresh(key, tuple(part for part in SEARCH_PARTS if part in parts))
+            except Exception as e:
+                print(f"[검색 갱신] '{key}' 갱신 실패: {e}")
+            finally:
+                with self._lock:
+                    self._running.discard(key)
+                    requeue = key in self._pending
+                if requeue:
+                    self._queue.put(key)
+                self._queue.task_done()
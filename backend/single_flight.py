@@ -0,0 +1,97 @@
+"""
+요청 합치기 (single-flight) + 짧은 결과 캐시
+같은 키의 요청이 동시에 들어오면 비싼 계산(YouTube/GPT 호출)은 한 번만 실행하고
+나머지 요청은 그 결과를 함께 기다립니다. 끝난 결과는 잠시 메모리에 보관해 바로 돌려줍니다.
+이벤트 루프 안에서만 사용합니다 (잠금 없이 단일 스레드에서 상태 관리).
+다른 스레드에서 무효화할 때는 invalidate_threadsafe를 사용합니다.
+"""
+import os
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+# 결과 캐시 유지 시간(초) / 최대 항목 수
+SINGLE_FLIGHT_CACHE_SECONDS = float(os.getenv('SINGLE_FLIGHT_CACHE_SECONDS', '30') or 30)
+SINGLE_FLIGHT_CACHE_SIZE = int(os.getenv('SINGLE_FLIGHT_CACHE_SIZE', '1024') or 1024)
+
+
+class SingleFlightCache:
+    """키별 진행 중 작업 공유 + TTL 결과 캐시"""
+
+    def __init__(self, ttl: float = SINGLE_FLIGHT_CACHE_SECONDS, max_entries: int = SINGLE_FLIGHT_CACHE_SIZE,
+                 cache_if: Optional[Callable[[Any], bool]] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache_if = cache_if
+        self._results: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _cached(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._results.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            del self._results[key]
+            return False, None
+        self._results.move_to_end(key)
+        return True, entry[1]
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is not task:
+            # 실행 중에 무효화된 작업 - 바뀌기 전 데이터로 만든 결과일 수 있으므로 저장하지 않음
+            return
+        del self._inflight[key]
+        # 실패/취소된 결과는 저장하지 않음 (예외는 기다리던 요청들이 각자 받음)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if self.ttl > 0 and (self.cache_if is None or self.cache_if(result)):
+            self._results[key] = (time.monotonic() + self.ttl, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시된 결과 → 진행 중인 같은 작업 → 새 작업 순으로 결과 반환"""
+        self._loop = asyncio.get_running_loop()
+        found, result = self._cached(key)
+        if found:
+            self.hits += 1
+            return result
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            # 요청과 분리된 작업으로 실행 (먼저 온 요청이 끊겨도 기다리는 요청은 결과를 받음)
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: Hashable):
+        """저장된 결과 삭제 + 진행 중인 작업 분리 (다음 요청은 새로 계산)"""
+        self._results.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def invalidate_threadsafe(self, keys: Iterable[Hashable]):
+        """이벤트 루프 밖(작업 스레드)에서 무효화 예약"""
+        if self._loop is None or self._loop.is_closed():
+            return
+        for key in keys:
+            self._loop.call_soon_threadsafe(self.invalidate, key)
+
+    def stats(self) -> Dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'cached': len(self._results),
+            'inflight': len(self._inflight),
+            'ttl_seconds': self.ttl,
+        }
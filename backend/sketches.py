@@ -0,0 +1,246 @@
+"""
+고정 메모리 키워드 빈도 추정 (스케치 집계 모드)
+- Count-Min: 모든 단어의 빈도 추정 (과대 추정만 발생, 오차 ≤ epsilon × 전체 토큰 수, 확률 1 - delta)
+- Space-Saving: 상위 k개 빈출 단어(후보) 추적
+두 구조 모두 같은 설정끼리 병합할 수 있어 이전 크롤링 결과와 누적할 수 있습니다.
+해시는 프로세스와 무관하게 같은 값이 나오도록 blake2b를 사용합니다 (저장 후 병합 가능).
+"""
+import sys
+import math
+import heapq
+import base64
+import hashlib
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MASK64 = (1 << 64) - 1
+
+
+def _hash_pair(word: str) -> Tuple[int, int]:
+    digest = hashlib.blake2b(word.encode('utf-8'), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], 'little')
+    h2 = int.from_bytes(digest[8:], 'little') | 1
+    return h1, h2
+
+
+class CountMinSketch:
+    """Count-Min 스케치 (width = ⌈e / epsilon⌉, depth = ⌈ln(1 / delta)⌉)"""
+
+    def __init__(self, epsilon: float = 0.0001, delta: float = 0.01):
+        if not (0 < epsilon < 1 and 0 < delta < 1):
+            raise ValueError("epsilon과 delta는 0과 1 사이여야 합니다.")
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = array('Q', bytes(8 * self.width * self.depth))
+        self.total = 0
+
+    def _cells(self, word: str) -> List[int]:
+        # 이중 해싱으로 depth개의 열 위치 계산
+        h1, h2 = _hash_pair(word)
+        width = self.width
+        return [row * width + ((h1 + row * h2) & MASK64) % width for row in range(self.depth)]
+
+    def add(self, word: str, count: int = 1):
+        table = self.table
+        for cell in self._cells(word):
+            table[cell] += count
+        self.total += count
+
+    def estimate(self, word: str) -> int:
+        table = self.table
+        return min(table[cell] for cell in self._cells(word))
+
+    def error_bound(self) -> float:
+        """빈도 추정의 최대 과대 추정치 (확률 1 - delta)"""
+        return self.epsilon * self.total
+
+    def merge(self, other: 'CountMinSketch'):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("설정(epsilon/delta)이 다른 스케치는 병합할 수 없습니다.")
+        table = self.table
+        for i, value in enumerate(other.table):
+            if value:
+                table[i] += value
+        self.total += other.total
+
+    def memory_bytes(self) -> int:
+        return self.table.itemsize * len(self.table)
+
+    def to_dict(self) -> Dict:
+        return {
+            'epsilon': self.epsilon,
+            'delta': self.delta,
+            'total': self.total,
+            'table': base64.b64encode(self.table.tobytes()).decode('ascii'),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CountMinSketch':
+        sketch = cls(data['epsilon'], data['delta'])
+        table = array('Q')
+        table.frombytes(base64.b64decode(data['table']))
+        if len(table) != len(sketch.table):
+            raise ValueError("저장된 스케치 크기가 설정과 맞지 않습니다.")
+        sketch.table = table
+        sketch.total = data.get('total', 0)
+        return sketch
+
+
+class SpaceSaving:
+    """Space-Saving 상위 k개 추적 (빈도가 capacity 분의 1 이상인 단어는 반드시 포함)"""
+
+    def __init__(self, capacity: int = 5000):
+        if capacity < 1:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        self.capacity = capacity
+        # 단어 → [추정 빈도, 최대 오차]
+        self.counters: Dict[str, List[int]] = {}
+        # (빈도, 단어) 최소 힙 - 갱신 시 새 항목을 넣고 오래된 항목은 꺼낼 때 무시
+        self._heap: List[Tuple[int, str]] = []
+
+    def _push(self, word: str, count: int):
+        heapq.heappush(self._heap, (count, word))
+        # 무시할 항목이 너무 쌓이면 다시 구성
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, w) for w, (c, _) in self.counters.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[str, int]:
+        while True:
+            count, word = heapq.heappop(self._heap)
+            entry = self.counters.get(word)
+            if entry is not None and entry[0] == count:
+                return word, count
+
+    def add(self, word: str, count: int = 1):
+        entry = self.counters.get(word)
+        if entry is not None:
+            entry[0] += count
+        elif len(self.counters) < self.capacity:
+            entry = self.counters[word] = [count, 0]
+        else:
+            # 가장 작은 항목을 교체 (그 빈도만큼 오차로 기록)
+            evicted, min_count = self._pop_min()
+            del self.counters[evicted]
+            entry = self.counters[word] = [min_count + count, min_count]
+        self._push(word, entry[0])
+
+    def min_count(self) -> int:
+        if len(self.counters) < self.capacity:
+            return 0
+        return min(c for c, _ in self.counters.values())
+
+    def merge(self, other: 'SpaceSaving'):
+        """병합 가능한 요약 방식: 한쪽에만 있는 단어는 다른 쪽 최솟값을 더한 뒤 상위 capacity개 유지"""
+        self_min = self.min_count()
+        other_min = other.min_count()
+        merged: Dict[str, List[int]] = {}
+        for word in set(self.counters) | set(other.counters):
+            a = self.counters.get(word, [self_min, self_min])
+            b = other.counters.get(word, [other_min, other_min])
+            merged[word] = [a[0] + b[0], a[1] + b[1]]
+        top = heapq.nlargest(self.capacity, merged.items(), key=lambda item: item[1][0])
+        self.counters = {word: entry for word, entry in top}
+        self._heap = [(c, w) for w, (c, _) in self.counters.items()]
+        heapq.heapify(self._heap)
+
+    def items(self) -> List[Tuple[str, int, int]]:
+        """(단어, 추정 빈도, 최대 오차) - 빈도 내림차순"""
+        return sorted(((w, c, e) for w, (c, e) in self.counters.items()), key=lambda x: x[1], reverse=True)
+
+    def memory_bytes(self) -> int:
+        # 사전 + 항목 리스트 + 힙 대략치
+        size = sys.getsizeof(self.counters) + sys.getsizeof(self._heap)
+        for word, entry in self.counters.items():
+            size += sys.getsizeof(word) + sys.getsizeof(entry) + 2 * 28
+        return size + len(self._heap) * 64
+
+    def to_dict(self) -> Dict:
+        return {'capacity': self.capacity, 'counters': self.counters}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SpaceSaving':
+        summary = cls(data['capacity'])
+        summary.counters = {w: [int(c), int(e)] for w, (c, e) in data.get('counters', {}).items()}
+        summary._heap = [(c, w) for w, (c, _) in summary.counters.items()]
+        heapq.heapify(summary._heap)
+        return summary
+
+
+class KeywordSketch:
+    """Count-Min + Space-Saving 조합 (후보는 Space-Saving, 빈도는 두 추정치 중 작은 값)"""
+
+    def __init__(self, epsilon: float = 0.0001, delta: float = 0.01, top_k: int = 5000):
+        self.cms = CountMinSketch(epsilon, delta)
+        self.heavy = SpaceSaving(top_k)
+
+    def add(self, word: str, count: int = 1):
+        self.cms.add(word, count)
+        self.heavy.add(word, count)
+
+    def update(self, words: Iterable[str]):
+        for word in words:
+            self.add(word)
+
+    def estimate(self, word: str) -> int:
+        estimate = self.cms.estimate(word)
+        entry = self.heavy.counters.get(word)
+        if entry is not None:
+            estimate = min(estimate, entry[0])
+        return estimate
+
+    def top_counts(self, min_count: int = 1) -> Counter:
+        """후보 단어와 추정 빈도 (min_count 이상)"""
+        counts = Counter()
+        for word, _, _ in self.heavy.items():
+            estimate = self.estimate(word)
+            if estimate >= min_count:
+                counts[word] = estimate
+        return counts
+
+    def merge(self, other: 'KeywordSketch'):
+        self.cms.merge(other.cms)
+        self.heavy.merge(other.heavy)
+
+    def memory_bytes(self) -> int:
+        return self.cms.memory_bytes() + self.heavy.memory_bytes()
+
+    def stats(self) -> Dict:
+        """설정/오차 한계/메모리 사용량"""
+        return {
+            'total_tokens': self.cms.total,
+            'tracked_words': len(self.heavy.counters),
+            'top_k': self.heavy.capacity,
+            'epsilon': self.cms.epsilon,
+            'delta': self.cms.delta,
+            'width': self.cms.width,
+            'depth': self.cms.depth,
+            'error_bound': self.cms.error_bound(),
+            'memory_bytes': self.memory_bytes(),
+        }
+
+    def to_dict(self) -> Dict:
+        return {'cms': self.cms.to_dict(), 'heavy': self.heavy.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'KeywordSketch':
+        sketch = cls.__new__(cls)
+        sketch.cms = CountMinSketch.from_dict(data['cms'])
+        sketch.heavy = SpaceSaving.from_dict(data['heavy'])
+        return sketch
+
+    @classmethod
+    def load_or_create(cls, data: Optional[Dict], epsilon: float, delta: float, top_k: int) -> 'KeywordSketch':
+        """저장된 스케치가 같은 설정이면 불러오고, 아니면 새로 생성"""
+        if data:
+            try:
+                sketch = cls.from_dict(data)
+                if (sketch.cms.epsilon, sketch.cms.delta, sketch.heavy.capacity) == (epsilon, delta, top_k):
+                    return sketch
+                print("[스케치] 저장된 스케치 설정이 달라 새로 시작합니다.")
+            except Exception as e:
+                print(f"[스케치] 저장된 스케치 로드 실패: {e}")
+        return cls(epsilon, delta, top_k)
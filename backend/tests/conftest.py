@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+# backend 모듈은 패키지가 아니라 평평한 파일이므로 backend 디렉토리를 import 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import Database  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path):
+    """임시 파일 DB"""
+    return Database(str(tmp_path / 'slang.db'))
@@ -0,0 +1,153 @@
+"""크롤링 작업 실패/이어서 실행 테스트"""
+import pytest
+
+from crawl_jobs import CrawlJobManager
+
+RESULT = [
+    {'word': '갓생', 'meaning': '부지런한 삶', 'examples': [], 'count': 5,
+     'gallery_counts': {'gall_a': 3, 'gall_b': 2}},
+    {'word': '점메추', 'meaning': '점심 메뉴 추천', 'examples': [], 'count': 4},
+]
+
+
+class StagedCrawler:
+    """단계 결과를 체크포인트로 남기는 가짜 크롤러 (저장된 단계는 다시 실행하지 않음)"""
+
+    def __init__(self):
+        self.fetch_calls = 0
+
+    def crawl_and_analyze(self, progress=None, checkpoints=None):
+        for stage in ('fetch', 'meanings'):
+            if checkpoints.load(stage) is None:
+                progress(stage)
+                if stage == 'fetch':
+                    self.fetch_calls += 1
+                checkpoints.save(stage, RESULT)
+        return checkpoints.load('meanings')
+
+
+def make_manager(db, crawler):
+    manager = CrawlJobManager(db, crawler_factory=lambda: crawler)
+    manager.trends = None
+    # 이어서 실행도 현재 스레드에서 (테스트에서 완료를 기다릴 수 있도록)
+    manager._start_thread = manager._execute
+    return manager
+
+
+def usage_totals(db):
+    conn = db._get_connection()
+    daily = dict(conn.execute('SELECT word, SUM(count) FROM slang_usage_daily GROUP BY word').fetchall())
+    occurrences = conn.execute('SELECT COUNT(*) FROM slang_occurrences').fetchone()[0]
+    return daily, occurrences
+
+
+def test_persist_failure_keeps_checkpoints_and_resume_counts_once(db, monkeypatch):
+    crawler = StagedCrawler()
+    manager = make_manager(db, crawler)
+
+    def fail_index(cursor, words):
+        raise RuntimeError('index failed')
+    monkeypatch.setattr(db, '_index_slangs', fail_index)
+
+    job = manager.run('test')
+    assert job['status'] == 'failed'
+    assert 'index failed' in job['error']
+    assert job['completed_stages'] == ['fetch', 'meanings']
+    # 저장 트랜잭션 전체가 롤백됨
+    assert db.get_slang_by_word('갓생') is None
+    assert usage_totals(db) == ({}, 0)
+
+    monkeypatch.undo()
+    job, resumed = manager.resume(job['id'])
+    assert resumed
+    job = manager.get(job['id'])
+    assert job['status'] == 'succeeded'
+    assert job['result_count'] == 2
+    assert job['completed_stages'] == []
+    assert crawler.fetch_calls == 1
+    assert db.get_slang_by_word('갓생')['usage_count'] == 5
+    assert usage_totals(db) == ({'갓생': 5, '점메추': 4}, 3)
+
+
+def test_resume_after_persist_does_not_count_twice(db, monkeypatch):
+    crawler = StagedCrawler()
+    manager = make_manager(db, crawler)
+    update_crawl_job = db.update_crawl_job
+
+    def fail_on_success(job_id, **fields):
+        if fields.get('status') == 'succeeded':
+            raise RuntimeError('status update failed')
+        return update_crawl_job(job_id, **fields)
+    monkeypatch.setattr(db, 'update_crawl_job', fail_on_success)
+
+    job = manager.run('test')
+    assert job['status'] == 'failed'
+    assert 'persist' in job['completed_stages']
+    assert usage_totals(db) == ({'갓생': 5, '점메추': 4}, 3)
+
+    monkeypatch.undo()
+    manager.resume(job['id'])
+    job = manager.get(job['id'])
+    assert job['status'] == 'succeeded'
+    assert job['result_count'] == 2
+    assert crawler.fetch_calls == 1
+    assert db.get_slang_by_word('갓생')['usage_count'] == 5
+    assert usage_totals(db) == ({'갓생': 5, '점메추': 4}, 3)
+
+
+class FailingClassifier:
+    def __init__(self):
+        self.fail = True
+
+    def predict_batch(self, items, threshold=0.41):
+        if self.fail:
+            raise RuntimeError('model not loaded')
+        return [{'word': item['word'], 'probability': 0.9, 'is_slang': True, 'confidence': 0.9}
+                for item in items]
+
+
+def make_crawler(classifier):
+    """네트워크/모델 없이 단계별 메서드만 바꾼 실제 Crawler (classify 단계는 실제 코드 사용)"""
+    crawler_module = pytest.importorskip('crawler')
+    crawler = crawler_module.Crawler.__new__(crawler_module.Crawler)
+    crawler.fetch_calls = 0
+    candidates = [{'word': item['word'], 'count': item['count'], 'contexts': ['문맥']} for item in RESULT]
+
+    def crawl_dcinside(**kwargs):
+        crawler.fetch_calls += 1
+        return [{'title': '갓생 점메추', 'content': ''}]
+
+    crawler.crawl_dcinside = crawl_dcinside
+    crawler.extract_all_keywords = lambda texts: {item['word']: item['count'] for item in RESULT}
+    crawler.prefilter_candidates = lambda counts, texts, min_count=1: candidates
+    crawler.dictionary_filter_candidates = lambda prefiltered, **kwargs: prefiltered
+    crawler.nlp_classifier = classifier
+    crawler.filter_min_count = 1
+    crawler.filter_nlp_threshold = 0.41
+    crawler.filter_target_count = 30
+    crawler.moderate_candidates = lambda filtered, target_count=30: filtered
+    crawler.generate_meanings = lambda enhanced, posts: [
+        dict(item, meaning='의미', examples=[]) for item in enhanced
+    ]
+    return crawler
+
+
+def test_classify_failure_fails_job_instead_of_saving_empty_result(db):
+    classifier = FailingClassifier()
+    crawler = make_crawler(classifier)
+    manager = make_manager(db, crawler)
+
+    job = manager.run('test')
+    assert job['status'] == 'failed'
+    assert 'model not loaded' in job['error']
+    # 실패한 classify 단계의 빈 결과는 저장되지 않음
+    assert set(job['completed_stages']) == {'fetch', 'tokenize', 'prefilter', 'dictionary'}
+    assert usage_totals(db) == ({}, 0)
+
+    classifier.fail = False
+    manager.resume(job['id'])
+    job = manager.get(job['id'])
+    assert job['status'] == 'succeeded'
+    assert job['result_count'] == 2
+    assert crawler.fetch_calls == 1
+    assert usage_totals(db) == ({'갓생': 5, '점메추': 4}, 2)
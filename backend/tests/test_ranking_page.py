@@ -0,0 +1,70 @@
+"""랭킹 키셋 페이지네이션 / 기간 집계 테스트"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import Database
+
+
+def seed_ties(db, crawl_id=None):
+    """usage_count와 updated_at이 겹치는 단어 30개 (한 번에 저장 → updated_at 동일)"""
+    slangs = [{'word': f'단어{i:02d}', 'meaning': '의미', 'count': 1 + i % 3} for i in range(30)]
+    db.add_slangs_many(slangs, crawl_id=crawl_id)
+    return slangs
+
+
+def collect_pages(db, limit, period=None):
+    words, cursor = [], None
+    while True:
+        page, cursor = db.get_ranking_page(limit=limit, period=period, cursor=cursor,
+                                           fields=['word', 'usage_count'])
+        words.extend(item['word'] for item in page)
+        if cursor is None:
+            return words
+
+
+@pytest.mark.parametrize('limit', [1, 4, 7, 30])
+@pytest.mark.parametrize('crawl_id, period', [(None, None), ('crawl-1', 'week')])
+def test_cursor_pages_have_no_duplicates_or_gaps(db, limit, crawl_id, period):
+    slangs = seed_ties(db, crawl_id)
+    expected = [s['word'] for s in sorted(slangs, key=lambda s: (s['count'], s['word']), reverse=True)]
+
+    words = collect_pages(db, limit, period)
+    assert words == expected
+    assert len(set(words)) == len(words)
+
+
+def seed_period_db(path, with_history):
+    """최근 단어는 크롤링 저장으로, 오래된 단어는 지난 날짜로 직접 기록"""
+    db = Database(str(path))
+    db.add_slangs_many([
+        {'word': '갓생', 'meaning': '의미', 'count': 7, 'gallery_counts': {'a': 4, 'b': 3}},
+        {'word': '점메추', 'meaning': '의미', 'count': 5},
+        {'word': '킹받네', 'meaning': '의미', 'count': 5},
+    ], crawl_id='recent' if with_history else None)
+    conn = db._get_connection()
+    for word, count, days_ago in (('추억의단어', 9, 20), ('옛날단어', 12, 40)):
+        observed_at = datetime.now() - timedelta(days=days_ago)
+        conn.execute('INSERT INTO slangs (word, meaning, usage_count, updated_at) VALUES (?, ?, ?, ?)',
+                     (word, '의미', count, observed_at))
+        if with_history:
+            conn.execute('INSERT INTO slang_usage_daily (bucket, word, count) VALUES (?, ?, ?)',
+                         (observed_at.strftime('%Y-%m-%d'), word, count))
+    conn.commit()
+    return db
+
+
+@pytest.mark.parametrize('period', ['today', 'week', 'month'])
+def test_period_rollup_totals_match_updated_at_filter(tmp_path, period):
+    rollup_db = seed_period_db(tmp_path / 'rollup.db', with_history=True)
+    plain_db = seed_period_db(tmp_path / 'plain.db', with_history=False)
+    assert rollup_db.has_usage_history()
+    assert not plain_db.has_usage_history()
+
+    rollup, _ = rollup_db.get_ranking_page(limit=100, period=period, fields=['word', 'usage_count'])
+    plain, _ = plain_db.get_ranking_page(limit=100, period=period, fields=['word', 'usage_count'])
+    assert rollup == plain
+    expected = {'갓생': 7, '점메추': 5, '킹받네': 5}
+    if period == 'month':
+        expected['추억의단어'] = 9
+    assert {item['word']: item['usage_count'] for item in rollup} == expected
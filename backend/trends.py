@@ -0,0 +1,118 @@
+"""
+신조어 추세 엔진 (급상승/신규 등장 감지)
+크롤링마다 단어별 등장 횟수를 받아 전체 단어의 상태를 NumPy 배열로 한 번에 갱신합니다.
+이력 테이블을 다시 읽지 않고 단어별 상태(EWMA 평균/분산, 버스트 상태 비용)만 유지하므로
+크롤링 1회 비용은 단어 수에 비례합니다.
+
+- z-score: 이번 횟수를 직전까지의 EWMA 기준선과 비교 (크롤링 간격에 따라 가중치 조정)
+- 버스트: Kleinberg식 2상태(기본/버스트) 모델, 포아송 방출 비용으로 온라인 전방 계산
+"""
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+from database import TREND_STATE_COLUMNS
+
+# EWMA 반감기 (시간) - 크롤링 간격이 길수록 새 관측의 가중치가 커짐
+TREND_HALF_LIFE_HOURS = float(os.getenv('TREND_HALF_LIFE_HOURS', '72') or 72)
+# 버스트 상태의 발생률 배수 (기본 상태 대비)
+TREND_BURST_RATIO = float(os.getenv('TREND_BURST_RATIO', '3') or 3)
+# 기본 → 버스트 상태 전환 비용 (클수록 버스트 판정이 보수적)
+TREND_BURST_COST = float(os.getenv('TREND_BURST_COST', '2') or 2)
+# 분산/발생률 하한 (신규 단어의 z-score가 무한대가 되지 않도록)
+TREND_VAR_FLOOR = 1.0
+TREND_RATE_FLOOR = 0.5
+# 가중치 하한 (연속 크롤링에서도 기준선이 조금씩 움직이도록)
+TREND_MIN_ALPHA = 0.05
+
+
+class TrendEngine:
+    """단어별 추세 상태 갱신/조회"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def update(self, counts: Dict[str, int], observed_at: Optional[datetime] = None) -> int:
+        """크롤링 1회의 단어별 등장 횟수로 전체 단어 상태 갱신 (이번에 없는 단어는 0회로 처리)
+
+        Returns:
+            갱신된 단어 수
+        """
+        observed_at = observed_at or datetime.now()
+        now = observed_at.timestamp()
+        state = {row[0]: row for row in self.db.load_trend_state()}
+        counts = {word: int(count) for word, count in counts.items() if word and count and count > 0}
+        words = list(state.keys()) + [word for word in counts if word not in state]
+        if not words:
+            return 0
+        started = time.perf_counter()
+
+        column = {name: i for i, name in enumerate(TREND_STATE_COLUMNS)}
+        known = len(state)
+        existing = list(state.values())
+
+        def existing_array(name: str, dtype=float):
+            values = np.zeros(len(words), dtype=dtype)
+            if known:
+                values[:known] = np.array([row[column[name]] for row in existing], dtype=dtype)
+            return values
+
+        mean = existing_array('ewma_mean')
+        var = existing_array('ewma_var')
+        cost_base = existing_array('cost_base')
+        cost_burst = existing_array('cost_burst')
+        observations = existing_array('observations', dtype=np.int64)
+        updated_at = existing_array('updated_at')
+        # 신규 단어는 기본 상태에서 시작
+        cost_burst[known:] = TREND_BURST_COST
+        updated_at[known:] = now
+        x = np.array([counts.get(word, 0) for word in words], dtype=float)
+
+        # 1. EWMA 기준선 대비 z-score (갱신 전 기준선 사용)
+        z_score = (x - mean) / np.sqrt(var + TREND_VAR_FLOOR)
+        elapsed_hours = np.maximum(now - updated_at, 0) / 3600.0
+        alpha = np.clip(1.0 - np.power(0.5, elapsed_hours / TREND_HALF_LIFE_HOURS), TREND_MIN_ALPHA, 1.0)
+        alpha[known:] = 1.0  # 첫 관측은 그대로 기준선이 됨
+        diff = x - mean
+        new_mean = mean + alpha * diff
+        new_var = (1.0 - alpha) * (var + alpha * diff * diff)
+
+        # 2. 2상태 버스트 모델 (전방 최소 비용, 상수항 log(x!)은 두 상태에 공통이라 생략)
+        rate_base = np.maximum(mean, TREND_RATE_FLOOR)
+        rate_burst = rate_base * TREND_BURST_RATIO
+        emit_base = rate_base - x * np.log(rate_base)
+        emit_burst = rate_burst - x * np.log(rate_burst)
+        next_base = np.minimum(cost_base, cost_burst) + emit_base
+        next_burst = np.minimum(cost_base + TREND_BURST_COST, cost_burst) + emit_burst
+        offset = np.minimum(next_base, next_burst)
+        next_base -= offset
+        next_burst -= offset
+        burst_state = (next_burst < next_base).astype(np.int64)
+        burst_strength = next_base - next_burst
+
+        trend_score = np.maximum(z_score, 0) + np.maximum(burst_strength, 0)
+        observations = observations + (x > 0)
+
+        first_seen_now = observed_at.strftime('%Y-%m-%d %H:%M:%S')
+        rows = []
+        for i, word in enumerate(words):
+            if i < known:
+                first_seen = existing[i][column['first_seen']]
+            else:
+                first_seen = first_seen_now
+            rows.append((
+                word, float(new_mean[i]), float(new_var[i]), float(next_base[i]), float(next_burst[i]),
+                int(x[i]), float(z_score[i]), int(burst_state[i]), float(burst_strength[i]),
+                float(trend_score[i]), int(observations[i]), first_seen, now
+            ))
+        saved = self.db.save_trend_state(rows)
+        print(f"[추세] {saved}개 단어 상태 갱신 (버스트 {int(burst_state.sum())}개, "
+              f"신규 {len(words) - known}개, {time.perf_counter() - started:.3f}초)")
+        return saved
+
+    def trending(self, limit: int = 20) -> list:
+        """급상승 단어 목록"""
+        return self.db.get_trending(limit)
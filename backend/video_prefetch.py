@@ -0,0 +1,145 @@
+"""
+랭킹 단어 영상 미리 가져오기
+크롤링이 끝난 뒤 급상승/신규 단어와 랭킹 상위 단어의 영상을 백그라운드에서 찾아 slang_videos에 저장합니다.
+사용자가 영상 패널을 처음 열 때 YouTube 검색/자막 분석을 기다리지 않고 DB에서 바로 받도록 하기 위함입니다.
+- 영상이 없거나 부족한 단어부터, 그다음 오래된 순으로 갱신
+- 남은 YouTube 할당량이 하한 아래로 내려가면 중단 (사용자 요청용 할당량 보존)
+- 받은 자막에 다른 추적 단어가 나오면 그 단어의 영상으로도 저장
+"""
+import os
+import time
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+# 미리 가져올 단어 수 (급상승 상위 N개 + 랭킹 상위 N개, 중복 제외)
+VIDEO_PREFETCH_TOP_N = int(os.getenv('VIDEO_PREFETCH_TOP_N', '10') or 10)
+# 단어당 저장할 영상 수 (/ranking/videos 기본 limit와 같게)
+VIDEO_PREFETCH_PER_WORD = int(os.getenv('VIDEO_PREFETCH_PER_WORD', '5') or 5)
+# 저장된 영상이 이 시간보다 오래되면 다시 검색
+VIDEO_PREFETCH_MAX_AGE_HOURS = float(os.getenv('VIDEO_PREFETCH_MAX_AGE_HOURS', '72') or 72)
+# 남은 할당량이 이 값 아래면 미리 가져오기 중단
+VIDEO_PREFETCH_QUOTA_FLOOR = int(os.getenv('VIDEO_PREFETCH_QUOTA_FLOOR', '3000') or 3000)
+# 자막에서 함께 찾을 추적 단어 수 (랭킹 상위) / 목록 갱신 주기
+VIDEO_MENTION_TRACK_LIMIT = int(os.getenv('VIDEO_MENTION_TRACK_LIMIT', '500') or 500)
+VIDEO_MENTION_TRACK_TTL = 600
+
+
+class VideoPrefetcher:
+    """급상승/랭킹 상위 단어의 영상 캐시 갱신 (한 번에 하나의 작업만 실행)"""
+
+    def __init__(self, db, youtube_service_factory: Callable, trend_engine=None,
+                 word_filter: Optional[Callable[[str], bool]] = None):
+        self.db = db
+        self._youtube_service_factory = youtube_service_factory
+        self.trend_engine = trend_engine
+        self.word_filter = word_filter
+        self._running = threading.Lock()
+        self.last_run: Optional[Dict] = None
+        self._tracked_words: List[str] = []
+        self._tracked_at = 0.0
+
+    def select_words(self, limit: int = VIDEO_PREFETCH_TOP_N) -> List[str]:
+        """급상승/신규 단어 먼저, 그다음 랭킹 상위 단어"""
+        words = []
+        if self.trend_engine is not None:
+            try:
+                words.extend(item['word'] for item in self.trend_engine.trending(limit))
+            except Exception as e:
+                print(f"[영상 미리 가져오기] 급상승 단어 조회 실패: {e}")
+        words.extend(item['word'] for item in self.db.get_ranking(limit))
+        words = list(dict.fromkeys(words))
+        if self.word_filter is not None:
+            words = [word for word in words if self.word_filter(word)]
+        return words
+
+    def tracked_words(self) -> List[str]:
+        """자막에서 함께 찾을 단어 (랭킹 상위, 몇 분마다 갱신)"""
+        if time.monotonic() - self._tracked_at > VIDEO_MENTION_TRACK_TTL:
+            words = [item['word'] for item in self.db.get_ranking(VIDEO_MENTION_TRACK_LIMIT)]
+            if self.word_filter is not None:
+                words = [word for word in words if self.word_filter(word)]
+            self._tracked_words = words
+            self._tracked_at = time.monotonic()
+        return self._tracked_words
+
+    def find_and_store(self, youtube_service, word: str, max_results: int) -> List[Dict]:
+        """영상 검색 후 저장 (자막에 함께 나온 추적 단어의 영상도 저장)"""
+        mentions: Dict[str, List[Dict]] = {}
+        videos = youtube_service.find_videos_with_slang(word, max_results=max_results,
+                                                        tracked_words=self.tracked_words(),
+                                                        mentions_out=mentions)
+        if videos:
+            self.db.add_slang_videos(word, videos)
+        for other, other_videos in mentions.items():
+            if other != word:
+                self.db.add_slang_videos(other, other_videos)
+        if mentions:
+            print(f"[영상 미리 가져오기] '{word}' 자막에서 다른 단어 {len(mentions)}개 함께 발견")
+        return videos
+
+    def plan(self, words: Iterable[str], now: Optional[datetime] = None) -> List[str]:
+        """갱신이 필요한 단어 (영상 없음/부족 → 오래된 순, 같은 조건이면 입력 순서 유지)"""
+        words = list(dict.fromkeys(words))
+        now = now or datetime.now()
+        stale_before = now - timedelta(hours=VIDEO_PREFETCH_MAX_AGE_HOURS)
+        status = self.db.get_video_cache_status(words)
+        stale = []
+        for order, word in enumerate(words):
+            entry = status.get(word)
+            if entry is None or entry['count'] < VIDEO_PREFETCH_PER_WORD:
+                stale.append((0, datetime.min, order, word))
+            elif entry['refreshed_at'] is None or entry['refreshed_at'] < stale_before:
+                stale.append((1, entry['refreshed_at'] or datetime.min, order, word))
+        stale.sort()
+        return [word for _, _, _, word in stale]
+
+    def run(self, words: Optional[Iterable[str]] = None) -> Optional[Dict]:
+        """미리 가져오기 실행 (이미 실행 중이면 None)"""
+        if not self._running.acquire(blocking=False):
+            return None
+        try:
+            return self._run(words)
+        finally:
+            self._running.release()
+
+    def _run(self, words: Optional[Iterable[str]]) -> Dict:
+        summary = {'started_at': datetime.now().isoformat(), 'planned': 0, 'refreshed': [],
+                   'failed': [], 'skipped_quota': []}
+        youtube_service = self._youtube_service_factory()
+        if youtube_service is None or youtube_service.youtube is None:
+            summary['message'] = "YouTube API 미설정"
+            self.last_run = summary
+            return summary
+
+        targets = self.plan(self.select_words() if words is None else words)
+        summary['planned'] = len(targets)
+        for index, word in enumerate(targets):
+            if youtube_service.quota.remaining() < VIDEO_PREFETCH_QUOTA_FLOOR:
+                summary['skipped_quota'] = targets[index:]
+                print(f"[영상 미리 가져오기] 할당량 부족으로 중단 (남은 단어 {len(targets) - index}개)")
+                break
+            try:
+                videos = self.find_and_store(youtube_service, word, VIDEO_PREFETCH_PER_WORD)
+                if videos:
+                    summary['refreshed'].append(word)
+                else:
+                    summary['failed'].append(word)
+            except Exception as e:
+                print(f"[영상 미리 가져오기] '{word}' 실패: {e}")
+                summary['failed'].append(word)
+
+        summary['finished_at'] = datetime.now().isoformat()
+        self.last_run = summary
+        print(f"[영상 미리 가져오기] 완료: 갱신 {len(summary['refreshed'])}개, 실패 {len(summary['failed'])}개, "
+              f"할당량 부족으로 건너뜀 {len(summary['skipped_quota'])}개")
+        return summary
+
+    def submit(self, words: Optional[Iterable[str]] = None) -> bool:
+        """백그라운드 스레드에서 실행 (이미 실행 중이면 False)"""
+        if self._running.locked():
+            return False
+        words = list(words) if words is not None else None
+        thread = threading.Thread(target=self.run, args=(words,), name="video-prefetch", daemon=True)
+        thread.start()
+        return True
@@ -0,0 +1,44 @@
+"""
+저장된 영상 통계(조회수/좋아요) 일괄 갱신
+slang_videos의 모든 영상 ID를 단어와 무관하게 모아 videos().list로 50개씩 묶어 조회합니다.
+영상 1,000개를 갱신하는 데 20단위만 사용하고, get_videos_for_word의 조회수 정렬이 최신 상태로 유지됩니다.
+"""
+import os
+from datetime import datetime, timedelta
+from typing import Dict
+
+from youtube_service import VIDEO_DETAILS_BATCH_SIZE
+
+# 통계가 이 시간보다 오래된 영상만 갱신 (스케줄러 실행 주기와 같게)
+VIDEO_STATS_REFRESH_HOURS = float(os.getenv('VIDEO_STATS_REFRESH_HOURS', '12') or 12)
+# 한 번에 갱신할 최대 영상 수
+VIDEO_STATS_MAX_VIDEOS = int(os.getenv('VIDEO_STATS_MAX_VIDEOS', '5000') or 5000)
+# 남은 할당량이 이 값 아래면 갱신 중단 (검색용 할당량 보존)
+VIDEO_STATS_QUOTA_FLOOR = int(os.getenv('VIDEO_STATS_QUOTA_FLOOR', '1000') or 1000)
+
+
+def refresh_video_stats(db, youtube_service, max_age_hours: float = VIDEO_STATS_REFRESH_HOURS,
+                        max_videos: int = VIDEO_STATS_MAX_VIDEOS) -> Dict:
+    """오래된 영상 통계 갱신 (오래된 순, 50개씩 묶어 요청)"""
+    summary = {'candidates': 0, 'requests': 0, 'updated_videos': 0, 'updated_rows': 0}
+    if youtube_service is None or youtube_service.youtube is None:
+        summary['message'] = "YouTube API 미설정"
+        return summary
+
+    video_ids = db.get_videos_for_stats_refresh(datetime.now() - timedelta(hours=max_age_hours), max_videos)
+    summary['candidates'] = len(video_ids)
+    for start in range(0, len(video_ids), VIDEO_DETAILS_BATCH_SIZE):
+        batch = video_ids[start:start + VIDEO_DETAILS_BATCH_SIZE]
+        if not youtube_service.quota.can_spend('videos.list', floor=VIDEO_STATS_QUOTA_FLOOR):
+            print(f"[영상 통계] 할당량 부족으로 중단 ({start}/{len(video_ids)}개 갱신)")
+            break
+        details = youtube_service.get_video_details(batch, refresh=True, quota_floor=VIDEO_STATS_QUOTA_FLOOR)
+        summary['requests'] += 1
+        if not details:
+            continue
+        summary['updated_rows'] += db.update_video_stats_many(details, checked_ids=batch)
+        summary['updated_videos'] += len(details)
+
+    print(f"[영상 통계] {summary['updated_videos']}/{summary['candidates']}개 영상 통계 갱신 "
+          f"(요청 {summary['requests']}회, {summary['updated_rows']}개 행)")
+    return summary
@@ -0,0 +1,124 @@
+"""
+YouTube Data API 할당량 관리
+엔드포인트별 단위 비용을 일별(태평양 시간 자정 초기화)로 기록하고,
+남은 할당량으로 요청을 보낼 수 있는지 판단합니다.
+사용량은 cache_store에 저장되어 서버를 다시 시작해도 유지됩니다.
+"""
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+except Exception:
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+# 엔드포인트별 단위 비용 (YouTube Data API v3 기준)
+QUOTA_COSTS = {
+    'search.list': 100,
+    'videos.list': 1,
+    'captions.list': 50,
+    'captions.download': 200,
+}
+QUOTA_NAMESPACE = 'youtube_quota'
+# 날짜별 사용량 보관 기간
+QUOTA_RETENTION_SECONDS = 7 * 86400
+
+# 하루 할당량
+YOUTUBE_DAILY_QUOTA = int(os.getenv('YOUTUBE_DAILY_QUOTA', '10000') or 10000)
+# 남은 할당량이 이 값 아래면 자막 분석(영상당 250단위)을 건너뛰고 검색에만 사용
+YOUTUBE_CAPTION_QUOTA_FLOOR = int(os.getenv('YOUTUBE_CAPTION_QUOTA_FLOOR', '2000') or 2000)
+
+
+class QuotaExceededError(Exception):
+    """남은 할당량이 부족해 요청을 보내지 않음"""
+
+
+class QuotaBudget:
+    """일별 엔드포인트 사용량 기록 / 지출 가능 여부 판단
+
+    사용량은 날짜별 카운터({day}:used, {day}:{endpoint})로 저장소에서 원자적으로 증가시키고,
+    판단할 때마다 저장소에서 다시 읽습니다 (서버와 스케줄러 등 여러 프로세스가 같은 할당량을 나눠 씀).
+    """
+
+    def __init__(self, cache_store, daily_limit: int = YOUTUBE_DAILY_QUOTA,
+                 caption_floor: int = YOUTUBE_CAPTION_QUOTA_FLOOR):
+        self.cache_store = cache_store
+        self.daily_limit = daily_limit
+        self.caption_floor = caption_floor
+
+    @staticmethod
+    def today() -> str:
+        return datetime.now(QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+    def _usage(self, day: str) -> Dict:
+        """저장된 오늘 사용량 (매번 저장소에서 읽음)"""
+        keys = [f'{day}:used', f'{day}:exhausted'] + [f'{day}:{endpoint}' for endpoint in QUOTA_COSTS]
+        stored = self.cache_store.get_many(QUOTA_NAMESPACE, keys)
+        return {
+            'used': int(stored.get(f'{day}:used', 0)),
+            'exhausted': bool(stored.get(f'{day}:exhausted', False)),
+            'endpoints': {
+                endpoint: int(stored[f'{day}:{endpoint}'])
+                for endpoint in QUOTA_COSTS if f'{day}:{endpoint}' in stored
+            },
+        }
+
+    @staticmethod
+    def cost(endpoints: Iterable[str]) -> int:
+        return sum(QUOTA_COSTS[endpoint] for endpoint in endpoints)
+
+    def remaining(self) -> int:
+        usage = self._usage(self.today())
+        if usage['exhausted']:
+            return 0
+        return max(self.daily_limit - usage['used'], 0)
+
+    def can_spend(self, *endpoints: str, floor: int = 0) -> bool:
+        """요청 후에도 floor 이상 남는지"""
+        return self.remaining() - self.cost(endpoints) >= floor
+
+    def can_check_captions(self, videos: int = 1) -> bool:
+        """자막 분석(트랙 목록 + 다운로드)을 videos개 영상에 할 여유가 있는지"""
+        return self.remaining() - videos * self.cost(('captions.list', 'captions.download')) >= self.caption_floor
+
+    def try_spend(self, endpoint: str) -> bool:
+        """할당량이 남아 있으면 차감하고 True (요청 직전에 호출)"""
+        cost = QUOTA_COSTS[endpoint]
+        day = self.today()
+        if self.cache_store.get(QUOTA_NAMESPACE, f'{day}:exhausted'):
+            return False
+        # 하루 합계는 한도를 넘지 않을 때만 증가 (다른 프로세스의 사용량과 함께 원자적으로 판단)
+        if self.cache_store.increment(QUOTA_NAMESPACE, f'{day}:used', cost,
+                                      limit=self.daily_limit, ttl=QUOTA_RETENTION_SECONDS) is None:
+            return False
+        self.cache_store.increment(QUOTA_NAMESPACE, f'{day}:{endpoint}', cost, ttl=QUOTA_RETENTION_SECONDS)
+        return True
+
+    def spend(self, endpoint: str):
+        """차감 (없으면 QuotaExceededError)"""
+        if not self.try_spend(endpoint):
+            raise QuotaExceededError(f"YouTube 할당량 부족 ({endpoint}, 남은 할당량 {self.remaining()})")
+
+    def mark_exhausted(self):
+        """API가 할당량 초과를 알려 오면 오늘은 더 요청하지 않음"""
+        day = self.today()
+        self.cache_store.set(QUOTA_NAMESPACE, f'{day}:exhausted', True, ttl=QUOTA_RETENTION_SECONDS)
+        print(f"[YouTube 할당량] {day} 할당량 소진 - 자정(태평양 시간)까지 캐시만 사용")
+
+    def snapshot(self) -> Dict:
+        """현재 사용량 (지표용)"""
+        day = self.today()
+        usage = self._usage(day)
+        remaining = 0 if usage['exhausted'] else max(self.daily_limit - usage['used'], 0)
+        return {
+            'day': day,
+            'daily_limit': self.daily_limit,
+            'used': usage['used'],
+            'remaining': remaining,
+            'exhausted': usage['exhausted'],
+            'caption_floor': self.caption_floor,
+            'endpoints': usage['endpoints'],
+            'costs': dict(QUOTA_COSTS),
+        }
@@ -4,11 +4,18 @@ YouTube API를 사용한 영상 검색 및 자막 분석 서비스
 import os
 import re
 import json
-import time
-from typing import List, Dict, Optional
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Dict, Optional
 from dotenv import load_dotenv
 
+from cache_store import get_cache_store
+from caption_index import CaptionIndex, SlangMatcher
+from youtube_quota import QuotaBudget, QuotaExceededError
+
 try:
+    import httplib2
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
     YOUTUBE_API_AVAILABLE = True
@@ -21,9 +28,35 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 env_path = os.path.join(current_dir, '.env')
 load_dotenv(env_path)
 
+# API 응답 캐시 네임스페이스 (cache_store)
+YOUTUBE_SEARCH_NAMESPACE = 'youtube_search'
+YOUTUBE_VIDEO_NAMESPACE = 'youtube_videos'
+YOUTUBE_CAPTION_TRACKS_NAMESPACE = 'youtube_caption_tracks'
+YOUTUBE_CAPTION_NAMESPACE = 'youtube_captions'
+YOUTUBE_CAPTION_INDEX_NAMESPACE = 'youtube_caption_index'
+
+# 캐시 유지 시간 (검색 결과는 하루, 조회수 등 통계는 몇 시간, 자막은 거의 바뀌지 않음)
+YOUTUBE_SEARCH_CACHE_HOURS = float(os.getenv('YOUTUBE_SEARCH_CACHE_HOURS', '24') or 24)
+YOUTUBE_VIDEO_CACHE_HOURS = float(os.getenv('YOUTUBE_VIDEO_CACHE_HOURS', '6') or 6)
+YOUTUBE_CAPTION_CACHE_DAYS = float(os.getenv('YOUTUBE_CAPTION_CACHE_DAYS', '30') or 30)
+
+# videos().list 한 번에 조회할 수 있는 최대 영상 수
+VIDEO_DETAILS_BATCH_SIZE = 50
+
+# 자막 동시 다운로드/분석 작업자 수 (동시에 진행 중인 자막 요청 수의 상한)
+CAPTION_FETCH_WORKERS = int(os.getenv('CAPTION_FETCH_WORKERS', '6') or 6)
+caption_executor = ThreadPoolExecutor(max_workers=CAPTION_FETCH_WORKERS, thread_name_prefix='youtube-caption')
+
 class YouTubeService:
-    def __init__(self):
+    def __init__(self, cache_store=None):
         self.api_key = os.getenv('YOUTUBE_API_KEY', '')
+        self.cache_store = cache_store or get_cache_store()
+        self.quota = QuotaBudget(self.cache_store)
+        # httplib2.Http는 스레드 안전하지 않으므로 스레드별로 사용 (클라이언트 객체는 공유)
+        self._local = threading.local()
+        # 추적 단어 집합별 매칭 오토마톤 (같은 단어 목록이면 재사용)
+        self._matchers: Dict[frozenset, SlangMatcher] = {}
+        self._matchers_lock = threading.Lock()
         
         if not YOUTUBE_API_AVAILABLE:
             self.youtube = None
@@ -33,105 +66,126 @@ class YouTubeService:
             print("[YouTube] API key not found. Set YOUTUBE_API_KEY in .env file.")
         else:
             try:
-                self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+                # 디스커버리 문서는 패키지에 포함된 것을 사용 (네트워크/파일 캐시 없이 생성)
+                self.youtube = build('youtube', 'v3', developerKey=self.api_key,
+                                     cache_discovery=False, static_discovery=True)
                 print("[YouTube] API 초기화 성공")
             except Exception as e:
                 self.youtube = None
                 print(f"[YouTube] API 초기화 실패: {e}")
     
+    def _http(self):
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = httplib2.Http(timeout=30)
+        return http
+    
+    def _execute(self, request, endpoint: str):
+        """할당량 차감 후 API 요청 실행 (현재 스레드의 HTTP 연결 사용)"""
+        self.quota.spend(endpoint)
+        try:
+            return request.execute(http=self._http())
+        except HttpError as e:
+            if 'quota' in str(e).lower():
+                self.quota.mark_exhausted()
+            raise
+    
+    @staticmethod
+    def _cache_key(*parts) -> str:
+        raw = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    
+    def _cached_response(self, namespace: str, key: str, request_factory: Callable, ttl: float,
+                         endpoint: str):
+        """캐시된 원본 응답 반환, 없으면 요청 후 저장 (오류 응답은 저장하지 않음)"""
+        cached = self.cache_store.get(namespace, key)
+        if cached is not None:
+            return cached
+        response = self._execute(request_factory(), endpoint)
+        self.cache_store.set(namespace, key, response, ttl=ttl, source='youtube_api')
+        return response
+    
+    def _search(self, **params) -> Dict:
+        """search().list 원본 응답 (같은 파라미터는 캐시에서)"""
+        return self._cached_response(
+            YOUTUBE_SEARCH_NAMESPACE, self._cache_key('search', params),
+            lambda: self.youtube.search().list(**params),
+            YOUTUBE_SEARCH_CACHE_HOURS * 3600, 'search.list'
+        )
+    
+    def _search_videos(self, response: Dict, all_videos: List[Dict], seen_ids: set, max_results: int):
+        """검색 응답을 영상 목록에 추가 (중복 제외)"""
+        for item in response.get('items', []):
+            video_id = item['id']['videoId']
+            if video_id in seen_ids:
+                continue
+            seen_ids.add(video_id)
+            
+            snippet = item['snippet']
+            all_videos.append({
+                'video_id': video_id,
+                'title': snippet['title'],
+                'description': snippet['description'],
+                'thumbnail': snippet['thumbnails']['high']['url'],
+                'channel_title': snippet['channelTitle'],
+                'published_at': snippet['publishedAt']
+            })
+            
+            if len(all_videos) >= max_results:
+                break
+    
     def search_shorts_by_keyword(self, keyword: str, max_results: int = 10) -> List[Dict]:
         """키워드로 YouTube Shorts 영상 검색"""
         if not self.youtube:
             return []
         
         try:
-            # 여러 검색 시도: #shorts 포함 검색 → 일반 검색
-            search_queries = [
-                f'{keyword} #shorts',
-                f'{keyword} 쇼츠',
-                keyword  # 마지막으로 키워드만
+            # 여러 검색 시도: #shorts 포함 검색 → 일반 검색 (Shorts 검색으로 부족할 때만)
+            search_plan = [
+                {'q': f'{keyword} #shorts', 'videoDuration': 'short'},
+                {'q': f'{keyword} 쇼츠', 'videoDuration': 'short'},
+                {'q': keyword, 'videoDuration': 'short'},  # 마지막으로 키워드만
+                {'q': keyword},
             ]
+            for params in search_plan:
+                params.update(part='snippet', type='video', maxResults=max_results * 2, order='relevance')
             
             all_videos = []
             seen_ids = set()
             
-            for query in search_queries:
+            # 1. 캐시에 있는 검색 결과부터 사용 (할당량 0)
+            cached = self.cache_store.get_many(
+                YOUTUBE_SEARCH_NAMESPACE, [self._cache_key('search', params) for params in search_plan]
+            )
+            pending = []
+            for params in search_plan:
+                response = cached.get(self._cache_key('search', params))
+                if response is None:
+                    pending.append(params)
+                elif len(all_videos) < max_results:
+                    self._search_videos(response, all_videos, seen_ids, max_results)
+            
+            # 2. 부족하면 나머지 검색을 우선순위대로 (1회 100단위, 할당량이 남아 있을 때만)
+            for params in pending:
                 if len(all_videos) >= max_results:
                     break
-                    
+                if not self.quota.can_spend('search.list'):
+                    print(f"[YouTube] 할당량 부족 - 캐시된 검색 결과만 사용 ({len(all_videos)}개)")
+                    break
+                if 'videoDuration' not in params:
+                    print(f"[YouTube] Shorts 검색으로 부족 ({len(all_videos)}개), 일반 영상도 검색 시도...")
+                
                 try:
-                    # 먼저 Shorts 검색 시도
-                    request = self.youtube.search().list(
-                        part='snippet',
-                        q=query,
-                        type='video',
-                        videoDuration='short',  # 4분 이하
-                        maxResults=max_results * 2,
-                        order='relevance'
-                    )
-                    
-                    response = request.execute()
-                    
-                    for item in response.get('items', []):
-                        video_id = item['id']['videoId']
-                        if video_id in seen_ids:
-                            continue
-                        seen_ids.add(video_id)
-                        
-                        snippet = item['snippet']
-                        
-                        all_videos.append({
-                            'video_id': video_id,
-                            'title': snippet['title'],
-                            'description': snippet['description'],
-                            'thumbnail': snippet['thumbnails']['high']['url'],
-                            'channel_title': snippet['channelTitle'],
-                            'published_at': snippet['publishedAt']
-                        })
-                        
-                        if len(all_videos) >= max_results:
-                            break
-                    
-                    # Shorts 검색에서 충분히 찾지 못했으면 일반 영상도 검색
-                    if len(all_videos) < max_results and query == search_queries[-1]:
-                        print(f"[YouTube] Shorts 검색으로 부족 ({len(all_videos)}개), 일반 영상도 검색 시도...")
-                        try:
-                            general_request = self.youtube.search().list(
-                                part='snippet',
-                                q=keyword,
-                                type='video',
-                                maxResults=max_results * 2,
-                                order='relevance'
-                            )
-                            general_response = general_request.execute()
-                            
-                            for item in general_response.get('items', []):
-                                video_id = item['id']['videoId']
-                                if video_id in seen_ids:
-                                    continue
-                                seen_ids.add(video_id)
-                                
-                                snippet = item['snippet']
-                                all_videos.append({
-                                    'video_id': video_id,
-                                    'title': snippet['title'],
-                                    'description': snippet['description'],
-                                    'thumbnail': snippet['thumbnails']['high']['url'],
-                                    'channel_title': snippet['channelTitle'],
-                                    'published_at': snippet['publishedAt']
-                                })
-                                
-                                if len(all_videos) >= max_results:
-                                    break
-                        except Exception as e:
-                            print(f"[YouTube] 일반 영상 검색 실패: {e}")
-                            continue
-                            
+                    response = self._search(**params)
+                    self._search_videos(response, all_videos, seen_ids, max_results)
+                except QuotaExceededError as e:
+                    print(f"[YouTube] {e}")
+                    break
                 except HttpError as e:
                     if 'quota' in str(e).lower():
                         print(f"[YouTube] 할당량 초과: {e}")
                         break
-                    print(f"[YouTube] 검색 쿼리 '{query}' 실패: {e}")
+                    print(f"[YouTube] 검색 쿼리 '{params['q']}' 실패: {e}")
                     continue
                 except Exception as e:
                     print(f"[YouTube] 검색 오류: {e}")
@@ -153,24 +207,43 @@ class YouTubeService:
             traceback.print_exc()
             return []
     
-    def get_video_details(self, video_ids: List[str]) -> List[Dict]:
-        """비디오 상세 정보 조회 (조회수, 좋아요 등)"""
+    def get_video_details(self, video_ids: List[str], refresh: bool = False,
+                          quota_floor: int = 0) -> List[Dict]:
+        """비디오 상세 정보 조회 (조회수, 좋아요 등)
+        
+        50개씩 묶어서 요청합니다 (요청당 1단위). refresh=True면 캐시를 건너뛰고 새로 조회하며,
+        남은 할당량이 quota_floor 아래로 내려가면 그때까지 조회한 결과만 반환합니다.
+        """
         if not self.youtube or not video_ids:
             return []
         
         try:
-            # 한 번에 최대 50개까지 조회 가능
-            video_ids_str = ','.join(video_ids[:50])
+            video_ids = list(dict.fromkeys(video_ids))
             
-            request = self.youtube.videos().list(
-                part='statistics,contentDetails',
-                id=video_ids_str
-            )
+            # 영상별 원본 항목 캐시 - 캐시에 없는 영상만 요청
+            items = {} if refresh else self.cache_store.get_many(YOUTUBE_VIDEO_NAMESPACE, video_ids)
+            missing = [video_id for video_id in video_ids if video_id not in items]
             
-            response = request.execute()
+            # 한 번에 최대 50개까지 조회 가능
+            for start in range(0, len(missing), VIDEO_DETAILS_BATCH_SIZE):
+                if not self.quota.can_spend('videos.list', floor=quota_floor):
+                    print(f"[YouTube] 할당량 부족 - 조회한 상세 정보만 사용 ({len(items)}/{len(video_ids)}개)")
+                    break
+                try:
+                    response = self._execute(self.youtube.videos().list(
+                        part='statistics,contentDetails',
+                        id=','.join(missing[start:start + VIDEO_DETAILS_BATCH_SIZE])
+                    ), 'videos.list')
+                except (HttpError, QuotaExceededError) as e:
+                    print(f"[YouTube] 상세 정보 조회 오류: {e}")
+                    break
+                fetched = {item['id']: item for item in response.get('items', [])}
+                self.cache_store.set_many(YOUTUBE_VIDEO_NAMESPACE, fetched,
+                                          ttl=YOUTUBE_VIDEO_CACHE_HOURS * 3600, source='youtube_api')
+                items.update(fetched)
             details = []
             
-            for item in response.get('items', []):
+            for item in (items[video_id] for video_id in video_ids if video_id in items):
                 video_id = item['id']
                 stats = item.get('statistics', {})
                 content = item.get('contentDetails', {})
@@ -187,9 +260,6 @@ class YouTubeService:
             
             return details
         
-        except HttpError as e:
-            print(f"[YouTube] 상세 정보 조회 오류: {e}")
-            return []
         except Exception as e:
             print(f"[YouTube] 상세 정보 조회 실패: {e}")
             return []
@@ -214,17 +284,28 @@ class YouTubeService:
         if not self.youtube:
             return None
         
+        cache_ttl = YOUTUBE_CAPTION_CACHE_DAYS * 86400
+        caption_key = f"{video_id}:{language}"
+        cached = self.cache_store.get(YOUTUBE_CAPTION_NAMESPACE, caption_key)
+        if cached is not None:
+            # 자막이 없거나 접근할 수 없었던 영상도 기록해 두어 다시 요청하지 않음
+            return cached.get('text')
+        
+        # 자막 분석은 영상당 250단위 - 검색에 쓸 할당량을 남겨 두기 위해 여유가 있을 때만
+        if not self.quota.can_check_captions():
+            return None
+        
         try:
             # 1. 자막 트랙 목록 가져오기
-            captions_request = self.youtube.captions().list(
-                part='snippet',
-                videoId=video_id
+            captions_response = self._cached_response(
+                YOUTUBE_CAPTION_TRACKS_NAMESPACE, video_id,
+                lambda: self.youtube.captions().list(part='snippet', videoId=video_id),
+                cache_ttl, 'captions.list'
             )
-            
-            captions_response = captions_request.execute()
             caption_tracks = captions_response.get('items', [])
             
             if not caption_tracks:
+                self.cache_store.set(YOUTUBE_CAPTION_NAMESPACE, caption_key, {'text': None}, ttl=cache_ttl)
                 return None
             
             # 한국어 자막 찾기
@@ -254,22 +335,25 @@ class YouTubeService:
             )
             
             # 자막 내용 다운로드
-            caption_text = download_request.execute()
+            caption_text = self._execute(download_request, 'captions.download')
             
             # 바이트 데이터를 문자열로 변환
             if isinstance(caption_text, bytes):
-                return caption_text.decode('utf-8')
-            elif isinstance(caption_text, str):
-                return caption_text
-            else:
-                return str(caption_text)
+                caption_text = caption_text.decode('utf-8')
+            elif not isinstance(caption_text, str):
+                caption_text = str(caption_text)
+            self.cache_store.set(YOUTUBE_CAPTION_NAMESPACE, caption_key, {'text': caption_text},
+                                 ttl=cache_ttl, source='youtube_api')
+            return caption_text
         
         except HttpError as e:
             if e.resp.status == 404:
                 # 자막이 없음 (정상적인 경우)
+                self.cache_store.set(YOUTUBE_CAPTION_NAMESPACE, caption_key, {'text': None}, ttl=cache_ttl)
                 return None
             elif e.resp.status == 403:
                 print(f"[YouTube] 자막 접근 권한 없음 ({video_id}): {e}")
+                self.cache_store.set(YOUTUBE_CAPTION_NAMESPACE, caption_key, {'text': None}, ttl=cache_ttl)
                 return None
             else:
                 print(f"[YouTube] 자막 다운로드 오류 ({video_id}): {e}")
@@ -280,51 +364,57 @@ class YouTubeService:
     
     def parse_srt(self, srt_text: str) -> List[Dict]:
         """SRT 자막 파일 파싱"""
-        import re
-        
-        # SRT 블록 패턴
-        pattern = re.compile(r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\n(.*?)(?=\n\d+\n|\Z)', re.DOTALL)
-        
-        captions = []
-        for match in pattern.finditer(srt_text):
-            start_time = self._srt_time_to_seconds(match.group(2))
-            end_time = self._srt_time_to_seconds(match.group(3))
-            text = match.group(4).strip().replace('\n', ' ')
-            
-            captions.append({
-                'start': start_time,
-                'end': end_time,
-                'text': text
-            })
-        
-        return captions
+        return CaptionIndex.from_srt(srt_text).to_list()
     
-    def _srt_time_to_seconds(self, time_str: str) -> float:
-        """SRT 시간 형식을 초로 변환 (예: 00:01:30,500 -> 90.5)"""
-        time_part, ms_part = time_str.split(',')
-        h, m, s = map(int, time_part.split(':'))
-        ms = int(ms_part)
-        
-        return h * 3600 + m * 60 + s + ms / 1000.0
+    def get_caption_index(self, video_id: str, language: str = 'ko') -> Optional[CaptionIndex]:
+        """영상 자막 색인 (영상당 한 번 만들어 캐시에 저장)"""
+        key = f"{video_id}:{language}"
+        cached = self.cache_store.get(YOUTUBE_CAPTION_INDEX_NAMESPACE, key)
+        if cached is not None:
+            return CaptionIndex.from_dict(cached)
+        caption_text = self.get_video_captions(video_id, language)
+        if not caption_text:
+            return None
+        index = CaptionIndex.from_srt(caption_text)
+        self.cache_store.set(YOUTUBE_CAPTION_INDEX_NAMESPACE, key, index.to_dict(),
+                             ttl=YOUTUBE_CAPTION_CACHE_DAYS * 86400, source='youtube_api')
+        return index
     
-    def find_slang_in_captions(self, captions: List[Dict], slang_word: str) -> List[float]:
-        """자막에서 신조어가 등장하는 시간 위치 찾기"""
-        match_times = []
-        
-        for caption in captions:
-            text = caption['text']
-            
-            # 대소문자 구분 없이 검색
-            if slang_word.lower() in text.lower():
-                # 해당 자막의 시작 시간 추가
-                match_times.append(caption['start'])
-        
-        return match_times
+    def get_matcher(self, words: Iterable[str]) -> SlangMatcher:
+        """단어 목록의 매칭 오토마톤 (최근 몇 개 목록은 재사용)"""
+        key = frozenset(words)
+        with self._matchers_lock:
+            matcher = self._matchers.get(key)
+            if matcher is None:
+                if len(self._matchers) >= 8:
+                    self._matchers.pop(next(iter(self._matchers)))
+                matcher = self._matchers[key] = SlangMatcher(key)
+            return matcher
     
-    def find_videos_with_slang(self, slang_word: str, max_results: int = 5) -> List[Dict]:
+    def _analyze_video_captions(self, video_id: str, slang_word: str, matcher: SlangMatcher) -> Dict:
+        """자막 색인 + 추적 단어 전체 위치 찾기 (자막 풀에서 실행)"""
+        analysis = {'index': None, 'match_times': [], 'mentions': {}, 'error': None}
+        try:
+            analysis['index'] = self.get_caption_index(video_id)
+        except Exception as e:
+            analysis['error'] = f"다운로드 실패: {e}"
+            return analysis
+        if analysis['index'] is not None:
+            mentions = analysis['index'].find(matcher)
+            analysis['match_times'] = mentions.pop(matcher.words.get(slang_word.lower(), slang_word), [])
+            analysis['mentions'] = mentions
+        return analysis
+    
+    def find_videos_with_slang(self, slang_word: str, max_results: int = 5,
+                               captions_out: Optional[Dict[str, List[Dict]]] = None,
+                               tracked_words: Optional[Iterable[str]] = None,
+                               mentions_out: Optional[Dict[str, List[Dict]]] = None) -> List[Dict]:
         """신조어가 포함된 영상 찾기 (검색 + 자막 분석)
         
         자막이 없는 영상도 포함시키되, 자막에서 단어를 찾은 영상은 우선순위를 높입니다.
+        captions_out을 넘기면 분석한 영상의 파싱된 자막을 담아 줍니다 (영상 ID → 자막 목록).
+        tracked_words를 넘기면 같은 자막에서 다른 추적 단어도 함께 찾아
+        mentions_out에 담아 줍니다 (단어 → match_times가 채워진 영상 목록).
         """
         if not self.youtube:
             print(f"[YouTube] API 미설정 - '{slang_word}' 검색 불가")
@@ -370,55 +460,50 @@ class YouTubeService:
         print(f"[YouTube] 제목 매칭: {len(title_matched_videos)}개, 기타: {len(other_videos)}개")
         
         # 4. 각 영상의 자막 분석 (제목 매칭 영상 우선)
+        if not self.quota.can_check_captions():
+            print(f"[YouTube] 할당량 부족 - 캐시된 자막만 분석 (남은 할당량 {self.quota.remaining()})")
         matched_videos = []  # 자막에서 단어 발견한 영상
         caption_checked_videos = []  # 자막 체크했지만 없는 영상
         
-        # 제목 매칭 영상 먼저 처리
-        for video in title_matched_videos + other_videos:
-            if len(matched_videos) + len(caption_checked_videos) >= max_results * 2:
-                break
+        # 제목 매칭 영상 먼저 처리 - 자막은 풀에서 동시에 받되 결과는 우선순위 순서대로 반영
+        candidates = (title_matched_videos + other_videos)[:max_results * 2]
+        # 검색한 단어 + 추적 단어를 한 오토마톤으로 (자막 한 번 훑기)
+        matcher = self.get_matcher([slang_word, *(tracked_words or ())])
+        futures = {}
+        try:
+            for index, video in enumerate(candidates):
+                # 현재 영상부터 작업자 수만큼 미리 요청 (충분히 찾으면 나머지는 요청하지 않음)
+                for ahead in range(index, min(index + CAPTION_FETCH_WORKERS, len(candidates))):
+                    if ahead not in futures:
+                        futures[ahead] = caption_executor.submit(
+                            self._analyze_video_captions, candidates[ahead]['video_id'], slang_word, matcher
+                        )
+                analysis = futures.pop(index).result()
+                video_id = video['video_id']
                 
-            video_id = video['video_id']
-            
-            # 자막 다운로드 (시도)
-            caption_text = None
-            try:
-                caption_text = self.get_video_captions(video_id)
-            except Exception as e:
-                print(f"[YouTube] 자막 다운로드 실패 ({video_id}): {e}")
-            
-            if caption_text:
-                try:
-                    # SRT 파싱
-                    captions = self.parse_srt(caption_text)
-                    
-                    # 신조어 검색
-                    match_times = self.find_slang_in_captions(captions, slang_word)
-                    
-                    if match_times:
-                        video['match_times'] = match_times
-                        matched_videos.append(video)
-                        print(f"[YouTube] '{slang_word}' 발견 (자막): {video['title']} ({len(match_times)}회)")
-                    else:
-                        # 자막은 있지만 단어가 없는 경우도 포함
-                        video['match_times'] = []
-                        caption_checked_videos.append(video)
-                except Exception as e:
-                    print(f"[YouTube] 자막 파싱 실패 ({video_id}): {e}")
-                    # 파싱 실패해도 영상은 포함
-                    video['match_times'] = []
+                if analysis['error']:
+                    print(f"[YouTube] 자막 {analysis['error']} ({video_id})")
+                if captions_out is not None:
+                    captions_out[video_id] = analysis['index'].to_list() if analysis['index'] is not None else []
+                if mentions_out is not None:
+                    for word, times in analysis['mentions'].items():
+                        mentions_out.setdefault(word, []).append(dict(video, match_times=times))
+                
+                video['match_times'] = analysis['match_times']
+                if analysis['match_times']:
+                    matched_videos.append(video)
+                    print(f"[YouTube] '{slang_word}' 발견 (자막): {video['title']} ({len(analysis['match_times'])}회)")
+                else:
+                    # 자막이 없거나 단어가 없는 영상도 포함 (제목에 단어가 있을 수 있음)
                     caption_checked_videos.append(video)
-            else:
-                # 자막이 없는 영상도 포함 (제목에 단어가 있을 수 있음)
-                video['match_times'] = []
-                caption_checked_videos.append(video)
-            
-            # API 호출 제한을 위한 대기
-            time.sleep(0.1)
-            
-            # 충분한 영상을 찾으면 중단 (자막 매칭 영상 기준)
-            if len(matched_videos) >= max_results:
-                break
+                
+                # 충분한 영상을 찾으면 중단 (자막 매칭 영상 기준)
+                if len(matched_videos) >= max_results:
+                    break
+        finally:
+            # 아직 시작하지 않은 요청은 취소 (이미 진행 중인 요청은 캐시에 저장되고 끝남)
+            for future in futures.values():
+                future.cancel()
         
         # 결과: 자막에서 찾은 영상을 우선으로, 부족하면 제목 매칭 영상, 그 다음 일반 영상
         result = matched_videos[:max_results]
@@ -448,3 +533,16 @@ class YouTubeService:
         print(f"[YouTube] '{slang_word}' 최종 결과: {len(result)}개 영상 (자막 매칭: {len(matched_videos)}개, 제목 매칭: {len(title_matched_videos)}개)")
         return result[:max_results]
 
+
+_default_service = None
+_default_service_lock = threading.Lock()
+
+
+def get_youtube_service() -> YouTubeService:
+    """프로세스 공용 YouTube 서비스 (API 클라이언트를 요청마다 다시 만들지 않음)"""
+    global _default_service
+    if _default_service is None:
+        with _default_service_lock:
+            if _default_service is None:
+                _default_service = YouTubeService()
+    return _default_service
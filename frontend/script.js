@@ -103,11 +103,15 @@ async function runCrawler() {
         
         if (response.ok && data.success) {
             crawlStatus.innerHTML = `<div class="success">✅ ${data.message || '크롤링이 시작되었습니다!'}</div>`;
-            crawlStatus.innerHTML += '<div style="margin-top: 10px; color: #666; font-size: 0.9rem;">크롤링은 백그라운드에서 실행 중입니다. 몇 분 후 랭킹을 새로고침해주세요.</div>';
-            // 상태 메시지는 유지하되, 자동 새로고침은 하지 않음 (사용자가 직접 새로고침)
-            setTimeout(() => {
-                crawlStatus.style.display = 'none';
-            }, 10000); // 10초 후 메시지 숨김
+            if (data.job_id && window.EventSource) {
+                // 진행 상황 스트림 구독 (단계별 표시, 끝나면 랭킹 새로고침)
+                watchCrawlJob(data.job_id, crawlStatus);
+            } else {
+                crawlStatus.innerHTML += '<div style="margin-top: 10px; color: #666; font-size: 0.9rem;">크롤링은 백그라운드에서 실행 중입니다. 몇 분 후 랭킹을 새로고침해주세요.</div>';
+                setTimeout(() => {
+                    crawlStatus.style.display = 'none';
+                }, 10000); // 10초 후 메시지 숨김
+            }
         } else {
             crawlStatus.innerHTML = `<div class="error">❌ 크롤링 시작 실패: ${data.detail || data.message || '알 수 없는 오류'}</div>`;
         }
@@ -120,6 +124,38 @@ async function runCrawler() {
     }
 }
 
+// 크롤링 작업 진행 상황 표시 (SSE)
+function watchCrawlJob(jobId, crawlStatus) {
+    const progress = document.createElement('div');
+    progress.style.cssText = 'margin-top: 10px; color: #666; font-size: 0.9rem;';
+    progress.textContent = '크롤링 대기 중...';
+    crawlStatus.appendChild(progress);
+
+    const source = new EventSource(`${API_BASE_URL}/crawl/${encodeURIComponent(jobId)}/events`);
+    source.addEventListener('progress', (event) => {
+        const job = JSON.parse(event.data);
+        if (job.stage) {
+            progress.textContent = `진행 중 (${job.stage_index}/${job.stage_total}): ${job.message || job.stage}`;
+        }
+    });
+    source.addEventListener('done', (event) => {
+        const job = JSON.parse(event.data);
+        source.close();
+        if (job.status === 'succeeded') {
+            progress.textContent = `완료: ${job.message || ''}`;
+            loadRanking();
+        } else {
+            progress.textContent = `실패: ${job.error || '알 수 없는 오류'}`;
+        }
+        setTimeout(() => {
+            crawlStatus.style.display = 'none';
+        }, 10000);
+    });
+    source.onerror = () => {
+        source.close();
+    };
+}
+
 // 이벤트 리스너 설정
 function setupEventListeners() {
     // 로그아웃 버튼
@@ -267,7 +303,7 @@ async function handleSubscriptionToggle(event) {
 async function loadRanking() {
     try {
         // limit을 크게 설정하여 모든 신조어 가져오기
-        const response = await fetch(`${API_BASE_URL}/ranking?limit=200`);
+        const response = await fetch(`${API_BASE_URL}/ranking?limit=200&fields=word,meaning,usage_count,method`);
         
         // 응답이 JSON인지 확인
         const contentType = response.headers.get('content-type');